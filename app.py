@@ -1,10 +1,15 @@
 """
 Flask application entry point for the Missoula Pro Am Tournament Manager.
 """
+import codecs
+import hashlib
 import os
 import re
 import secrets as _secrets
+import threading
 import time
+from collections import OrderedDict
+from types import MappingProxyType
 
 from flask import (
     Flask,
@@ -26,7 +31,7 @@ from sqlalchemy.engine import Engine
 import config
 import strings as text
 from database import db, init_db
-from services import reference_gate
+from services import json_provider, reference_gate
 from services.background_jobs import configure as configure_jobs
 from services.logging_setup import (
     configure_error_monitoring,
@@ -86,6 +91,94 @@ def _inject_csp_nonce(body: str, nonce: str) -> str:
     body = _STYLE_OPEN_RE.sub(_style, body)
     return body
 
+
+# Translated-page cache for apply_html_post_processing. Keyed by
+# (lang, phrase-map version, blake2b digest of the English body), so a repeat
+# render of the same page costs one hash instead of a full translate pass.
+# Bounded by the total size of the stored translations, not only by entry
+# count: 512 entries of large report pages would otherwise pin hundreds of
+# megabytes per worker. Bodies above the per-body cap are translated but
+# never stored. Neither are pages that embed a CSRF token (the meta tag or a
+# form field): the signed token changes from request to request, so such a
+# body never repeats and storing it would only evict pages that do. Runs
+# BEFORE nonce injection — the nonce differs on every request and would make
+# every body unique.
+_TRANSLATION_CACHE_SIZE = 512
+_TRANSLATION_CACHE_MAX_BYTES = 4 * 1024 * 1024
+_TRANSLATION_CACHE_MAX_BODY_BYTES = 256 * 1024
+_UNCACHEABLE_MARKERS = (b'name="csrf-token"', b'name="csrf_token"')
+_translation_cache: OrderedDict = OrderedDict()
+_translation_cache_bytes = 0
+_translation_cache_lock = threading.Lock()
+
+
+def _body_digest(encoded: bytes) -> bytes:
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _translate_cached(body: str, lang: str, encoded: bytes | None = None,
+                      digest: bytes | None = None) -> str:
+    """Return ``text.translate_html(body, lang)``, memoized by content hash.
+
+    ``encoded``/``digest`` let a caller that already has the UTF-8 body and
+    its _body_digest (the ETag step) skip re-encoding and re-hashing.
+    """
+    global _translation_cache_bytes
+    if encoded is None:
+        encoded = body.encode('utf-8')
+    if (len(encoded) > _TRANSLATION_CACHE_MAX_BODY_BYTES
+            or any(marker in encoded for marker in _UNCACHEABLE_MARKERS)):
+        return text.translate_html(body, lang=lang)
+
+    key = (lang, text.phrase_map_version(), digest or _body_digest(encoded))
+    with _translation_cache_lock:
+        cached = _translation_cache.get(key)
+        if cached is not None:
+            _translation_cache.move_to_end(key)
+            return cached
+
+    translated = text.translate_html(body, lang=lang)
+    with _translation_cache_lock:
+        previous = _translation_cache.pop(key, None)
+        if previous is not None:
+            _translation_cache_bytes -= len(previous)
+        _translation_cache[key] = translated
+        _translation_cache_bytes += len(translated)
+        while (len(_translation_cache) > _TRANSLATION_CACHE_SIZE
+               or _translation_cache_bytes > _TRANSLATION_CACHE_MAX_BYTES):
+            _, evicted = _translation_cache.popitem(last=False)
+            _translation_cache_bytes -= len(evicted)
+    return translated
+
+
+def _clear_translation_cache() -> None:
+    global _translation_cache_bytes
+    with _translation_cache_lock:
+        _translation_cache.clear()
+        _translation_cache_bytes = 0
+
+
+def _stream_post_process(chunks, lang: str | None, nonce: str | None):
+    """Translate and nonce-stamp a streamed HTML body one piece at a time.
+
+    strings.iter_translate_html re-cuts the stream on tag boundaries, so the
+    nonce regex never sees half an open tag. Peak memory is one piece rather
+    than the whole page twice over (bytes + decoded text).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def _decoded():
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b'', final=True)
+
+    for piece in text.iter_translate_html(_decoded(), lang or text.DEFAULT_LANGUAGE):
+        if nonce:
+            piece = _inject_csp_nonce(piece, nonce)
+        if piece:
+            yield piece.encode('utf-8')
+
+
 HAS_FLASK_LOGIN = True
 try:
     from flask_login import LoginManager, current_user
@@ -118,8 +211,11 @@ login_manager.login_view = 'auth.login'
 login_manager.login_message = 'Please log in to continue.'
 login_manager.login_message_category = 'warning'
 
-MANAGEMENT_BLUEPRINTS = {'main', 'registration', 'scheduling', 'scoring', 'reporting', 'proam_relay', 'partnered_axe', 'validation', 'import_pro', 'woodboss', 'demo', 'strathmark', 'domain_conflicts'}
-BLUEPRINT_PERMISSIONS = {
+# Access policy tables. Read-only: the per-endpoint table built in the app
+# factory is derived from these once, so a runtime edit would be silently
+# ignored for every endpoint already classified.
+MANAGEMENT_BLUEPRINTS = frozenset({'main', 'registration', 'scheduling', 'scoring', 'reporting', 'proam_relay', 'partnered_axe', 'validation', 'import_pro', 'woodboss', 'demo', 'strathmark', 'domain_conflicts'})
+BLUEPRINT_PERMISSIONS = MappingProxyType({
     'main': 'is_judge',
     'registration': 'can_register',
     'scheduling': 'can_schedule',
@@ -134,13 +230,76 @@ BLUEPRINT_PERMISSIONS = {
     'strathmark': 'is_judge',
     'domain_conflicts': 'can_manage_users',
     'auth': 'can_manage_users',
-}
+})
 
-PUBLIC_MAIN_ENDPOINTS = {
+PUBLIC_MAIN_ENDPOINTS = frozenset({
     'main.index',
     'main.set_language',
     'main.health',
-}
+})
+
+
+# Language-static slice of the inject_strings context, built once per
+# (language, arapaho_allowed) pair. Everything in it comes from strings.py
+# module constants, so the key space is bounded (languages x 2) and nothing
+# needs invalidating: set_language() changes the key, not the values.
+_CTX_CACHE: dict[tuple[str, bool], dict] = {}
+
+
+def _language_context(lang: str, arapaho_allowed: bool) -> dict:
+    key = (lang, arapaho_allowed)
+    cached = _CTX_CACHE.get(key)
+    if cached is None:
+        # Public languages always available; restricted languages (Arapaho)
+        # only for judge/admin.
+        available_languages = dict(text.PUBLIC_LANGUAGES)
+        if arapaho_allowed:
+            available_languages.update(text.RESTRICTED_LANGUAGES)
+        cached = {
+            'NAV': text.section('NAV', lang),
+            'COMPETITION': text.section('COMPETITION', lang),
+            'LANGUAGES': available_languages,
+            'CURRENT_LANG': lang,
+            'ARAPAHO_ALLOWED': arapaho_allowed,
+            'ui': text.ui,
+        }
+        _CTX_CACHE[key] = cached
+    return cached
+
+
+# Directories this process has already created, so rebuilding the app (the
+# test suite builds dozens) skips the stat/mkdir. Keyed by path rather than a
+# single flag: two apps in one process can point UPLOAD_FOLDER at different
+# directories, and a flag would skip creating the second one.
+_READY_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path in _READY_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _READY_DIRS.add(path)
+
+
+def _endpoint_permission(endpoint: str) -> str | None:
+    """Return the User attribute an endpoint requires, or None if it is open.
+
+    The single statement of the management-route policy. Evaluated once per
+    endpoint when the app is built (see _create_app_inner) so the per-request
+    gate is a dict lookup instead of this chain of prefix tests.
+    """
+    if not HAS_FLASK_LOGIN:
+        return None
+    if endpoint.startswith('static'):
+        return None
+    if endpoint in PUBLIC_MAIN_ENDPOINTS:
+        return None
+    if endpoint.startswith(('auth.', 'portal.', 'api.public_')):
+        return None
+    blueprint_name = endpoint.partition('.')[0]
+    if blueprint_name not in MANAGEMENT_BLUEPRINTS:
+        return None
+    return BLUEPRINT_PERMISSIONS.get(blueprint_name, 'is_judge')
 
 
 def _can_access_arapaho_mode(endpoint: str) -> bool:
@@ -153,6 +312,21 @@ def _can_access_arapaho_mode(endpoint: str) -> bool:
         return False
     return bool(getattr(current_user, 'is_judge', False) or getattr(current_user, 'is_admin', False))
 
+
+def _request_arapaho_allowed() -> bool:
+    """_can_access_arapaho_mode for the current request, evaluated once.
+
+    The language guard and the context processor both ask, and a page that
+    renders several templates runs the context processor for each. Kept on
+    the request rather than g for the reason given at strings._LANG_ATTR.
+    """
+    allowed = getattr(request, '_proam_arapaho_allowed', None)
+    if allowed is None:
+        allowed = _can_access_arapaho_mode(request.endpoint or '')
+        request._proam_arapaho_allowed = allowed
+    return allowed
+
+
 def _print_startup_error_banner(error: BaseException) -> None:
     """Print an impossible-to-miss boxed error banner to stderr.
 
@@ -203,6 +377,18 @@ def _print_startup_error_banner(error: BaseException) -> None:
     print('', file=_sys.stderr, flush=True)
 
 
+# Issued in order on every new SQLite connection. foreign_keys must stay
+# first: it is the correctness setting, the rest are tuning.
+_SQLITE_PRAGMAS = (
+    'PRAGMA foreign_keys=ON',
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=134217728',   # 128 MiB of the file mapped for reads
+    'PRAGMA cache_size=-65536',     # 64 MiB page cache (negative = KiB)
+)
+
+
 @sa_event.listens_for(Engine, 'connect')
 def _set_sqlite_pragma(dbapi_connection, connection_record):
     """Turn on SQLite foreign key enforcement, which is off by default.
@@ -222,11 +408,23 @@ def _set_sqlite_pragma(dbapi_connection, connection_record):
     Found by D14-B phase 2 (c44): it accounted for all 1,758 divergences
     between the SQLite and PostgreSQL runs of the unit suite. Production only
     builds one app, so the bug stayed invisible there.
+
+    The remaining pragmas are throughput settings for the local/show-day
+    SQLite file. WAL lets page reads (the public portal, the sidebar poll)
+    run while a scorer's write is committing instead of queueing behind it,
+    and synchronous=NORMAL is the durable-enough pairing for WAL: a power
+    cut can lose the last commit, never corrupt the file. journal_mode is
+    persistent in the file, so re-issuing it per connection is a no-op after
+    the first; an in-memory database simply answers 'memory'. Because
+    committed pages can now sit in the -wal sidecar, backups never copy the
+    raw .db file; they go through SQLite's backup API
+    (services.backup.snapshot_sqlite).
     """
     if type(dbapi_connection).__module__.split('.')[0] != 'sqlite3':
         return
     cursor = dbapi_connection.cursor()
-    cursor.execute('PRAGMA foreign_keys=ON')
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
     cursor.close()
 
 
@@ -262,7 +460,8 @@ def _create_app_inner():
     configure_logging(bool(app.config.get('STRUCTURED_LOGGING', True)))
     configure_error_monitoring(app.config.get('SENTRY_DSN', ''))
     request_id_middleware(app)
-    configure_jobs(int(app.config.get('JOB_MAX_WORKERS', 2)), app=app)
+    configure_jobs(int(app.config.get('JOB_MAX_WORKERS', 2)), app=app,
+                   redis_url=app.config.get('REDIS_URL') or None)
 
     # Session cookie hardening.  Use direct assignment — Flask pre-seeds
     # these keys with its own defaults (SECURE=False, SAMESITE=None), so
@@ -273,8 +472,11 @@ def _create_app_inner():
     if app.config.get('ENV_NAME') == 'production':
         app.config['SESSION_COOKIE_SECURE'] = True
 
+    # jsonify encodes with orjson. See services/json_provider.py.
+    json_provider.init_app(app)
+
     # Ensure upload folder exists
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    _ensure_dir(app.config['UPLOAD_FOLDER'])
 
     # Initialize database
     init_db(app)
@@ -292,22 +494,22 @@ def _create_app_inner():
         login_manager.session_protection = 'basic'  # type: ignore[assignment]
         login_manager.init_app(app)
 
-        from models.user import User
+        from services import user_cache
+        users = user_cache.init_app(app)
 
         @login_manager.user_loader
         def load_user(user_id: str):
             if not user_id:
                 return None
             try:
-                return db.session.get(User, int(user_id))
+                return users.load(int(user_id))
             except (ValueError, TypeError):
                 return None
 
     # Inject text constants into all templates
     @app.context_processor
     def inject_strings():
-        endpoint = request.endpoint or ''
-        arapaho_allowed = _can_access_arapaho_mode(endpoint)
+        arapaho_allowed = _request_arapaho_allowed()
         lock_until = session.get('arapaho_language_lock_until')
         remaining = 0
         if isinstance(lock_until, (int, float)):
@@ -315,25 +517,24 @@ def _create_app_inner():
 
         # Unscored heat count for sidebar badge — only when inside a tournament route.
         # DB query lives in services/sidebar_aggregator.py so app.py stays free of
-        # ORM logic per CLAUDE.md §6 development rule.
-        from services.sidebar_aggregator import unscored_heats_count
+        # ORM logic per CLAUDE.md §6 development rule. Deferred until a template
+        # actually reads it: most renders with a tournament_id never show the
+        # sidebar (spectator portal, print views).
+        from services.sidebar_aggregator import LazyUnscoredCount
         tid = request.view_args.get('tournament_id') if request.view_args else None
-        unscored_heats = unscored_heats_count(tid) if tid else 0
-
-        # Public languages always available; restricted languages (Arapaho) only for judge/admin.
-        available_languages = dict(text.PUBLIC_LANGUAGES)
-        if arapaho_allowed:
-            available_languages.update(text.RESTRICTED_LANGUAGES)
+        unscored_heats = LazyUnscoredCount(tid) if tid else 0
 
         return {
-            'NAV': text.section('NAV'),
-            'COMPETITION': text.section('COMPETITION'),
-            'LANGUAGES': available_languages,
-            'CURRENT_LANG': text.get_language(),
-            'ARAPAHO_ALLOWED': arapaho_allowed,
+            **_language_context(text.get_language(), arapaho_allowed),
             'ARAPAHO_LOCK_REMAINING': remaining,
-            'ui': text.ui,
             'unscored_heats': unscored_heats,
+            # base.html's <meta name="csrf-token"> feeds fetch() calls on
+            # management pages only. Rendering it signs a token and, for a
+            # first-time visitor, writes a session cookie — pure overhead on
+            # anonymous spectator/portal GETs, whose own forms embed
+            # csrf_token() directly.
+            'CSRF_META_TAG': not HAS_FLASK_LOGIN or bool(
+                getattr(current_user, 'is_authenticated', False)),
             # Cache-bust token for static asset URLs. Uses theme.css mtime so
             # any CSS edit forces every browser to fetch the new file on the
             # next request — without this, deploying a CSS fix only takes
@@ -359,6 +560,11 @@ def _create_app_inner():
 
     app.jinja_env.tests['search'] = _jinja_search
 
+    translate_at_render = bool(app.config.get('TRANSLATE_AT_RENDER'))
+    if translate_at_render:
+        from services.template_translation import TemplateTranslationExtension
+        app.jinja_env.add_extension(TemplateTranslationExtension)
+
     # Register blueprints
     from routes.demo_data import demo_bp
     from routes.domain_conflicts import bp as domain_conflicts_bp
@@ -378,32 +584,43 @@ def _create_app_inner():
         from routes.auth import auth_bp
         from routes.portal import portal_bp
 
-    app.register_blueprint(main_bp)
-    app.register_blueprint(registration_bp, url_prefix='/registration')
-    app.register_blueprint(scheduling_bp, url_prefix='/scheduling')
-    app.register_blueprint(scoring_bp, url_prefix='/scoring')
+    # (blueprint, url_prefix, registration name). One table so the URL layout
+    # reads in one place; None keeps the prefix the blueprint declares.
+    blueprints = [
+        (main_bp, None, None),
+        (registration_bp, '/registration', None),
+        (scheduling_bp, '/scheduling', None),
+        (scoring_bp, '/scoring', None),
+        (reporting_bp, '/reporting', None),
+        (proam_relay_bp, None, None),
+        (partnered_axe_bp, None, None),
+        (validation_bp, None, None),
+        (import_pro_bp, '/import', None),
+        (woodboss_bp, '/woodboss', None),
+        (woodboss_public_bp, '/woodboss', None),
+        (strathmark_bp, '/strathmark', None),
+        (demo_bp, '/demo', None),
+        (domain_conflicts_bp, None, None),
+    ]
+    if HAS_FLASK_LOGIN:
+        blueprints += [
+            (auth_bp, '/auth', None),
+            (portal_bp, '/portal', None),
+            (api_bp, '/api', None),
+            # Also register api_bp at /api/v1/ for forwards-compatible clients (#19)
+            (api_bp, '/api/v1', 'api_v1'),
+        ]
+    for bp, url_prefix, name in blueprints:
+        options = {'name': name} if name else {}
+        app.register_blueprint(bp, url_prefix=url_prefix, **options)
+
     # Exempt the offline replay endpoint from CSRF — it uses a one-time replay token instead.
     csrf.exempt('scoring.replay_offline_score')
     # Phase 4 (V2.8.0) admin scoring repair — JSON-returning POST, no HTML form,
     # admin role gate inside the route.  CSRF exemption matches the existing
     # pattern for replay_offline_score.
     csrf.exempt('scoring.repair_points')
-    app.register_blueprint(reporting_bp, url_prefix='/reporting')
-    app.register_blueprint(proam_relay_bp)
-    app.register_blueprint(partnered_axe_bp)
-    app.register_blueprint(validation_bp)
-    app.register_blueprint(import_pro_bp, url_prefix='/import')
-    app.register_blueprint(woodboss_bp, url_prefix='/woodboss')
-    app.register_blueprint(woodboss_public_bp, url_prefix='/woodboss')
-    app.register_blueprint(strathmark_bp, url_prefix='/strathmark')
-    app.register_blueprint(demo_bp, url_prefix='/demo')
-    app.register_blueprint(domain_conflicts_bp)
     if HAS_FLASK_LOGIN:
-        app.register_blueprint(auth_bp, url_prefix='/auth')
-        app.register_blueprint(portal_bp, url_prefix='/portal')
-        app.register_blueprint(api_bp, url_prefix='/api')
-        # Also register api_bp at /api/v1/ for forwards-compatible clients (#19)
-        app.register_blueprint(api_bp, url_prefix='/api/v1', name='api_v1')
         # Attach rate limiters to the app (no-op if flask-limiter not installed)
         from routes.api import _init_limiter, _init_write_limiter
         _init_limiter(app)
@@ -421,33 +638,30 @@ def _create_app_inner():
         return send_from_directory(static_folder, 'sw.js',
                                    mimetype='application/javascript')
 
+    # Endpoint -> required permission, classified once now that every
+    # blueprint is registered. Endpoints added later (tests register their own
+    # routes) miss the table and are classified on the fly by the same rule.
+    endpoint_policy = {ep: _endpoint_permission(ep) for ep in app.view_functions}
+    app.extensions['endpoint_policy'] = endpoint_policy
+    # Werkzeug compiles the URL matcher lazily on the first bind, which lands
+    # inside whichever request arrives first. Every rule is in the map now, so
+    # pay for the one compile at boot instead.
+    app.url_map.update()
+
     @app.before_request
     def require_judge_for_management_routes():
         """Protect management routes while keeping login and portals available."""
         endpoint = request.endpoint or ''
-        if endpoint.startswith('static'):
-            return None
-        if endpoint in PUBLIC_MAIN_ENDPOINTS:
-            return None
-        if HAS_FLASK_LOGIN:
-            if endpoint.startswith('auth.'):
-                return None
-            if endpoint.startswith('portal.'):
-                return None
-            if endpoint.startswith('api.public_'):
-                return None
-
-        blueprint_name = endpoint.split('.', 1)[0]
-        if blueprint_name not in MANAGEMENT_BLUEPRINTS:
-            return None
-
-        if not HAS_FLASK_LOGIN:
+        if endpoint in endpoint_policy:
+            permission_attr = endpoint_policy[endpoint]
+        else:
+            permission_attr = _endpoint_permission(endpoint)
+        if permission_attr is None:
             return None
 
         if not current_user.is_authenticated:
             return login_manager.unauthorized()
 
-        permission_attr = BLUEPRINT_PERMISSIONS.get(blueprint_name, 'is_judge')
         if not getattr(current_user, permission_attr, False):
             abort(403)
 
@@ -481,8 +695,7 @@ def _create_app_inner():
     @app.before_request
     def enforce_language_access():
         """Force English if a restricted language is active outside Judge/Admin context."""
-        endpoint = request.endpoint or ''
-        if text.get_language() in text.RESTRICTED_LANGUAGES and not _can_access_arapaho_mode(endpoint):
+        if text.get_language() in text.RESTRICTED_LANGUAGES and not _request_arapaho_allowed():
             text.set_language('en')
         return None
 
@@ -492,6 +705,9 @@ def _create_app_inner():
 
         Both transforms need to mutate the response body, so they share a single
         round-trip through response.get_data() / set_data() to keep cost down.
+        The translation step is memoized by body hash (see _translate_cached).
+        Streamed responses skip the round-trip and are rewritten as they are
+        sent (see _stream_post_process).
 
         SECURITY FIX (CSO #7): the CSP nonce injector stamps every inline
         <script> and <style> open tag with the per-request nonce so a strict
@@ -505,21 +721,59 @@ def _create_app_inner():
         if response.status_code < 200 or response.status_code >= 300:
             return response
 
-        body = response.get_data(as_text=True)
-        changed = False
-
         # 1. Full-page translation for any non-default language that has a
         # phrase map (currently Arapaho and Russian). The DEFAULT_LANGUAGE
         # ('en') is the source text — no translation pass needed for it.
+        # Skipped when TRANSLATE_AT_RENDER has the templates translate
+        # themselves (services/template_translation.py).
         active_lang = text.get_language()
-        if active_lang != text.DEFAULT_LANGUAGE and active_lang in text.TRANSLATIONS:
-            translated = text.translate_html(body, lang=active_lang)
+        translate_lang = None
+        if (not translate_at_render and active_lang != text.DEFAULT_LANGUAGE
+                and active_lang in text.TRANSLATIONS):
+            translate_lang = active_lang
+        nonce = getattr(g, 'csp_nonce', None)
+
+        # A streamed body (stream_template, generator views) is transformed
+        # piece by piece instead of being pulled into memory by get_data().
+        if response.is_streamed:
+            response.response = _stream_post_process(
+                response.iter_encoded(), translate_lang, nonce)
+            response.headers.pop('Content-Length', None)
+            return response
+
+        raw = response.get_data()
+        digest = None
+
+        # 0. Conditional GET. The validator is taken from the body as rendered,
+        # before translation and nonce stamping, plus everything that decides
+        # the translated output (language, glossary version). A poller whose
+        # page has not changed gets a 304 without the page being translated.
+        # The 304 drops Content-Security-Policy: the browser keeps the cached
+        # page, whose inline tags carry the nonce of the original response,
+        # and must keep the CSP header that names that nonce. Pages carrying
+        # a per-request CSRF token never match, which is the safe direction.
+        if (request.method in ('GET', 'HEAD') and response.status_code == 200
+                and response.get_etag()[0] is None):
+            digest = _body_digest(raw)
+            response.set_etag(
+                f'{active_lang}-{text.phrase_map_version()}-{digest.hex()}', weak=True)
+            response.make_conditional(request)
+            if response.status_code == 304:
+                response.headers.pop('Content-Security-Policy', None)
+                return response
+
+        body = raw.decode('utf-8')
+        changed = False
+
+        # contains_phrase rejects pages with no translatable term before the
+        # cache pays to encode and hash the whole body.
+        if translate_lang and text.contains_phrase(body, translate_lang):
+            translated = _translate_cached(body, translate_lang, raw, digest)
             if translated != body:
                 body = translated
                 changed = True
 
         # 2. CSP nonce injection (always, when a nonce was generated)
-        nonce = getattr(g, 'csp_nonce', None)
         if nonce:
             new_body = _inject_csp_nonce(body, nonce)
             if new_body != body:
@@ -611,6 +865,17 @@ def _create_app_inner():
 
 
 if __name__ == '__main__':
+    # Direct launch (laptop at the show, Windows dev box). Production runs
+    # gunicorn from the Procfile; tune it there with -w / --threads or
+    # GUNICORN_CMD_ARGS. Here Waitress gives the same thread-pool dispatch
+    # without a Unix-only server, so the judges' tablets and the public
+    # portal are not queued behind one another on a single thread.
     port = int(os.environ.get('PORT', 5000))
     app = create_app()
-    app.run(host='0.0.0.0', port=port, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='0.0.0.0', port=port, debug=False, threaded=True, processes=1)
+    else:
+        serve(app, host='0.0.0.0', port=port,
+              threads=int(os.environ.get('WAITRESS_THREADS', '8')))
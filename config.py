@@ -1,5 +1,6 @@
 """Configuration constants and runtime profiles for the app."""
 import os
+from functools import lru_cache
 
 
 def _project_path(*parts: str) -> str:
@@ -15,6 +16,34 @@ def _normalized_database_url() -> str:
     return url
 
 
+def _engine_options(database_url: str) -> dict:
+    """SQLAlchemy engine options sized for the WSGI worker that owns the pool.
+
+    Every gunicorn worker builds its own engine, so DB_POOL_SIZE and
+    DB_MAX_OVERFLOW are per worker: (workers x (size + overflow)) must stay
+    under the PostgreSQL connection limit. pool_recycle drops connections
+    before Railway's proxy idles them out; pool_pre_ping catches the rest.
+
+    File-backed SQLite gets the same queue pool plus check_same_thread=False
+    (pooled connections are handed between request threads) and a 30 s busy
+    timeout so a second writer waits for the lock instead of failing with
+    "database is locked". In-memory SQLite keeps SQLAlchemy's per-thread
+    singleton pool, which rejects the sizing arguments.
+    """
+    options = {'pool_pre_ping': True}
+    if database_url.startswith('sqlite'):
+        options['connect_args'] = {'check_same_thread': False, 'timeout': 30}
+        if database_url in ('sqlite://', 'sqlite:///:memory:'):
+            return options
+    options.update(
+        pool_size=int(os.environ.get('DB_POOL_SIZE', '10')),
+        max_overflow=int(os.environ.get('DB_MAX_OVERFLOW', '20')),
+        pool_timeout=int(os.environ.get('DB_POOL_TIMEOUT', '30')),
+        pool_recycle=int(os.environ.get('DB_POOL_RECYCLE', '1800')),
+    )
+    return options
+
+
 def _require_secret_key() -> str:
     """Return SECRET_KEY from env, or a random key for local dev.
 
@@ -39,14 +68,21 @@ class BaseConfig:
     SECRET_KEY = _require_secret_key()
     SQLALCHEMY_DATABASE_URI = _normalized_database_url()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {'pool_pre_ping': True}
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', _project_path('uploads'))
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max upload
     STRUCTURED_LOGGING = os.environ.get('STRUCTURED_LOGGING', '1') == '1'
     SENTRY_DSN = os.environ.get('SENTRY_DSN', '').strip()
     JOB_MAX_WORKERS = int(os.environ.get('JOB_MAX_WORKERS', '2'))
+    # Optional RQ queue for background jobs; see services/background_jobs.py.
+    REDIS_URL = os.environ.get('REDIS_URL', '').strip()
     REPORT_CACHE_TTL_SECONDS = int(os.environ.get('REPORT_CACHE_TTL_SECONDS', '60'))
     PUBLIC_CACHE_TTL_SECONDS = int(os.environ.get('PUBLIC_CACHE_TTL_SECONDS', '5'))
+    # Flask-Login user loader snapshot lifetime; 0 disables. See services/user_cache.py.
+    USER_CACHE_TTL_SECONDS = int(os.environ.get('USER_CACHE_TTL_SECONDS', '30'))
+    # Translate pages inside the Jinja pipeline instead of post-processing the
+    # rendered body. See services/template_translation.py.
+    TRANSLATE_AT_RENDER = os.environ.get('TRANSLATE_AT_RENDER', '0') == '1'
     ENABLE_UPLOAD_MALWARE_SCAN = os.environ.get('ENABLE_UPLOAD_MALWARE_SCAN', '0') == '1'
     MALWARE_SCAN_COMMAND = os.environ.get('MALWARE_SCAN_COMMAND', '').strip()
     EVENT_ORDER_CONFIG_PATH = os.environ.get(
@@ -115,12 +151,40 @@ def _is_production_environment() -> bool:
     return False
 
 
-def get_config():
+# Every environment variable get_config() consults, directly or through the
+# helpers above. The resolved profile is memoized on their current values.
+_CONFIG_ENV_KEYS = (
+    'FLASK_ENV', 'TESTING', 'PRODUCTION', 'RAILWAY_ENVIRONMENT', 'DATABASE_URL',
+    'DB_POOL_SIZE', 'DB_MAX_OVERFLOW', 'DB_POOL_TIMEOUT', 'DB_POOL_RECYCLE',
+)
+
+
+@lru_cache(maxsize=8)
+def _resolve_config(env_signature: tuple) -> tuple:
+    """Profile class, database URI and engine options for one env snapshot.
+
+    ``env_signature`` is only the cache key; the helpers read os.environ,
+    which matches it by construction.
+    """
     cfg = ProductionConfig if _is_production_environment() else DevelopmentConfig
+    uri = _normalized_database_url()
+    return cfg, uri, _engine_options(uri)
+
+
+def get_config():
     # Always re-resolve DATABASE_URL at app creation time.
     # BaseConfig.SQLALCHEMY_DATABASE_URI is cached at class-definition time,
     # which can become stale if DATABASE_URL env var changed (e.g. in tests).
-    cfg.SQLALCHEMY_DATABASE_URI = _normalized_database_url()
+    # The memo is keyed on the env values themselves, so a changed variable
+    # still resolves fresh while repeated app builds skip the re-derivation.
+    signature = tuple(os.environ.get(key) for key in _CONFIG_ENV_KEYS)
+    cfg, uri, engine_options = _resolve_config(signature)
+    cfg.SQLALCHEMY_DATABASE_URI = uri
+    # Each app gets its own dict: Flask-SQLAlchemy and tests may mutate it.
+    cfg.SQLALCHEMY_ENGINE_OPTIONS = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in engine_options.items()
+    }
     return cfg
 
 
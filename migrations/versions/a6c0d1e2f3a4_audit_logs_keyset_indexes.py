@@ -0,0 +1,77 @@
+"""Audit log indexes ending in (created_at, id) for keyset paging.
+
+Revision ID: a6c0d1e2f3a4
+Revises: z5b9c0d1e2f3
+Create Date: 2026-10-17
+
+The audit viewer pages newest first on ``(created_at, id)`` and filters by
+entity type or by user. Each read is served by an index whose trailing
+columns are exactly that pair, so a page is a backward range scan that stops
+after one page of rows, with no sort.
+
+``ix_audit_logs_created_id`` on ``(created_at, id)`` serves the unfiltered
+view and replaces ``ix_audit_logs_created_at``, which it leads with.
+
+``ix_audit_logs_actor_created`` on ``(actor_user_id, created_at, id)``
+replaces ``ix_audit_logs_actor`` the same way.
+
+``ix_audit_logs_type_created`` on ``(entity_type, created_at, id)`` serves the
+entity type filter. ``ix_audit_logs_entity_created`` from w2e6f7a8b9c0 has
+``entity_id`` in between, so it can filter by type but not return the rows
+in order; it stays for the per-entity history lookups.
+
+An ascending index scanned backwards gives the DESC order on both SQLite and
+PostgreSQL, so no column is declared DESC.
+"""
+import contextlib
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c0d1e2f3a4'
+down_revision = 'z5b9c0d1e2f3'
+branch_labels = None
+depends_on = None
+
+
+def _index_build():
+    """Build indexes outside the migration transaction on PostgreSQL.
+
+    See w2e6f7a8b9c0: CONCURRENTLY keeps the table writable during the build
+    but cannot run inside a transaction.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return op.get_context().autocommit_block()
+    return contextlib.nullcontext()
+
+
+def upgrade():
+    with _index_build():
+        op.create_index('ix_audit_logs_created_id', 'audit_logs',
+                        ['created_at', 'id'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_created_at', table_name='audit_logs',
+                      postgresql_concurrently=True)
+        op.create_index('ix_audit_logs_actor_created', 'audit_logs',
+                        ['actor_user_id', 'created_at', 'id'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_actor', table_name='audit_logs',
+                      postgresql_concurrently=True)
+        op.create_index('ix_audit_logs_type_created', 'audit_logs',
+                        ['entity_type', 'created_at', 'id'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    with _index_build():
+        op.drop_index('ix_audit_logs_type_created', table_name='audit_logs',
+                      postgresql_concurrently=True)
+        op.create_index('ix_audit_logs_actor', 'audit_logs', ['actor_user_id'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_actor_created', table_name='audit_logs',
+                      postgresql_concurrently=True)
+        op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_created_id', table_name='audit_logs',
+                      postgresql_concurrently=True)
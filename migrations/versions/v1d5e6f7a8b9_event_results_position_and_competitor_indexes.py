@@ -0,0 +1,56 @@
+"""Index event_results for leaderboards and per-competitor lookups.
+
+Revision ID: v1d5e6f7a8b9
+Revises: u0c4d5e6f7a8
+Create Date: 2026-10-17
+
+``ix_event_results_event_position`` on ``(event_id, final_position)`` serves
+``Event.get_results_sorted`` and the standings pages, which read one event's
+results in finishing order. ``ix_event_results_event_status`` narrows to the
+event but leaves the sort to the planner.
+
+``ix_event_results_competitor`` on ``(competitor_type, competitor_id)`` serves
+the competitor detail page, the portal's My Results and the scratch cascade,
+which ask for every result one competitor holds. The unique constraint leads with
+``event_id`` and cannot answer that without scanning the table.
+"""
+import contextlib
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'v1d5e6f7a8b9'
+down_revision = 'u0c4d5e6f7a8'
+branch_labels = None
+depends_on = None
+
+
+def _index_build():
+    """Build indexes outside the migration transaction on PostgreSQL.
+
+    A plain CREATE INDEX holds a lock that blocks writes to the table for the
+    whole build; CONCURRENTLY does not, but PostgreSQL refuses to run it inside
+    a transaction. SQLite builds indexes in place and needs neither.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return op.get_context().autocommit_block()
+    return contextlib.nullcontext()
+
+
+def upgrade():
+    with _index_build():
+        op.create_index('ix_event_results_event_position', 'event_results',
+                        ['event_id', 'final_position'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('ix_event_results_competitor', 'event_results',
+                        ['competitor_type', 'competitor_id'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    with _index_build():
+        op.drop_index('ix_event_results_competitor', table_name='event_results',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_event_results_event_position', table_name='event_results',
+                      postgresql_concurrently=True)
@@ -0,0 +1,63 @@
+"""Composite indexes on audit_logs for the newest-first readers.
+
+Revision ID: w2e6f7a8b9c0
+Revises: v1d5e6f7a8b9
+Create Date: 2026-10-17
+
+Every reader of this table asks for the newest rows matching an equality
+filter, and each single-column index answered only half of that: the planner
+either walked ``ix_audit_logs_created_at`` backwards filtering every row, or
+fetched all matches by ``action`` and sorted them.
+
+``ix_audit_logs_entity_created`` on ``(entity_type, entity_id, created_at)``
+serves the gear history on the pro competitor page and any "last N entries for
+this row" lookup.
+
+``ix_audit_logs_action_created`` on ``(action, created_at)`` serves the live
+scratch feed and the scratch-undo lookups. It leads with ``action``, so it
+answers everything ``ix_audit_logs_action`` did, and that index is dropped.
+"""
+import contextlib
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'w2e6f7a8b9c0'
+down_revision = 'v1d5e6f7a8b9'
+branch_labels = None
+depends_on = None
+
+
+def _index_build():
+    """Build indexes outside the migration transaction on PostgreSQL.
+
+    A plain CREATE INDEX holds a lock that blocks writes to the table for the
+    whole build; CONCURRENTLY does not, but PostgreSQL refuses to run it inside
+    a transaction. SQLite builds indexes in place and needs neither.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return op.get_context().autocommit_block()
+    return contextlib.nullcontext()
+
+
+def upgrade():
+    with _index_build():
+        op.create_index('ix_audit_logs_entity_created', 'audit_logs',
+                        ['entity_type', 'entity_id', 'created_at'], unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('ix_audit_logs_action_created', 'audit_logs',
+                        ['action', 'created_at'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_action', table_name='audit_logs',
+                      postgresql_concurrently=True)
+
+
+def downgrade():
+    with _index_build():
+        op.create_index('ix_audit_logs_action', 'audit_logs', ['action'], unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_action_created', table_name='audit_logs',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_audit_logs_entity_created', table_name='audit_logs',
+                      postgresql_concurrently=True)
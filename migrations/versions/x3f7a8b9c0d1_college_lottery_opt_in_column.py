@@ -0,0 +1,96 @@
+"""Move the college Pro-Am Relay lottery opt-in out of the partners JSON.
+
+Revision ID: x3f7a8b9c0d1
+Revises: w2e6f7a8b9c0
+Create Date: 2026-10-17
+
+``CollegeCompetitor.pro_am_lottery_opt_in`` was a property over a marker key,
+``__pro_am_lottery_opt_in__``, inside the ``partners`` JSON. Every read parsed
+the blob, the lottery pool could not be filtered in SQL, and any writer that
+replaced ``partners`` wholesale silently dropped the opt-in with it.
+``pro_competitors`` has had a real Boolean for this since the initial schema;
+this gives ``college_competitors`` the same column.
+
+Backfill
+========
+The marker is read in Python, not SQL, because the JSON functions differ
+between SQLite and PostgreSQL (see t9b3c4d5e6f7). The LIKE only narrows the
+scan; every candidate row is parsed. The old property accepted
+``true``/``1``/``yes``/``y``/``x`` in any case and that is kept here. The
+marker is removed from ``partners`` so the event-keyed mapping holds only
+partners again.
+
+Downgrade
+=========
+Writes the marker back into ``partners`` for every opted-in row and drops the
+column, which is the exact shape the previous code reads.
+"""
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'x3f7a8b9c0d1'
+down_revision = 'w2e6f7a8b9c0'
+branch_labels = None
+depends_on = None
+
+
+META_KEY = '__pro_am_lottery_opt_in__'
+TRUTHY = {'true', '1', 'yes', 'y', 'x'}
+
+
+def _parse_partners(raw):
+    if not raw:
+        return {}
+    try:
+        value = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _backfill(connection):
+    """Copy each marker into the column and strip it from ``partners``."""
+    rows = connection.execute(
+        sa.text("SELECT id, partners FROM college_competitors WHERE partners LIKE :marker"),
+        {'marker': f'%{META_KEY}%'},
+    ).fetchall()
+
+    opted_in = 0
+    for competitor_id, raw in rows:
+        partners = _parse_partners(raw)
+        if META_KEY not in partners:
+            continue
+        flag = str(partners.pop(META_KEY)).strip().lower() in TRUTHY
+        opted_in += flag
+        connection.execute(
+            sa.text("UPDATE college_competitors SET pro_am_lottery_opt_in = :flag, "
+                    "partners = :partners WHERE id = :id"),
+            {'flag': flag, 'partners': json.dumps(partners), 'id': competitor_id},
+        )
+    return opted_in
+
+
+def upgrade():
+    op.add_column('college_competitors',
+                  sa.Column('pro_am_lottery_opt_in', sa.Boolean(), nullable=False,
+                            server_default=sa.false()))
+    opted_in = _backfill(op.get_bind())
+    print(f'x3f7a8b9c0d1: {opted_in} college competitor(s) opted into the relay lottery')
+
+
+def downgrade():
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT id, partners FROM college_competitors WHERE pro_am_lottery_opt_in = true"
+    )).fetchall()
+    for competitor_id, raw in rows:
+        partners = _parse_partners(raw)
+        partners[META_KEY] = 'true'
+        connection.execute(
+            sa.text("UPDATE college_competitors SET partners = :partners WHERE id = :id"),
+            {'partners': json.dumps(partners), 'id': competitor_id},
+        )
+
+    op.drop_column('college_competitors', 'pro_am_lottery_opt_in')
@@ -0,0 +1,59 @@
+"""Composite indexes for the standings readers.
+
+Revision ID: y4a8b9c0d1e2
+Revises: x3f7a8b9c0d1
+Create Date: 2026-10-17
+
+Bull/Belle of the Woods, the college dashboard and the public standings API
+all ask for one tournament's active competitors of one gender, highest
+``individual_points`` first, and only ever the top few. ``college_competitors``
+had no index beyond ``strathmark_id``, so each of those reads scanned the
+table and sorted every row before the LIMIT applied.
+
+``ix_college_competitors_standings`` on
+``(tournament_id, gender, status, individual_points)`` narrows the read to the
+matching rows and hands them over in points order; the placement-count
+tiebreak only has to reorder rows that share a points total.
+
+``ix_teams_tournament_status_points`` on
+``(tournament_id, status, total_points)`` does the same for team standings.
+"""
+import contextlib
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'y4a8b9c0d1e2'
+down_revision = 'x3f7a8b9c0d1'
+branch_labels = None
+depends_on = None
+
+
+def _index_build():
+    """Build indexes outside the migration transaction on PostgreSQL.
+
+    See w2e6f7a8b9c0: CONCURRENTLY keeps the tables writable during the
+    build but cannot run inside a transaction.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return op.get_context().autocommit_block()
+    return contextlib.nullcontext()
+
+
+def upgrade():
+    with _index_build():
+        op.create_index('ix_college_competitors_standings', 'college_competitors',
+                        ['tournament_id', 'gender', 'status', 'individual_points'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index('ix_teams_tournament_status_points', 'teams',
+                        ['tournament_id', 'status', 'total_points'],
+                        unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with _index_build():
+        op.drop_index('ix_teams_tournament_status_points', table_name='teams',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_college_competitors_standings', table_name='college_competitors',
+                      postgresql_concurrently=True)
@@ -0,0 +1,66 @@
+"""Ordered indexes for the team standings and pro earnings leaderboards.
+
+Revision ID: z5b9c0d1e2f3
+Revises: y4a8b9c0d1e2
+Create Date: 2026-10-17
+
+The standings poll, the public standings API and the dashboards ask for one
+tournament's active teams by ``total_points DESC, team_code`` and its active
+pros by ``total_earnings DESC, name``, usually with a LIMIT. An index whose
+trailing columns match that order exactly lets the planner read the first N
+entries and stop, with no sort step.
+
+``ix_teams_standings`` on ``(tournament_id, status, total_points DESC,
+team_code)`` replaces ``ix_teams_tournament_status_points`` from
+y4a8b9c0d1e2: a backward scan of that one returned ties in descending
+``team_code`` order, so the planner still had to sort them.
+
+``ix_pro_competitors_earnings`` on ``(tournament_id, status,
+total_earnings DESC, name)`` is new; ``pro_competitors`` had no index for
+this read.
+"""
+import contextlib
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'z5b9c0d1e2f3'
+down_revision = 'y4a8b9c0d1e2'
+branch_labels = None
+depends_on = None
+
+
+def _index_build():
+    """Build indexes outside the migration transaction on PostgreSQL.
+
+    See w2e6f7a8b9c0: CONCURRENTLY keeps the tables writable during the
+    build but cannot run inside a transaction.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return op.get_context().autocommit_block()
+    return contextlib.nullcontext()
+
+
+def upgrade():
+    with _index_build():
+        op.create_index('ix_teams_standings', 'teams',
+                        ['tournament_id', 'status', sa.text('total_points DESC'), 'team_code'],
+                        unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_teams_tournament_status_points', table_name='teams',
+                      postgresql_concurrently=True)
+        op.create_index('ix_pro_competitors_earnings', 'pro_competitors',
+                        ['tournament_id', 'status', sa.text('total_earnings DESC'), 'name'],
+                        unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with _index_build():
+        op.drop_index('ix_pro_competitors_earnings', table_name='pro_competitors',
+                      postgresql_concurrently=True)
+        op.create_index('ix_teams_tournament_status_points', 'teams',
+                        ['tournament_id', 'status', 'total_points'],
+                        unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_teams_standings', table_name='teams',
+                      postgresql_concurrently=True)
@@ -0,0 +1,101 @@
+"""JSON codec for the Text columns that hold JSON documents.
+
+The competitor entry columns (events_entered, partners, entry_fees, ...) and
+Event.payouts are parsed and re-serialized in tight loops: fee summaries, heat
+generation, partner resolution. orjson does both several times faster than the
+stdlib module. Without it installed the stdlib is used and nothing else changes.
+
+loads
+    Accepts ``str`` and raises ``JSONDecodeError`` on bad input, under either
+    backend (orjson's error subclasses the stdlib one).
+
+dumps
+    Returns ``str``, because the columns are Text.  Non-string dict keys are
+    stringified as ``json.dumps`` would; orjson refuses them by default.
+    orjson writes no spaces after separators, so a value rewritten by this
+    codec is not byte-identical to the stdlib's output.  Readers only ever
+    parse these columns, never compare them as text.
+
+JSONColumns
+    Model mixin that memoizes the parsed value of each column per instance.
+"""
+import copy
+import json
+import logging
+
+JSONDecodeError = json.JSONDecodeError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _orjson = None
+
+
+if _orjson is not None:
+    _DUMPS_OPTIONS = _orjson.OPT_NON_STR_KEYS
+
+    def loads(raw: str):
+        return _orjson.loads(raw)
+
+    def dumps(value) -> str:
+        return _orjson.dumps(value, option=_DUMPS_OPTIONS).decode('utf-8')
+else:
+    loads = json.loads
+    dumps = json.dumps
+
+
+class JSONColumns:
+    """Parse-once access to a model's JSON Text columns.
+
+    Mixed into both competitor models and Event. Heat generation, fee
+    summaries, the partner resolver and payout awarding call the getters many
+    times per row per request, and each call used to run json.loads on the
+    same text. The last parse of each column is kept in the
+    instance __dict__ next to the exact text it came from, and reused while
+    the column still holds that text. Many services assign the columns
+    directly (``comp.partners = json.dumps(...)``); a changed string simply
+    misses and is parsed again, so no write path has to know about the memo.
+
+    Getters hand out a shallow copy, so a caller that edits the result
+    without saving it cannot change what the next caller sees. The values
+    are plain strings, numbers and booleans, so shallow is enough.
+    """
+
+    def _json_value(self, column: str, empty: str):
+        """Return the shared parsed value of ``column``. Do not mutate it."""
+        raw = getattr(self, column) or empty
+        memo = self.__dict__.setdefault('_json_memo', {})
+        hit = memo.get(column)
+        if hit is None or hit[0] != raw:
+            try:
+                value = loads(raw)
+            except JSONDecodeError:
+                logger.warning('%s id=%s: corrupt %s JSON; returning %s',
+                               type(self).__name__, self.id, column, empty)
+                value = loads(empty)
+            hit = memo[column] = (raw, value)
+        return hit[1]
+
+    def _load_json(self, column: str, empty: str):
+        return copy.copy(self._json_value(column, empty))
+
+    def _store_json(self, column: str, value) -> None:
+        self._commit_json(column, copy.copy(value))
+
+    def _set_json_key(self, column: str, key, value) -> None:
+        """Set one key of a dict column: one copy and one dump per call.
+
+        Importers call the per-event setters in a loop, so this skips the
+        second copy ``_store_json`` makes of a caller-owned value.
+        """
+        mapping = dict(self._json_value(column, '{}'))
+        mapping[str(key)] = value
+        self._commit_json(column, mapping)
+
+    def _commit_json(self, column: str, value) -> None:
+        # ``value`` must not be reachable by any caller from here on.
+        raw = dumps(value)
+        setattr(self, column, raw)
+        self.__dict__.setdefault('_json_memo', {})[column] = (raw, value)
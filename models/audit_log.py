@@ -9,9 +9,12 @@ class AuditLog(db.Model):
 
     __tablename__ = 'audit_logs'
     __table_args__ = (
-        db.Index('ix_audit_logs_created_at', 'created_at'),
-        db.Index('ix_audit_logs_actor', 'actor_user_id'),
-        db.Index('ix_audit_logs_action', 'action'),
+        # The viewer pages on (created_at, id); see a6c0d1e2f3a4.
+        db.Index('ix_audit_logs_created_id', 'created_at', 'id'),
+        db.Index('ix_audit_logs_actor_created', 'actor_user_id', 'created_at', 'id'),
+        db.Index('ix_audit_logs_type_created', 'entity_type', 'created_at', 'id'),
+        db.Index('ix_audit_logs_action_created', 'action', 'created_at'),
+        db.Index('ix_audit_logs_entity_created', 'entity_type', 'entity_id', 'created_at'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -1,9 +1,6 @@
 """
 Competitor models for both college and professional competitors.
 """
-import json
-import logging
-
 import sqlalchemy as sa
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import validates
@@ -11,13 +8,19 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 from database import db
 
+from . import _json
 from ._types import BIG_ID
 from .competitor_identity import attach_identity_allocator
 
-logger = logging.getLogger(__name__)
-
 MAX_NAME_LENGTH = 100  # Hard cap; String(200) column has room but UI breaks above ~100 chars
 
+# Portal PINs are 4-6 digits, so the search space, not the hash cost, is what
+# an attacker is up against; the login routes are rate-limited for that.
+# Werkzeug's default (600k pbkdf2 rounds) spends ~100ms of CPU per captain
+# login and per PIN issued during setup for no real gain.  Hashes stored under
+# the old default still verify: the method is read back from the hash itself.
+PIN_HASH_METHOD = 'pbkdf2:sha256:50000'
+
 # Contact fields live on the identity spine (models/competitor_identity.py) as of
 # migration q6e7f8a0b2c3.  Both competitor models reach them through
 # association_proxy rather than re-declaring columns.
@@ -46,7 +49,7 @@ MAX_NAME_LENGTH = 100  # Hard cap; String(200) column has room but UI breaks abo
 # wanted, and there are exactly two callers that had to be taught to flush first.
 
 
-class CollegeCompetitor(db.Model):
+class CollegeCompetitor(_json.JSONColumns, db.Model):
     """Represents a college competitor."""
 
     __tablename__ = 'college_competitors'
@@ -54,6 +57,10 @@ class CollegeCompetitor(db.Model):
         db.CheckConstraint("gender IN ('M', 'F')", name='ck_college_competitors_gender_valid'),
         db.CheckConstraint("status IN ('active', 'scratched')", name='ck_college_competitors_status_valid'),
         db.CheckConstraint('individual_points >= 0', name='ck_college_competitors_points_nonnegative'),
+        # Bull/Belle and the standings pages: one tournament, gender and
+        # status, highest points first.
+        db.Index('ix_college_competitors_standings',
+                 'tournament_id', 'gender', 'status', 'individual_points'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -83,6 +90,12 @@ class CollegeCompetitor(db.Model):
     gear_sharing = db.Column(db.Text, nullable=False, default='{}')  # Dict: event_id -> partner sharing gear
     portal_pin_hash = db.Column(db.String(255), nullable=True)
 
+    # Pro-Am Relay lottery opt-in.  Lived as a marker key inside `partners`
+    # until migration x3f7a8b9c0d1; now a column, as on ProCompetitor.
+    pro_am_lottery_opt_in = db.Column(
+        db.Boolean, nullable=False, default=False, server_default=sa.false()
+    )
+
     # Headshot (#14).  SMS opt-in (#2) moved to the identity spine.
     headshot_filename = db.Column(db.Text, nullable=True)
 
@@ -123,8 +136,6 @@ class CollegeCompetitor(db.Model):
     email = association_proxy('identity', 'email')
     phone_opted_in = association_proxy('identity', 'phone_opted_in')
 
-    _PRO_AM_LOTTERY_META_KEY = '__pro_am_lottery_opt_in__'
-
     @property
     def display_name(self):
         """Name with team designator, e.g. 'Alex Kaper (UM-A)'.
@@ -143,11 +154,18 @@ class CollegeCompetitor(db.Model):
         return self.name
 
     def __repr__(self):
-        try:
-            team_code = self.team.team_code if self.team else "no team"
-        except Exception:
-            team_code = "detached"
-        return f'<CollegeCompetitor {self.name} ({team_code})>'
+        # Reads only what is already loaded.  A repr runs inside debuggers, log
+        # lines and pytest diffs, and must not lazy-load (one SELECT per row
+        # in a list) or raise on a detached instance.
+        loaded = self.__dict__
+        team = loaded.get('team')
+        if team is not None:
+            team_code = team.__dict__.get('team_code', 'team expired')
+        elif 'team' in loaded:
+            team_code = 'no team'
+        else:
+            team_code = 'team not loaded'
+        return f"<CollegeCompetitor {loaded.get('name', '?')} ({team_code})>"
 
     @validates('name')
     def validate_name(self, key, value):
@@ -157,60 +175,27 @@ class CollegeCompetitor(db.Model):
 
     def get_events_entered(self):
         """Return list of event IDs this competitor is entered in."""
-        try:
-            return json.loads(self.events_entered or '[]')
-        except json.JSONDecodeError:
-            logger.warning('CollegeCompetitor id=%s: corrupt events_entered JSON; returning []', self.id)
-            return []
+        return self._load_json('events_entered', '[]')
 
     def set_events_entered(self, events):
         """Set the list of event IDs."""
-        self.events_entered = json.dumps(events)
+        self._store_json('events_entered', events)
 
     def get_partners(self):
         """Return dict of event_id -> partner_name."""
-        try:
-            return json.loads(self.partners or '{}')
-        except json.JSONDecodeError:
-            logger.warning('CollegeCompetitor id=%s: corrupt partners JSON; returning {}', self.id)
-            return {}
+        return self._load_json('partners', '{}')
 
     def set_partner(self, event_id, partner_name):
         """Set partner for a specific event."""
-        partners = self.get_partners()
-        partners[str(event_id)] = partner_name
-        self.partners = json.dumps(partners)
-
-    @property
-    def pro_am_lottery_opt_in(self) -> bool:
-        """Return whether this college competitor opted into the Pro-Am relay lottery."""
-        partners = self.get_partners()
-        value = str(partners.get(self._PRO_AM_LOTTERY_META_KEY, '')).strip().lower()
-        return value in {'true', '1', 'yes', 'y', 'x'}
-
-    @pro_am_lottery_opt_in.setter
-    def pro_am_lottery_opt_in(self, opted_in: bool):
-        """Persist Pro-Am relay lottery preference in the partners metadata payload."""
-        partners = self.get_partners()
-        if opted_in:
-            partners[self._PRO_AM_LOTTERY_META_KEY] = 'true'
-        else:
-            partners.pop(self._PRO_AM_LOTTERY_META_KEY, None)
-        self.partners = json.dumps(partners)
+        self._set_json_key('partners', event_id, partner_name)
 
     def get_gear_sharing(self):
         """Return dict of event_id -> partner sharing gear."""
-        try:
-            return json.loads(self.gear_sharing or '{}')
-        except json.JSONDecodeError:
-            logger.warning('CollegeCompetitor id=%s: corrupt gear_sharing JSON; returning {}', self.id)
-            return {}
+        return self._load_json('gear_sharing', '{}')
 
     def set_gear_sharing(self, event_id, partner_name):
         """Set gear sharing partner for a specific event."""
-        sharing = self.get_gear_sharing()
-        sharing[str(event_id)] = partner_name
-        self.gear_sharing = json.dumps(sharing)
+        self._set_json_key('gear_sharing', event_id, partner_name)
 
     def add_points(self, points):
         """Add points to individual total and update team total."""
@@ -258,7 +243,7 @@ class CollegeCompetitor(db.Model):
         return bool(self.portal_pin_hash)
 
     def set_portal_pin(self, pin: str):
-        self.portal_pin_hash = generate_password_hash(pin)
+        self.portal_pin_hash = generate_password_hash(pin, method=PIN_HASH_METHOD)
 
     def check_portal_pin(self, pin: str) -> bool:
         if not self.portal_pin_hash:
@@ -266,7 +251,7 @@ class CollegeCompetitor(db.Model):
         return check_password_hash(self.portal_pin_hash, pin)
 
 
-class ProCompetitor(db.Model):
+class ProCompetitor(_json.JSONColumns, db.Model):
     """Represents a professional competitor."""
 
     __tablename__ = 'pro_competitors'
@@ -275,6 +260,9 @@ class ProCompetitor(db.Model):
         db.CheckConstraint("status IN ('active', 'scratched')", name='ck_pro_competitors_status_valid'),
         db.CheckConstraint('total_earnings >= 0', name='ck_pro_competitors_earnings_nonnegative'),
         db.CheckConstraint('total_fees >= 0', name='ck_pro_competitors_total_fees_nonnegative'),
+        # Pro earnings leaderboards: total_earnings DESC then name.
+        db.Index('ix_pro_competitors_earnings', 'tournament_id', 'status',
+                 sa.text('total_earnings DESC'), 'name'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -320,12 +308,20 @@ class ProCompetitor(db.Model):
     # Status
     status = db.Column(db.String(20), nullable=False, default='active')  # active, scratched
 
-    # Import tracking (populated by Google Forms xlsx importer)
+    # Import tracking (populated by Google Forms xlsx importer).
+    # The free-text form answers are deferred: roster, heat and scoring
+    # queries leave them out of the SELECT, and the first access on a row
+    # loads the whole 'import_text' group in one query.  Readers that walk a
+    # whole roster for gear_sharing_details (the gear-sharing service,
+    # preflight, the heat-generation gear gate) must query with
+    # undefer_group('import_text'), or they pay that load per competitor.
+    # headshot_filename stays eager; the heat entry page reads it for every
+    # competitor on screen.
     submission_timestamp = db.Column(db.DateTime, nullable=True)
-    gear_sharing_details = db.Column(db.Text, nullable=True)
+    gear_sharing_details = db.deferred(db.Column(db.Text, nullable=True), group='import_text')
     waiver_accepted = db.Column(db.Boolean, nullable=False, default=False)
-    waiver_signature = db.Column(db.String(200), nullable=True)
-    notes = db.Column(db.Text, nullable=True)
+    waiver_signature = db.deferred(db.Column(db.String(200), nullable=True), group='import_text')
+    notes = db.deferred(db.Column(db.Text, nullable=True), group='import_text')
     total_fees = db.Column(db.Integer, nullable=False, default=0)
     import_timestamp = db.Column(db.DateTime, nullable=True)
 
@@ -371,99 +367,101 @@ class ProCompetitor(db.Model):
 
     def get_events_entered(self):
         """Return list of event IDs this competitor is entered in."""
-        try:
-            return json.loads(self.events_entered or '[]')
-        except json.JSONDecodeError:
-            logger.warning('ProCompetitor id=%s: corrupt events_entered JSON; returning []', self.id)
-            return []
+        return self._load_json('events_entered', '[]')
 
     def set_events_entered(self, events):
         """Set the list of event IDs."""
-        self.events_entered = json.dumps(events)
+        self._store_json('events_entered', events)
 
     def get_entry_fees(self):
         """Return dict of event_id -> fee amount."""
-        try:
-            return json.loads(self.entry_fees or '{}')
-        except json.JSONDecodeError:
-            logger.warning('ProCompetitor id=%s: corrupt entry_fees JSON; returning {}', self.id)
-            return {}
+        return self._load_json('entry_fees', '{}')
 
     def set_entry_fee(self, event_id, amount):
         """Set entry fee for a specific event."""
-        fees = self.get_entry_fees()
-        fees[str(event_id)] = amount
-        self.entry_fees = json.dumps(fees)
+        self._set_json_key('entry_fees', event_id, amount)
 
     def get_fees_paid(self):
         """Return dict of event_id -> paid status."""
-        try:
-            return json.loads(self.fees_paid or '{}')
-        except json.JSONDecodeError:
-            logger.warning('ProCompetitor id=%s: corrupt fees_paid JSON; returning {}', self.id)
-            return {}
+        return self._load_json('fees_paid', '{}')
 
     def set_fee_paid(self, event_id, paid=True):
         """Set fee paid status for a specific event."""
-        paid_status = self.get_fees_paid()
-        paid_status[str(event_id)] = paid
-        self.fees_paid = json.dumps(paid_status)
+        self._set_json_key('fees_paid', event_id, paid)
 
     def get_gear_sharing(self):
         """Return dict of event_id -> partner sharing gear."""
-        try:
-            return json.loads(self.gear_sharing or '{}')
-        except json.JSONDecodeError:
-            logger.warning('ProCompetitor id=%s: corrupt gear_sharing JSON; returning {}', self.id)
-            return {}
+        return self._load_json('gear_sharing', '{}')
 
     def set_gear_sharing(self, event_id, partner_name):
         """Set gear sharing partner for a specific event."""
-        sharing = self.get_gear_sharing()
-        sharing[str(event_id)] = partner_name
-        self.gear_sharing = json.dumps(sharing)
+        self._set_json_key('gear_sharing', event_id, partner_name)
 
     def get_partners(self):
         """Return dict of event_id -> partner_name."""
-        try:
-            return json.loads(self.partners or '{}')
-        except json.JSONDecodeError:
-            logger.warning('ProCompetitor id=%s: corrupt partners JSON; returning {}', self.id)
-            return {}
+        return self._load_json('partners', '{}')
 
     def set_partner(self, event_id, partner_name):
         """Set partner for a specific event."""
-        partners = self.get_partners()
-        partners[str(event_id)] = partner_name
-        self.partners = json.dumps(partners)
+        self._set_json_key('partners', event_id, partner_name)
 
     def add_earnings(self, amount):
-        """Add earnings to total."""
-        self.total_earnings += amount
+        """Add earnings to total, rounded to whole cents.
+
+        total_earnings is a Float that scoring adds to and subtracts from every
+        time an event is re-finalized. Rounding each step keeps binary
+        fractions (0.1 + 0.2) from accumulating into the printed payout sheet.
+        """
+        self.total_earnings = round((self.total_earnings or 0.0) + float(amount), 2)
+
+    def _fee_totals(self):
+        """Return (owed, paid) from one walk over entry_fees."""
+        fees = self._json_value('entry_fees', '{}')
+        paid = self._json_value('fees_paid', '{}')
+        owed = paid_sum = 0
+        for key, amount in fees.items():
+            owed += amount
+            if paid.get(key):
+                paid_sum += amount
+        return owed, paid_sum
+
+    @staticmethod
+    def sum_fee_totals(competitors) -> tuple:
+        """Return (owed, paid) summed over *competitors*, one fee walk each.
+
+        Entry fees live in JSON text columns, so there is no portable SQL
+        SUM; this replaces summing total_fees_owed and total_fees_paid
+        separately, which walked every competitor's fees twice.
+        """
+        owed = paid = 0
+        for competitor in competitors:
+            competitor_owed, competitor_paid = competitor._fee_totals()
+            owed += competitor_owed
+            paid += competitor_paid
+        return owed, paid
 
     @property
     def total_fees_owed(self):
         """Calculate total entry fees owed."""
-        return sum(self.get_entry_fees().values())
+        return self._fee_totals()[0]
 
     @property
     def total_fees_paid(self):
         """Calculate total fees that have been paid."""
-        fees = self.get_entry_fees()
-        paid = self.get_fees_paid()
-        return sum(fees.get(k, 0) for k, v in paid.items() if v)
+        return self._fee_totals()[1]
 
     @property
     def fees_balance(self):
         """Calculate remaining balance owed."""
-        return self.total_fees_owed - self.total_fees_paid
+        owed, paid = self._fee_totals()
+        return owed - paid
 
     @property
     def has_portal_pin(self) -> bool:
         return bool(self.portal_pin_hash)
 
     def set_portal_pin(self, pin: str):
-        self.portal_pin_hash = generate_password_hash(pin)
+        self.portal_pin_hash = generate_password_hash(pin, method=PIN_HASH_METHOD)
 
     def check_portal_pin(self, pin: str) -> bool:
         if not self.portal_pin_hash:
@@ -1,14 +1,14 @@
 """
 Event and EventResult models for tournament events.
 """
-import json
-
 import sqlalchemy as sa
 
 from database import db
 
+from . import _json
+
 
-class Event(db.Model):
+class Event(_json.JSONColumns, db.Model):
     """Represents a competition event (e.g., Men's Underhand Speed)."""
 
     __tablename__ = 'events'
@@ -93,6 +93,12 @@ class Event(db.Model):
                             order_by='Heat.run_number, Heat.heat_number, Heat.id')
     results = db.relationship('EventResult', backref='event', lazy='dynamic', cascade='all, delete-orphan',
                               order_by='EventResult.id')
+    # Read-only, position-ordered copy of `results` for pages that list many
+    # events. Loaded with selectinload(Event.results_by_position) it fills every
+    # event's list in one query and get_results_sorted() reads it; `results`
+    # stays a dynamic query for the scoring code that filters it.
+    results_by_position = db.relationship('EventResult', viewonly=True,
+                                          order_by='EventResult.final_position')
 
     def __repr__(self):
         gender_str = f" ({self.gender})" if self.gender else ""
@@ -131,26 +137,54 @@ class Event(db.Model):
 
     def get_payouts(self):
         """Return dict of position -> payout amount."""
-        try:
-            return json.loads(self.payouts or '{}')
-        except json.JSONDecodeError:
-            return {}
+        return self._load_json('payouts', '{}')
 
     def set_payouts(self, payout_dict):
         """Set the payout structure."""
-        self.payouts = json.dumps(payout_dict)
+        self._store_json('payouts', payout_dict)
 
     def get_payout_for_position(self, position):
         """Get payout amount for a specific position."""
-        payouts = self.get_payouts()
-        return payouts.get(str(position), 0)
+        return self._json_value('payouts', '{}').get(str(position), 0)
+
+    @staticmethod
+    def result_counts(event_ids) -> dict[int, int]:
+        """Map event id -> EventResult row count, in one GROUP BY.
+
+        For pages that list events with their counts; ``event.results.count()``
+        in a loop is one query per event.
+        """
+        ids = sorted({int(i) for i in event_ids})
+        if not ids:
+            return {}
+        rows = (db.session.query(EventResult.event_id, sa.func.count(EventResult.id))
+                .filter(EventResult.event_id.in_(ids))
+                .group_by(EventResult.event_id))
+        return {event_id: count for event_id, count in rows}
+
+    @staticmethod
+    def heat_counts(event_ids) -> dict[int, int]:
+        """Map event id -> Heat row count (all runs), in one GROUP BY."""
+        from .heat import Heat
+
+        ids = sorted({int(i) for i in event_ids})
+        if not ids:
+            return {}
+        rows = (db.session.query(Heat.event_id, sa.func.count(Heat.id))
+                .filter(Heat.event_id.in_(ids))
+                .group_by(Heat.event_id))
+        return {event_id: count for event_id, count in rows}
 
     def get_competitors(self):
         """Return list of competitors entered in this event."""
-        return [r.competitor_name for r in self.results.all()]
+        rows = db.session.query(EventResult.competitor_name).filter(
+            EventResult.event_id == self.id).all()
+        return [name for (name,) in rows]
 
     def get_results_sorted(self):
         """Return results sorted by final position."""
+        if 'results_by_position' in self.__dict__:
+            return list(self.results_by_position)
         return self.results.order_by(EventResult.final_position).all()
 
 
@@ -161,6 +195,8 @@ class EventResult(db.Model):
     __table_args__ = (
         db.UniqueConstraint('event_id', 'competitor_id', 'competitor_type', name='uq_event_result_competitor'),
         db.Index('ix_event_results_event_status', 'event_id', 'status'),
+        db.Index('ix_event_results_event_position', 'event_id', 'final_position'),
+        db.Index('ix_event_results_competitor', 'competitor_type', 'competitor_id'),
         db.CheckConstraint("competitor_type IN ('college', 'pro')", name='ck_event_results_competitor_type_valid'),
         db.CheckConstraint(
             "status IN ('pending', 'completed', 'scratched', 'dnf', 'dq', 'partial')",
@@ -303,14 +339,10 @@ class EventResult(db.Model):
           highest_wins → max(run1, run2)   e.g. Caber Toss (distance)
         Also updates result_value so the ranking sort always uses best_run.
         """
-        runs = [v for v in [self.run1_value, self.run2_value] if v is not None]
-        if not runs:
-            return self.best_run
-        if scoring_order == 'highest_wins':
-            self.best_run = max(runs)
-        else:
-            self.best_run = min(runs)
-        self.result_value = self.best_run
+        runs = tuple(v for v in (self.run1_value, self.run2_value) if v is not None)
+        if runs:
+            pick = max if scoring_order == 'highest_wins' else min
+            self.best_run = self.result_value = pick(runs)
         return self.best_run
 
     def calculate_cumulative_score(self):
@@ -463,29 +463,66 @@ class Flight(db.Model):
     heats = db.relationship('Heat', backref='flight', lazy='dynamic',
                             order_by='Heat.flight_position, Heat.id')
 
+    # Scalar subqueries rather than Python over self.heats: each is one SELECT
+    # on first access instead of a query plus a row load, and a flight list
+    # can fetch both inside its own SELECT with undefer_group('counts').
+    # Like any loaded column they are not refreshed when heats move; expire
+    # the flight to re-read them.
+    heat_count = db.column_property(
+        sa.select(sa.func.count(Heat.id))
+        .where(Heat.flight_id == id)
+        .correlate_except(Heat)
+        .scalar_subquery(),
+        deferred=True, group='counts',
+    )
+    event_variety = db.column_property(
+        sa.select(sa.func.count(sa.distinct(Heat.event_id)))
+        .where(Heat.flight_id == id)
+        .correlate_except(Heat)
+        .scalar_subquery(),
+        deferred=True, group='counts',
+    )
+
     def __repr__(self):
         return f'<Flight {self.flight_number}>'
 
     def get_heats_ordered(self):
         """Return heats in this flight, ordered by their sequence."""
-        return self.heats.order_by(
+        # order_by(None) first: the relationship's own (flight_position, id)
+        # would otherwise lead the ORDER BY and put NULL positions wherever
+        # the backend sorts NULL, ahead of the case() below.
+        return self.heats.order_by(None).order_by(
             db.case((Heat.flight_position.is_(None), 1), else_=0),
             Heat.flight_position,
             Heat.id,
         ).all()
 
+    @staticmethod
+    def ordered_heats(flight_ids) -> dict[int, list]:
+        """Map flight id -> its heats in get_heats_ordered order, in one query.
+
+        For pages that walk every flight of a tournament. ``self.heats`` stays
+        a dynamic query, so one flight read through it is always current even
+        when the flight builder has just moved heats by assigning
+        ``flight_id``; a flight list read through it costs a query per flight.
+        Every requested id is in the result, with an empty list if it has no
+        heats.
+        """
+        ids = sorted({int(i) for i in flight_ids})
+        by_flight = {flight_id: [] for flight_id in ids}
+        if not ids:
+            return by_flight
+        heats = (Heat.query
+                 .filter(Heat.flight_id.in_(ids))
+                 .order_by(Heat.flight_id,
+                           db.case((Heat.flight_position.is_(None), 1), else_=0),
+                           Heat.flight_position,
+                           Heat.id))
+        for heat in heats:
+            by_flight[heat.flight_id].append(heat)
+        return by_flight
+
     def add_heat(self, heat):
         """Add a heat to this flight."""
         heat.flight_id = self.id
 
-    @property
-    def heat_count(self):
-        """Return number of heats in this flight."""
-        return self.heats.count()
-
-    @property
-    def event_variety(self):
-        """Return count of unique events represented in this flight."""
-        heats = self.heats.all()
-        event_ids = set(h.event_id for h in heats)
-        return len(event_ids)
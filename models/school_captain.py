@@ -6,6 +6,8 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 from database import db
 
+from .competitor import PIN_HASH_METHOD
+
 
 class SchoolCaptain(db.Model):
     """One captain account per school per tournament; covers all school teams."""
@@ -30,7 +32,7 @@ class SchoolCaptain(db.Model):
         return bool(self.pin_hash)
 
     def set_pin(self, pin: str):
-        self.pin_hash = generate_password_hash(pin)
+        self.pin_hash = generate_password_hash(pin, method=PIN_HASH_METHOD)
 
     def check_pin(self, pin: str) -> bool:
         if not self.pin_hash:
@@ -2,9 +2,15 @@
 Team model for college competition teams.
 """
 import sqlalchemy as sa
+from flask import has_request_context, request
 
 from database import db
 
+# Request attribute holding {team_id: (male, female, total)} once a page has
+# called Team.prime_roster_counts. On the request rather than flask.g for the
+# reason given at strings._LANG_ATTR.
+_ROSTER_COUNTS_ATTR = '_proam_roster_counts'
+
 
 class Team(db.Model):
     """Represents a college team (e.g., UM-A, CSU-B)."""
@@ -47,31 +53,92 @@ class Team(db.Model):
     )
 
     # Relationships
-    members = db.relationship('CollegeCompetitor', backref='team', lazy='dynamic',
-                              order_by='CollegeCompetitor.id')
+    # competitor.team is joined into every CollegeCompetitor load. Standings,
+    # exports and the school portal print team_code per row, and a team that
+    # was not already in the identity map cost one SELECT per row.
+    members = db.relationship('CollegeCompetitor', backref=db.backref('team', lazy='joined'),
+                              lazy='dynamic', order_by='CollegeCompetitor.id')
 
     __table_args__ = (
         db.UniqueConstraint('tournament_id', 'team_code', name='unique_team_code_per_tournament'),
         db.CheckConstraint("status IN ('active', 'scratched', 'invalid')", name='ck_teams_status_valid'),
         db.CheckConstraint('total_points >= 0', name='ck_teams_total_points_nonnegative'),
+        # Team standings and the standings poll: one tournament's active
+        # teams, total_points DESC then team_code, read straight off the index.
+        db.Index('ix_teams_standings', 'tournament_id', 'status',
+                 sa.text('total_points DESC'), 'team_code'),
     )
 
     def __repr__(self):
         return f'<Team {self.team_code}>'
 
+    @staticmethod
+    def get_roster_counts(tournament_id) -> dict[int, tuple[int, int, int]]:
+        """Map team id -> (male, female, total) active members, in one GROUP BY.
+
+        Every team in the tournament is present, including teams with no
+        active members.
+        """
+        from .competitor import CollegeCompetitor
+
+        rows = (db.session.query(Team.id, CollegeCompetitor.gender,
+                                 sa.func.count(CollegeCompetitor.id))
+                .outerjoin(CollegeCompetitor, sa.and_(
+                    CollegeCompetitor.team_id == Team.id,
+                    CollegeCompetitor.status == 'active'))
+                .filter(Team.tournament_id == tournament_id)
+                .group_by(Team.id, CollegeCompetitor.gender))
+        counts: dict[int, tuple[int, int, int]] = {}
+        for team_id, gender, count in rows:
+            male, female, total = counts.get(team_id, (0, 0, 0))
+            if gender == 'M':
+                male += count
+            elif gender == 'F':
+                female += count
+            counts[team_id] = (male, female, total + count)
+        return counts
+
+    @classmethod
+    def prime_roster_counts(cls, tournament_id) -> dict[int, tuple[int, int, int]]:
+        """Load every team's roster counts for the rest of this request.
+
+        For pages that list teams with their counts or validity; the count
+        properties read the primed values instead of issuing three COUNTs per
+        team. Call it after any roster changes the page makes, not before.
+        """
+        counts = cls.get_roster_counts(tournament_id)
+        if has_request_context():
+            primed = getattr(request, _ROSTER_COUNTS_ATTR, None) or {}
+            setattr(request, _ROSTER_COUNTS_ATTR, {**primed, **counts})
+        return counts
+
+    def _primed_counts(self):
+        if not has_request_context():
+            return None
+        return (getattr(request, _ROSTER_COUNTS_ATTR, None) or {}).get(self.id)
+
     @property
     def member_count(self):
         """Return total number of team members."""
+        primed = self._primed_counts()
+        if primed is not None:
+            return primed[2]
         return self.members.filter_by(status='active').count()
 
     @property
     def male_count(self):
         """Return count of male team members."""
+        primed = self._primed_counts()
+        if primed is not None:
+            return primed[0]
         return self.members.filter_by(gender='M', status='active').count()
 
     @property
     def female_count(self):
         """Return count of female team members."""
+        primed = self._primed_counts()
+        if primed is not None:
+            return primed[1]
         return self.members.filter_by(gender='F', status='active').count()
 
     @property
@@ -85,10 +152,47 @@ class Team(db.Model):
 
     def recalculate_points(self):
         """Recalculate total team points from all active members."""
-        active_members = self.members.filter_by(status='active').all()
-        self.total_points = sum(m.individual_points for m in active_members)
+        from .competitor import CollegeCompetitor
+
+        self.total_points = (
+            db.session.query(sa.func.coalesce(sa.func.sum(CollegeCompetitor.individual_points), 0))
+            .filter(CollegeCompetitor.team_id == self.id, CollegeCompetitor.status == 'active')
+            .scalar()
+        )
         return self.total_points
 
+    @classmethod
+    def bulk_recalculate(cls, tournament_id=None, team_ids=None) -> int:
+        """Recalculate total_points for many teams in one correlated UPDATE.
+
+        Pass ``tournament_id`` for every team in a tournament, or ``team_ids``
+        for the teams a scoring change touched. Pending competitor changes are
+        flushed first so the sums see them, and the updated totals are
+        expired on any Team already in the session. Returns the number of
+        teams updated.
+        """
+        from .competitor import CollegeCompetitor
+
+        if tournament_id is None and team_ids is None:
+            raise ValueError('bulk_recalculate needs tournament_id or team_ids')
+        if team_ids is not None:
+            team_ids = sorted({int(i) for i in team_ids})
+            if not team_ids:
+                return 0
+        member_sum = (
+            sa.select(sa.func.coalesce(sa.func.sum(CollegeCompetitor.individual_points), 0))
+            .where(CollegeCompetitor.team_id == cls.id, CollegeCompetitor.status == 'active')
+            .scalar_subquery()
+        )
+        stmt = sa.update(cls).values(total_points=member_sum)
+        if tournament_id is not None:
+            stmt = stmt.where(cls.tournament_id == tournament_id)
+        if team_ids is not None:
+            stmt = stmt.where(cls.id.in_(team_ids))
+        db.session.flush()
+        result = db.session.execute(stmt, execution_options={'synchronize_session': 'fetch'})
+        return result.rowcount
+
     def get_members_sorted(self):
         """Return members sorted by individual points (descending)."""
         members = self.members.filter_by(status='active').all()
@@ -86,6 +86,46 @@ class Tournament(db.Model):
         """Return count of pro competitors."""
         return self.pro_competitors.count()
 
+    def summary_counts(self) -> dict:
+        """Row counts for the tournament detail page, in one SELECT.
+
+        Each figure is a scalar subquery, so the page pays one round trip
+        instead of one COUNT per stat. Team and competitor counts match the
+        ``*_count`` properties above (all statuses).
+        """
+        from .competitor import CollegeCompetitor, ProCompetitor
+        from .event import Event
+        from .heat import Flight, Heat
+        from .team import Team
+        from .wood_config import WoodConfig
+
+        def _count(from_, *criteria):
+            return (sa.select(sa.func.count())
+                    .select_from(from_)
+                    .where(*criteria)
+                    .scalar_subquery())
+
+        def _exists(model):
+            return sa.exists().where(model.tournament_id == self.id)
+
+        row = db.session.execute(sa.select(
+            _count(Team, Team.tournament_id == self.id).label('college_teams'),
+            _count(CollegeCompetitor,
+                   CollegeCompetitor.tournament_id == self.id).label('college_competitors'),
+            _count(ProCompetitor, ProCompetitor.tournament_id == self.id).label('pro_competitors'),
+            _count(Event, Event.tournament_id == self.id).label('events'),
+            _count(Event, Event.tournament_id == self.id,
+                   Event.status == 'completed').label('completed_events'),
+            _count(sa.join(Heat, Event, Heat.event_id == Event.id),
+                   Event.tournament_id == self.id).label('heats_generated'),
+            _exists(WoodConfig).label('wood_configured'),
+            _exists(Flight).label('flights_built'),
+        )).one()
+        counts = row._asdict()
+        counts['wood_configured'] = bool(counts['wood_configured'])
+        counts['flights_built'] = bool(counts['flights_built'])
+        return counts
+
     def get_team_standings(self):
         """Return teams sorted by total points (descending)."""
         from .team import Team
@@ -117,6 +157,44 @@ class Tournament(db.Model):
         as get_bull_of_woods.  See that method's docstring for details."""
         return self._bull_belle_query('F', limit)
 
+    def get_top_competitors_by_gender(self, limit=5, options=()):
+        """Return ``(bull, belle)`` with one query instead of two.
+
+        Same ranking as get_bull_of_woods / get_belle_of_woods. Each gender is
+        numbered with ``ROW_NUMBER() OVER (PARTITION BY gender ORDER BY
+        <tiebreak chain>)`` and only the first ``limit`` of each come back, so
+        the standings pages that show both lists make one round trip.
+        ``options`` are loader options for the competitor rows, e.g. a
+        ``load_only`` for a caller that prints three columns.
+        """
+        from sqlalchemy import func
+
+        from .competitor import CollegeCompetitor
+
+        placements = self._placement_counts()
+        rank = func.row_number().over(
+            partition_by=CollegeCompetitor.gender,
+            order_by=self._bull_belle_order(placements),
+        ).label('rank')
+        ranked = (
+            self._bull_belle_pool(placements)
+            .filter(CollegeCompetitor.gender.in_(('M', 'F')))
+            .with_entities(CollegeCompetitor.id.label('id'), rank)
+            .subquery()
+        )
+        query = (
+            db.session.query(CollegeCompetitor)
+            .join(ranked, ranked.c.id == CollegeCompetitor.id)
+            .options(*options)
+            .order_by(ranked.c.rank)
+        )
+        if limit:
+            query = query.filter(ranked.c.rank <= limit)
+        bull, belle = [], []
+        for competitor in query.all():
+            (bull if competitor.gender == 'M' else belle).append(competitor)
+        return bull, belle
+
     def _bull_belle_query(self, gender: str, limit: int):
         """Shared implementation for Bull/Belle ordering with placement-count tiebreak.
 
@@ -133,9 +211,23 @@ class Tournament(db.Model):
         above this).  Falls back to a portable CASE-based pivot for absolute
         safety on older SQLite by computing each count via SUM(CASE WHEN ...).
         """
+        from .competitor import CollegeCompetitor
+
+        placements = self._placement_counts()
+        query = (
+            self._bull_belle_pool(placements)
+            .filter(CollegeCompetitor.gender == gender)
+            .order_by(*self._bull_belle_order(placements))
+        )
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def _placement_counts():
+        """Subquery of finalized college placement counts, p1..p6, per competitor."""
         from sqlalchemy import case, func
 
-        from .competitor import CollegeCompetitor
         from .event import EventResult
 
         # SUM(CASE) is the maximally-portable way to do conditional counts.
@@ -147,8 +239,7 @@ class Tournament(db.Model):
                 0,
             )
 
-        # Subquery: for each competitor, the placement counts.
-        placements = (
+        return (
             db.session.query(
                 EventResult.competitor_id.label('competitor_id'),
                 _count_at(1).label('p1'),
@@ -164,28 +255,36 @@ class Tournament(db.Model):
             .subquery()
         )
 
-        # Main query: left-join the placements subquery so competitors with
-        # zero results still appear (their counts will be NULL → coalesced 0).
-        query = (
+    def _bull_belle_pool(self, placements):
+        """Active college competitors of this tournament, joined to ``placements``."""
+        from .competitor import CollegeCompetitor
+
+        # Left join so competitors with zero results still appear (their
+        # counts will be NULL → coalesced 0).
+        return (
             db.session.query(CollegeCompetitor)
             .outerjoin(placements, placements.c.competitor_id == CollegeCompetitor.id)
             .filter(CollegeCompetitor.tournament_id == self.id)
             .filter(CollegeCompetitor.status == 'active')
-            .filter(CollegeCompetitor.gender == gender)
-            .order_by(
-                CollegeCompetitor.individual_points.desc(),
-                func.coalesce(placements.c.p1, 0).desc(),
-                func.coalesce(placements.c.p2, 0).desc(),
-                func.coalesce(placements.c.p3, 0).desc(),
-                func.coalesce(placements.c.p4, 0).desc(),
-                func.coalesce(placements.c.p5, 0).desc(),
-                func.coalesce(placements.c.p6, 0).desc(),
-                CollegeCompetitor.name,
-            )
         )
-        if limit:
-            query = query.limit(limit)
-        return query.all()
+
+    @staticmethod
+    def _bull_belle_order(placements):
+        """The Bull/Belle ranking: points, then p1..p6 counts, then name."""
+        from sqlalchemy import func
+
+        from .competitor import CollegeCompetitor
+
+        return [
+            CollegeCompetitor.individual_points.desc(),
+            func.coalesce(placements.c.p1, 0).desc(),
+            func.coalesce(placements.c.p2, 0).desc(),
+            func.coalesce(placements.c.p3, 0).desc(),
+            func.coalesce(placements.c.p4, 0).desc(),
+            func.coalesce(placements.c.p5, 0).desc(),
+            func.coalesce(placements.c.p6, 0).desc(),
+            CollegeCompetitor.name,
+        ]
 
     def get_bull_belle_with_tiebreak_data(self, gender: str, limit: int = 5):
         """Like _bull_belle_query but also returns the placement counts and
@@ -199,57 +298,17 @@ class Tournament(db.Model):
             the next row's tuple — i.e., the placement-count chain failed to
             break the tie and a coin flip is required.
         """
-        from sqlalchemy import case, func
+        from sqlalchemy import func
 
         from .competitor import CollegeCompetitor
-        from .event import EventResult
-
-        def _count_at(position: int):
-            return func.coalesce(
-                func.sum(case((EventResult.final_position == position, 1), else_=0)),
-                0,
-            )
-
-        placements = (
-            db.session.query(
-                EventResult.competitor_id.label('competitor_id'),
-                _count_at(1).label('p1'),
-                _count_at(2).label('p2'),
-                _count_at(3).label('p3'),
-                _count_at(4).label('p4'),
-                _count_at(5).label('p5'),
-                _count_at(6).label('p6'),
-            )
-            .filter(EventResult.competitor_type == 'college')
-            .filter(EventResult.status == 'completed')
-            .group_by(EventResult.competitor_id)
-            .subquery()
-        )
 
+        placements = self._placement_counts()
         rows = (
-            db.session.query(
-                CollegeCompetitor,
-                func.coalesce(placements.c.p1, 0).label('p1'),
-                func.coalesce(placements.c.p2, 0).label('p2'),
-                func.coalesce(placements.c.p3, 0).label('p3'),
-                func.coalesce(placements.c.p4, 0).label('p4'),
-                func.coalesce(placements.c.p5, 0).label('p5'),
-                func.coalesce(placements.c.p6, 0).label('p6'),
-            )
-            .outerjoin(placements, placements.c.competitor_id == CollegeCompetitor.id)
-            .filter(CollegeCompetitor.tournament_id == self.id)
-            .filter(CollegeCompetitor.status == 'active')
+            self._bull_belle_pool(placements)
+            .add_columns(*(func.coalesce(getattr(placements.c, f'p{n}'), 0).label(f'p{n}')
+                           for n in range(1, 7)))
             .filter(CollegeCompetitor.gender == gender)
-            .order_by(
-                CollegeCompetitor.individual_points.desc(),
-                func.coalesce(placements.c.p1, 0).desc(),
-                func.coalesce(placements.c.p2, 0).desc(),
-                func.coalesce(placements.c.p3, 0).desc(),
-                func.coalesce(placements.c.p4, 0).desc(),
-                func.coalesce(placements.c.p5, 0).desc(),
-                func.coalesce(placements.c.p6, 0).desc(),
-                CollegeCompetitor.name,
-            )
+            .order_by(*self._bull_belle_order(placements))
             .limit(limit)
             .all()
         )
@@ -2,6 +2,7 @@
 User model for role-based authentication.
 """
 from datetime import datetime
+from types import MappingProxyType
 
 import sqlalchemy as sa
 
@@ -23,6 +24,18 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 from database import db
 
+# Permission bits granted per role in User.ROLE_PERMS. Role checks run several
+# times per request and once per row on some dashboards; each is one dict
+# lookup and one AND instead of building a set of role names.
+PERM_JUDGE = 1 << 0
+PERM_REGISTER = 1 << 1
+PERM_SCHEDULE = 1 << 2
+PERM_SCORE = 1 << 3
+PERM_REPORT = 1 << 4
+PERM_SPECTATOR = 1 << 5
+# The grants that change state; see User.can_write.
+PERM_WRITE = PERM_JUDGE | PERM_REGISTER | PERM_SCHEDULE | PERM_SCORE
+
 
 class User(UserMixin, db.Model):
     """Application user with role-based access control."""
@@ -37,6 +50,17 @@ class User(UserMixin, db.Model):
     ROLE_SPECTATOR = 'spectator'
     ROLE_VIEWER = 'viewer'
 
+    # A role missing from this table has no permissions.
+    ROLE_PERMS = MappingProxyType({
+        ROLE_ADMIN: PERM_JUDGE | PERM_REGISTER | PERM_SCHEDULE | PERM_SCORE | PERM_REPORT,
+        ROLE_JUDGE: PERM_JUDGE | PERM_REGISTER | PERM_SCHEDULE | PERM_SCORE | PERM_REPORT,
+        ROLE_SCORER: PERM_SCHEDULE | PERM_SCORE | PERM_REPORT,
+        ROLE_REGISTRAR: PERM_REGISTER | PERM_REPORT,
+        ROLE_COMPETITOR: 0,
+        ROLE_SPECTATOR: PERM_REPORT | PERM_SPECTATOR,
+        ROLE_VIEWER: PERM_REPORT | PERM_SPECTATOR,
+    })
+
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), nullable=False, unique=True)
     password_hash = db.Column(db.String(255), nullable=False)
@@ -63,7 +87,7 @@ class User(UserMixin, db.Model):
 
     @property
     def is_judge(self):
-        return self.role in {self.ROLE_ADMIN, self.ROLE_JUDGE}
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_JUDGE)
 
     @property
     def is_admin(self):
@@ -75,7 +99,7 @@ class User(UserMixin, db.Model):
 
     @property
     def is_spectator(self):
-        return self.role in {self.ROLE_SPECTATOR, self.ROLE_VIEWER}
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_SPECTATOR)
 
     @property
     def can_manage_users(self):
@@ -83,26 +107,19 @@ class User(UserMixin, db.Model):
 
     @property
     def can_register(self):
-        return self.role in {self.ROLE_ADMIN, self.ROLE_JUDGE, self.ROLE_REGISTRAR}
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_REGISTER)
 
     @property
     def can_schedule(self):
-        return self.role in {self.ROLE_ADMIN, self.ROLE_JUDGE, self.ROLE_SCORER}
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_SCHEDULE)
 
     @property
     def can_score(self):
-        return self.role in {self.ROLE_ADMIN, self.ROLE_JUDGE, self.ROLE_SCORER}
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_SCORE)
 
     @property
     def can_report(self):
-        return self.role in {
-            self.ROLE_ADMIN,
-            self.ROLE_JUDGE,
-            self.ROLE_SCORER,
-            self.ROLE_REGISTRAR,
-            self.ROLE_VIEWER,
-            self.ROLE_SPECTATOR,
-        }
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_REPORT)
 
     @property
     def can_write(self):
@@ -122,13 +139,7 @@ class User(UserMixin, db.Model):
         means a registrar files a bug; getting it wrong in the other direction
         means the settlement desk pays from numbers a spectator typed.
         """
-        return (
-            self.is_admin
-            or self.is_judge
-            or self.can_register
-            or self.can_schedule
-            or self.can_score
-        )
+        return bool(self.ROLE_PERMS.get(self.role, 0) & PERM_WRITE)
 
     def set_password(self, password: str):
         self.password_hash = generate_password_hash(password)
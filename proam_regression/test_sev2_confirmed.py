@@ -11,6 +11,7 @@ holds exactly one user, so there is no read-only account to borrow.
 
 import json
 import re
+import time
 
 import pytest
 import rig
@@ -2291,8 +2292,17 @@ def _imp_run(client, app, tmp_path, rows):
         follow_redirects=True,
     )
     assert up.status_code == 200, up.status_code
-    with client.session_transaction() as sess:
-        parsed = sess.get(f"pro_import_{TID}")
+    # The workbook is parsed on a background job; the review page moves the
+    # staged file into the session once that job has finished.
+    deadline = time.monotonic() + 30
+    while True:
+        with client.session_transaction() as sess:
+            parsed = sess.get(f"pro_import_{TID}")
+            waiting = sess.get(f"pro_import_job_{TID}")
+        if parsed or not waiting or time.monotonic() > deadline:
+            break
+        time.sleep(0.1)
+        client.get(f"/import/{TID}/pro-entries/review")
     assert parsed, (
         "the control failed: the upload never parsed, so nothing downstream "
         "of it is being tested. The confirm step reads the session key "
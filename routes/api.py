@@ -2,11 +2,11 @@
 import json
 import threading
 import time
-from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
 
-from flask import Blueprint, Response, current_app, jsonify, stream_with_context
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from sqlalchemy.orm import joinedload, lazyload, load_only, raiseload, selectinload
 
 
 def _json_default(obj):
@@ -23,8 +23,9 @@ def _json_default(obj):
         return obj.isoformat()
     raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
 
-from models import Event, EventResult, Heat, Team, Tournament
-from models.competitor import ProCompetitor
+from database import db
+from models import Event, EventResult, Flight, Heat, Team, Tournament
+from models.competitor import CollegeCompetitor, ProCompetitor
 from services.handicap_export import build_chopping_rows
 from services.report_cache import get as cache_get
 from services.report_cache import set as cache_set
@@ -39,6 +40,60 @@ SSE_MAX_CONNECTIONS = 150
 
 api_bp = Blueprint('api', __name__)
 
+# Appended to every top-level query behind the public endpoints below. Those
+# payloads are built from columns plus the relationships each query names
+# explicitly; any other relationship touched while serializing raises instead
+# of quietly issuing a SELECT per row on a page every spectator phone polls.
+_NO_LAZY = raiseload('*')
+
+
+# Loader options for the Bull/Belle rows on the standings endpoints, which
+# print id, display_name and points. display_name needs the team code; the
+# identity row (contact details) is left unloaded rather than selectin-loaded.
+_LEADER_COLUMNS = (
+    load_only(CollegeCompetitor.id, CollegeCompetitor.name, CollegeCompetitor.gender,
+              CollegeCompetitor.team_id, CollegeCompetitor.individual_points),
+    joinedload(CollegeCompetitor.team).load_only(Team.team_code),
+    lazyload(CollegeCompetitor.identity),
+)
+
+
+def _leaderboard(competitors):
+    return [{'id': c.id, 'name': c.display_name, 'points': c.individual_points}
+            for c in competitors]
+
+
+def _public_cache_ttl() -> int:
+    """Seconds a public payload is served from report_cache; 0 disables."""
+    return max(0, int(current_app.config.get('PUBLIC_CACHE_TTL_SECONDS', 5)))
+
+
+# ``?shape=hc`` sends the long same-keyed lists below (schedule heats, results
+# rows, pro earnings) as one key header plus a value row per object, which
+# drops the repeated key names from the body:
+#     {"keys": ["id", "heat_number", ...], "rows": [[1, 1, ...], ...]}
+# A client rebuilds the objects with
+#     const revive = ({keys, rows}) =>
+#       rows.map(r => Object.fromEntries(keys.map((k, i) => [k, r[i]])));
+# Without the parameter every payload keeps its existing shape.
+_HEAT_KEYS = ('id', 'heat_number', 'run_number', 'status', 'competitors',
+              'stand_assignments', 'flight_number')
+_RESULT_KEYS = ('competitor_id', 'competitor_name', 'status', 'result_value', 'best_run',
+                'position', 'points_awarded', 'payout_amount')
+_EARNINGS_KEYS = ('id', 'name', 'earnings')
+
+
+def _columnar_requested() -> bool:
+    return request.args.get('shape') == 'hc'
+
+
+def _shape(objects: list[dict], keys: tuple[str, ...], columnar: bool):
+    """Return ``objects`` as is, or in the ``?shape=hc`` layout."""
+    if not columnar:
+        return objects
+    return {'keys': list(keys), 'rows': [[obj[k] for k in keys] for obj in objects]}
+
+
 # ---------------------------------------------------------------------------
 # Write-endpoint rate limiter — attached in create_app() via _init_write_limiter.
 # Applies to POST/PUT/DELETE routes on management blueprints.
@@ -116,109 +171,210 @@ except ImportError:
 @_limit('120 per minute')
 def public_standings(tournament_id):
     tournament = Tournament.query.get_or_404(tournament_id)
+    columnar = _columnar_requested()
+    cache_key = f'api:standings:{tournament_id}' + (':hc' if columnar else '')
+    ttl_seconds = _public_cache_ttl()
+    cached = cache_get(cache_key) if ttl_seconds else None
+    if cached is not None:
+        return jsonify(cached)
+
+    # Only the three columns the payload prints, as plain rows: the full field
+    # is listed, and building a ProCompetitor per pro was the bulk of the work.
     pro_earnings_rows = (
-        ProCompetitor.query
+        db.session.query(ProCompetitor.id, ProCompetitor.name, ProCompetitor.total_earnings)
         .filter_by(tournament_id=tournament.id, status='active')
         .order_by(ProCompetitor.total_earnings.desc(), ProCompetitor.name)
         .all()
     )
+    teams = (
+        Team.query
+        .options(load_only(Team.id, Team.team_code, Team.total_points), _NO_LAZY)
+        .filter_by(tournament_id=tournament.id, status='active')
+        .order_by(Team.total_points.desc(), Team.team_code)
+        .all()
+    )
+    bull, belle = tournament.get_top_competitors_by_gender(10, options=_LEADER_COLUMNS)
     payload = {
         'tournament': {'id': tournament.id, 'name': tournament.name, 'year': tournament.year},
         'teams': [
             {'id': team.id, 'team_code': team.team_code, 'points': team.total_points}
-            for team in tournament.get_team_standings()
+            for team in teams
         ],
-        'bull': [{'id': c.id, 'name': c.display_name, 'points': c.individual_points} for c in tournament.get_bull_of_woods(10)],
-        'belle': [{'id': c.id, 'name': c.display_name, 'points': c.individual_points} for c in tournament.get_belle_of_woods(10)],
-        'pro_earnings': [
+        'bull': _leaderboard(bull),
+        'belle': _leaderboard(belle),
+        'pro_earnings': _shape([
             {'id': c.id, 'name': c.name, 'earnings': c.total_earnings}
             for c in pro_earnings_rows
-        ],
+        ], _EARNINGS_KEYS, columnar),
     }
+    if ttl_seconds:
+        cache_set(cache_key, payload, ttl_seconds)
     return jsonify(payload)
 
 
+# Rows read for the streamed endpoints below are fetched this many at a time
+# (a server-side cursor on PostgreSQL), so a full show's heats or results are
+# never all in memory together.
+_STREAM_BATCH = 100
+
+# Both streamed endpoints list events in this order, and read their heats or
+# results in the same order, so each event's rows arrive together.
+_EVENT_ORDER = (Event.event_type, Event.name, Event.gender, Event.id)
+
+
+def _rows_by_event(events, rows):
+    """Pair each event with its rows. ``rows`` must follow _EVENT_ORDER.
+
+    The events and the rows come from separate queries, so a row can name an
+    event that is not in ``events`` (one completed in between, say). Such rows
+    are dropped; left pending, one would hold back every event after it.
+    """
+    listed = {event.id for event in events}
+    rows = (row for row in rows if row.event_id in listed)
+    pending = next(rows, None)
+    for event in events:
+        batch = []
+        while pending is not None and pending.event_id == event.id:
+            batch.append(pending)
+            pending = next(rows, None)
+        yield event, batch
+
+
+def _stream_event_list(tournament_id, list_key, entries, cache_key, ttl_seconds):
+    """Stream ``{list_key: [...entries], "tournament_id": id}`` one entry at a time.
+
+    The bytes match what jsonify would send for the same dict, trailing
+    newline included. The finished text is cached as a string, and a cache
+    hit sends it without re-encoding.
+    """
+    encode = current_app.json.dumps
+
+    def _generate():
+        parts = [] if ttl_seconds else None
+        head = f'{{"{list_key}":['
+        count = 0
+        for entry in entries:
+            piece = (',' if count else head) + encode(entry)
+            count += 1
+            if parts is not None:
+                parts.append(piece)
+            yield piece
+        tail = ('' if count else head) + f'],"tournament_id":{int(tournament_id)}}}\n'
+        yield tail
+        if parts is not None:
+            parts.append(tail)
+            cache_set(cache_key, ''.join(parts), ttl_seconds)
+
+    return Response(stream_with_context(_generate()), mimetype='application/json')
+
+
+def _cached_json(cache_key, ttl_seconds):
+    cached = cache_get(cache_key) if ttl_seconds else None
+    if cached is None:
+        return None
+    return Response(cached, mimetype='application/json')
+
+
 @api_bp.route('/public/tournaments/<int:tournament_id>/schedule')
 def public_schedule(tournament_id):
     tournament = Tournament.query.get_or_404(tournament_id)
-    events = tournament.events.order_by(Event.event_type, Event.name, Event.gender).all()
-    event_ids = [e.id for e in events]
+    columnar = _columnar_requested()
+    cache_key = f'api:schedule:{tournament_id}' + (':hc' if columnar else '')
+    ttl_seconds = _public_cache_ttl()
+    cached = _cached_json(cache_key, ttl_seconds)
+    if cached is not None:
+        return cached
+
+    events = (Event.query.filter_by(tournament_id=tournament.id).options(_NO_LAZY)
+              .order_by(*_EVENT_ORDER).all())
 
-    # Batch-load all heats for all events in one query — avoids N+1
-    all_heats = (
+    # One query for every heat, in event order, read in batches. Flights are
+    # joined in for their number only, the one Flight column the payload
+    # reads, and each batch's rosters arrive in one selectin query.
+    heats = (
         Heat.query
-        .filter(Heat.event_id.in_(event_ids))
-        .order_by(Heat.event_id, Heat.heat_number, Heat.run_number)
-        .all()
-    ) if event_ids else []
-    heats_by_event = defaultdict(list)
-    for heat in all_heats:
-        heats_by_event[heat.event_id].append(heat)
+        .join(Event, Heat.event_id == Event.id)
+        .options(joinedload(Heat.flight).load_only(Flight.flight_number),
+                 selectinload(Heat.assignments), _NO_LAZY)
+        .filter(Event.tournament_id == tournament.id, Heat.event_id.in_([e.id for e in events]))
+        .order_by(*_EVENT_ORDER, Heat.heat_number, Heat.run_number)
+        .yield_per(_STREAM_BATCH)
+    )
 
-    payload = []
-    for event in events:
-        payload.append({
-            'event_id': event.id,
-            'event_name': event.display_name,
-            'event_type': event.event_type,
-            'status': event.status,
-            'heats': [
-                {
-                    'id': heat.id,
-                    'heat_number': heat.heat_number,
-                    'run_number': heat.run_number,
-                    'status': heat.status,
-                    'competitors': heat.get_competitors(),
-                    'stand_assignments': heat.get_stand_assignments(),
-                    'flight_number': heat.flight.flight_number if heat.flight else None,
-                }
-                for heat in heats_by_event[event.id]
-            ],
-        })
-    return jsonify({'tournament_id': tournament.id, 'schedule': payload})
+    def _entries():
+        for event, event_heats in _rows_by_event(events, heats):
+            yield {
+                'event_id': event.id,
+                'event_name': event.display_name,
+                'event_type': event.event_type,
+                'status': event.status,
+                'heats': _shape([
+                    {
+                        'id': heat.id,
+                        'heat_number': heat.heat_number,
+                        'run_number': heat.run_number,
+                        'status': heat.status,
+                        'competitors': heat.get_competitors(),
+                        'stand_assignments': heat.get_stand_assignments(),
+                        'flight_number': heat.flight.flight_number if heat.flight else None,
+                    }
+                    for heat in event_heats
+                ], _HEAT_KEYS, columnar),
+            }
+
+    return _stream_event_list(tournament.id, 'schedule', _entries(), cache_key, ttl_seconds)
 
 
 @api_bp.route('/public/tournaments/<int:tournament_id>/results')
 def public_results(tournament_id):
     tournament = Tournament.query.get_or_404(tournament_id)
-    completed_events = tournament.events.filter_by(status='completed').order_by(Event.event_type, Event.name, Event.gender).all()
-    event_ids = [e.id for e in completed_events]
+    columnar = _columnar_requested()
+    cache_key = f'api:results:{tournament_id}' + (':hc' if columnar else '')
+    ttl_seconds = _public_cache_ttl()
+    cached = _cached_json(cache_key, ttl_seconds)
+    if cached is not None:
+        return cached
+
+    completed_events = (Event.query.filter_by(tournament_id=tournament.id, status='completed')
+                        .options(_NO_LAZY).order_by(*_EVENT_ORDER).all())
 
-    # Batch-load all completed results in one query — avoids N+1
-    all_results = (
+    # One query for every completed result, in event order, read in batches.
+    results = (
         EventResult.query
+        .join(Event, EventResult.event_id == Event.id)
+        .options(_NO_LAZY)
         .filter(
-            EventResult.event_id.in_(event_ids),
+            Event.tournament_id == tournament.id,
+            Event.status == 'completed',
+            EventResult.event_id.in_([e.id for e in completed_events]),
             EventResult.status == 'completed',
         )
-        .order_by(EventResult.event_id, EventResult.final_position)
-        .all()
-    ) if event_ids else []
-    results_by_event = defaultdict(list)
-    for row in all_results:
-        results_by_event[row.event_id].append(row)
-
-    payload = []
-    for event in completed_events:
-        payload.append({
-            'event_id': event.id,
-            'event_name': event.display_name,
-            'event_type': event.event_type,
-            'results': [
-                {
-                    'competitor_id': row.competitor_id,
-                    'competitor_name': row.competitor_name,
-                    'status': row.status,
-                    'result_value': row.result_value,
-                    'best_run': row.best_run,
-                    'position': row.final_position,
-                    'points_awarded': row.points_awarded,
-                    'payout_amount': row.payout_amount,
-                }
-                for row in results_by_event[event.id]
-            ],
-        })
-    return jsonify({'tournament_id': tournament.id, 'results': payload})
+        .order_by(*_EVENT_ORDER, EventResult.final_position)
+        .yield_per(_STREAM_BATCH)
+    )
+
+    def _entries():
+        for event, event_results in _rows_by_event(completed_events, results):
+            yield {
+                'event_id': event.id,
+                'event_name': event.display_name,
+                'event_type': event.event_type,
+                'results': _shape([
+                    {
+                        'competitor_id': row.competitor_id,
+                        'competitor_name': row.competitor_name,
+                        'status': row.status,
+                        'result_value': row.result_value,
+                        'best_run': row.best_run,
+                        'position': row.final_position,
+                        'points_awarded': row.points_awarded,
+                        'payout_amount': row.payout_amount,
+                    }
+                    for row in event_results
+                ], _RESULT_KEYS, columnar),
+            }
+
+    return _stream_event_list(tournament.id, 'results', _entries(), cache_key, ttl_seconds)
 
 
 # ---------------------------------------------------------------------------
@@ -231,7 +387,8 @@ def standings_poll(tournament_id):
     """Lightweight polling endpoint for live leaderboard auto-refresh."""
     tournament = Tournament.query.get_or_404(tournament_id)
     cache_key = f'api:standings-poll:{tournament_id}'
-    ttl_seconds = max(1, int(current_app.config.get('PUBLIC_CACHE_TTL_SECONDS', 5)))
+    # Never below one second: standings_stream reads this entry.
+    ttl_seconds = max(1, _public_cache_ttl())
     cached = cache_get(cache_key)
     if cached is not None:
         return jsonify(cached)
@@ -240,6 +397,7 @@ def standings_poll(tournament_id):
     teams = []
     top_teams = (
         Team.query
+        .options(load_only(Team.id, Team.team_code, Team.school_name, Team.total_points), _NO_LAZY)
         .filter_by(tournament_id=tournament.id, status='active')
         .order_by(Team.total_points.desc(), Team.team_code)
         .limit(15)
@@ -254,18 +412,11 @@ def standings_poll(tournament_id):
         })
 
     # Bull/Belle of the Woods top 10
-    bull = [
-        {'id': c.id, 'name': c.display_name, 'points': c.individual_points}
-        for c in tournament.get_bull_of_woods(10)
-    ]
-    belle = [
-        {'id': c.id, 'name': c.display_name, 'points': c.individual_points}
-        for c in tournament.get_belle_of_woods(10)
-    ]
+    bull, belle = tournament.get_top_competitors_by_gender(10, options=_LEADER_COLUMNS)
 
-    # Pro top earners
+    # Pro top earners, as plain rows like public_standings
     pro = (
-        ProCompetitor.query
+        db.session.query(ProCompetitor.id, ProCompetitor.name, ProCompetitor.total_earnings)
         .filter_by(tournament_id=tournament.id, status='active')
         .order_by(ProCompetitor.total_earnings.desc(), ProCompetitor.name)
         .limit(15)
@@ -280,8 +431,8 @@ def standings_poll(tournament_id):
         'tournament_id': tournament_id,
         'last_updated': datetime.utcnow().isoformat() + 'Z',
         'college_teams': teams,
-        'bull': bull,
-        'belle': belle,
+        'bull': _leaderboard(bull),
+        'belle': _leaderboard(belle),
         'pro': pro_data,
     }
     cache_set(cache_key, payload, ttl_seconds)
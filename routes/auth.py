@@ -1,17 +1,22 @@
 """
 Authentication and user-management routes.
 """
+from datetime import datetime
 from urllib.parse import urlsplit
 
-from flask import Blueprint, abort, flash, redirect, render_template, request, url_for
+import sqlalchemy as sa
+from flask import Blueprint, abort, current_app, flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required, login_user, logout_user
+from sqlalchemy.orm import joinedload, lazyload, load_only
 
 from database import db
-from models import Tournament
+from models import Team, Tournament
 from models.audit_log import AuditLog
 from models.competitor import CollegeCompetitor, ProCompetitor
 from models.user import User
 from services.audit import log_action
+from services.report_cache import get as cache_get
+from services.report_cache import set as cache_set
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -110,7 +115,7 @@ def logout():
 @auth_bp.route('/bootstrap', methods=['GET', 'POST'])
 def bootstrap():
     """Create the first judge/admin account when DB is empty."""
-    if User.query.count() > 0:
+    if db.session.query(User.query.exists()).scalar():
         flash('Bootstrap is disabled because users already exist.', 'warning')
         return redirect(url_for('auth.login'))
 
@@ -131,8 +136,10 @@ def bootstrap():
         user = User(username=username, role=role, display_name='Head Judge')
         user.set_password(password)
         db.session.add(user)
+        db.session.flush()
+        user_id = user.id  # read before the commit expires it
         db.session.commit()
-        log_action('bootstrap_user_created', 'user', user.id, {'role': role})
+        log_action('bootstrap_user_created', 'user', user_id, {'role': role})
         db.session.commit()
 
         flash('Initial judge account created. Please log in.', 'success')
@@ -141,6 +148,9 @@ def bootstrap():
     return render_template('auth/bootstrap.html')
 
 
+_USERS_PER_PAGE = 100
+
+
 @auth_bp.route('/users', methods=['GET', 'POST'])
 def manage_users():
     """Judge-facing user administration."""
@@ -179,7 +189,7 @@ def manage_users():
         if len(password) < 8:
             flash('Password must be at least 8 characters.', 'error')
             return redirect(url_for('auth.manage_users', tournament_id=selected_tournament_id))
-        if User.query.filter_by(username=username).first():
+        if db.session.query(User.query.filter_by(username=username).exists()).scalar():
             flash('That username is already in use.', 'error')
             return redirect(url_for('auth.manage_users', tournament_id=selected_tournament_id))
 
@@ -215,8 +225,10 @@ def manage_users():
         )
         user.set_password(password)
         db.session.add(user)
+        db.session.flush()
+        user_id = user.id  # read before the commit expires it
         db.session.commit()
-        log_action('user_created', 'user', user.id, {'role': role, 'username': username})
+        log_action('user_created', 'user', user_id, {'role': role, 'username': username})
         db.session.commit()
 
         flash(f'Created user "{username}" ({role}).', 'success')
@@ -225,19 +237,37 @@ def manage_users():
     college_competitors = []
     pro_competitors = []
     if selected_tournament_id:
+        # The link dropdowns show id and display_name only; the college one
+        # needs the team code, joined here instead of lazy-loaded per option.
         college_competitors = CollegeCompetitor.query.filter_by(
             tournament_id=selected_tournament_id,
             status='active'
+        ).options(
+            load_only(CollegeCompetitor.id, CollegeCompetitor.name, CollegeCompetitor.team_id),
+            joinedload(CollegeCompetitor.team).load_only(Team.team_code),
+            lazyload(CollegeCompetitor.identity),
         ).order_by(CollegeCompetitor.name).all()
         pro_competitors = ProCompetitor.query.filter_by(
             tournament_id=selected_tournament_id,
             status='active'
+        ).options(
+            load_only(ProCompetitor.id, ProCompetitor.name),
+            lazyload(ProCompetitor.identity),
         ).order_by(ProCompetitor.name).all()
 
-    users = User.query.order_by(User.created_at.desc()).all()
+    # Only the columns the table shows; password hashes stay in the database.
+    users_query = User.query.options(load_only(
+        User.id, User.username, User.role, User.tournament_id, User.competitor_type,
+        User.competitor_id, User.is_active_user, User.created_at,
+    ))
+    users, newer_url, older_url = _keyset_page(users_query, User, _USERS_PER_PAGE,
+                                               'auth.manage_users',
+                                               {'tournament_id': selected_tournament_id})
     return render_template(
         'auth/users.html',
         users=users,
+        newer_url=newer_url,
+        older_url=older_url,
         tournaments=tournaments,
         selected_tournament_id=selected_tournament_id,
         college_competitors=college_competitors,
@@ -262,12 +292,12 @@ def toggle_user_active(user_id):
         flash('You cannot disable your own account.', 'error')
         return redirect(url_for('auth.manage_users'))
 
-    user.is_active_user = not user.is_active_user
+    user.is_active_user = active = not user.is_active_user
     db.session.commit()
-    log_action('user_toggled_active', 'user', user.id, {'active': user.is_active_user})
+    log_action('user_toggled_active', 'user', user_id, {'active': active})
     db.session.commit()
 
-    state = 'enabled' if user.is_active_user else 'disabled'
+    state = 'enabled' if active else 'disabled'
     flash(f'User "{user.username}" is now {state}.', 'success')
     return redirect(url_for('auth.manage_users', tournament_id=request.form.get('tournament_id', type=int)))
 
@@ -290,6 +320,7 @@ def reset_competitor_pin():
         return redirect(url_for('auth.manage_users', tournament_id=tournament_id))
 
     competitor.portal_pin_hash = None
+    competitor_name = competitor.name
     db.session.commit()
     log_action(
         'competitor_pin_reset',
@@ -299,12 +330,12 @@ def reset_competitor_pin():
             'tournament_id': tournament_id,
             'competitor_type': competitor_type,
             'competitor_id': competitor_id,
-            'competitor_name': competitor.name,
+            'competitor_name': competitor_name,
         }
     )
     db.session.commit()
 
-    flash(f'PIN reset for {competitor.name}. They must set a new PIN on next access.', 'success')
+    flash(f'PIN reset for {competitor_name}. They must set a new PIN on next access.', 'success')
     return redirect(url_for('auth.manage_users', tournament_id=tournament_id))
 
 
@@ -322,10 +353,89 @@ def _load_competitor(tournament_id: int, competitor_type: str, competitor_id: in
     return None
 
 
+def _parse_iso(value: str):
+    """``datetime.fromisoformat`` that returns None for a blank or bad value."""
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _keyset_cursor(prefix: str):
+    """Parse a ``<prefix>_ts`` / ``<prefix>_id`` keyset cursor; None if absent or bad."""
+    try:
+        return (datetime.fromisoformat(request.args[f'{prefix}_ts']),
+                int(request.args[f'{prefix}_id']))
+    except (KeyError, ValueError):
+        return None
+
+
+def _keyset_page(query, model, per_page: int, endpoint: str, url_args: dict):
+    """One page of *query*, newest first, keyed on (created_at, id).
+
+    A page is one range read of per_page + 1 rows, the extra row only saying
+    whether another page exists, so there is no COUNT over the listing and no
+    OFFSET re-reading every skipped row however far back the viewer goes.
+    ``before_*`` pages toward older rows, ``after_*`` back toward newer.
+    Returns ``(rows, newer_url, older_url)``; a URL is None at that end.
+    """
+    position = sa.tuple_(model.created_at, model.id)
+    after = _keyset_cursor('after')
+    before = _keyset_cursor('before')
+    if after is not None:
+        rows = (query.filter(position > after)
+                .order_by(model.created_at, model.id)
+                .limit(per_page + 1).all())
+        has_newer = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_older = True
+    else:
+        if before is not None:
+            query = query.filter(position < before)
+        rows = (query.order_by(model.created_at.desc(), model.id.desc())
+                .limit(per_page + 1).all())
+        has_older = len(rows) > per_page
+        rows = rows[:per_page]
+        has_newer = before is not None
+
+    newer_url = older_url = None
+    if rows and has_newer:
+        newer_url = url_for(endpoint, **url_args,
+                            after_ts=rows[0].created_at.isoformat(), after_id=rows[0].id)
+    if rows and has_older:
+        older_url = url_for(endpoint, **url_args,
+                            before_ts=rows[-1].created_at.isoformat(), before_id=rows[-1].id)
+    return rows, newer_url, older_url
+
+
 # ---------------------------------------------------------------------------
 # #9 — Audit log viewer
 # ---------------------------------------------------------------------------
 
+_AUDIT_FILTERS_KEY = 'audit:filter_options'
+
+
+def _audit_filter_options() -> tuple[list, list]:
+    """Distinct actions and entity types for the audit log dropdowns.
+
+    One DISTINCT over the pair instead of one per column, kept for
+    REPORT_CACHE_TTL_SECONDS. Not invalidated on write: log_action runs on
+    every scoring and payout path, and a new action name only appears when a
+    code path runs for the first time, so the dropdown catching up within the
+    TTL costs nothing. The free-text filter matches new actions immediately.
+    """
+    cached = cache_get(_AUDIT_FILTERS_KEY)
+    if cached is not None:
+        return cached
+    pairs = db.session.query(AuditLog.action, AuditLog.entity_type).distinct().all()
+    options = (sorted({action for action, _ in pairs}),
+               sorted({entity_type for _, entity_type in pairs if entity_type}))
+    ttl = int(current_app.config.get('REPORT_CACHE_TTL_SECONDS', 60))
+    if ttl > 0:
+        cache_set(_AUDIT_FILTERS_KEY, options, ttl)
+    return options
+
+
 @auth_bp.route('/audit')
 @login_required
 def audit_log():
@@ -338,10 +448,9 @@ def audit_log():
     user_id_filter = request.args.get('user_id', '').strip()
     from_filter = request.args.get('from', '').strip()
     to_filter = request.args.get('to', '').strip()
-    page = max(1, int(request.args.get('page', 1) or 1))
     per_page = 50
 
-    query = AuditLog.query.order_by(AuditLog.created_at.desc())
+    query = AuditLog.query
 
     if action_filter:
         escaped = action_filter.replace('%', r'\%').replace('_', r'\_')
@@ -353,38 +462,30 @@ def audit_log():
             query = query.filter(AuditLog.actor_user_id == int(user_id_filter))
         except ValueError:
             pass
-    if from_filter:
-        try:
-            from datetime import datetime
-            query = query.filter(AuditLog.created_at >= datetime.fromisoformat(from_filter))
-        except ValueError:
-            pass
-    if to_filter:
-        try:
-            from datetime import datetime
-            query = query.filter(AuditLog.created_at <= datetime.fromisoformat(to_filter))
-        except ValueError:
-            pass
-
-    total = query.count()
-    entries = query.offset((page - 1) * per_page).limit(per_page).all()
-    total_pages = max(1, (total + per_page - 1) // per_page)
-
-    # Distinct actions and entity types for filter dropdowns
-    distinct_actions = [
-        r[0] for r in db.session.query(AuditLog.action).distinct().order_by(AuditLog.action).all()
-    ]
-    distinct_entity_types = [
-        r[0] for r in db.session.query(AuditLog.entity_type).distinct().order_by(AuditLog.entity_type).all()
-        if r[0]
-    ]
+    from_ts = _parse_iso(from_filter)
+    if from_ts is not None:
+        query = query.filter(AuditLog.created_at >= from_ts)
+    to_ts = _parse_iso(to_filter)
+    if to_ts is not None:
+        query = query.filter(AuditLog.created_at <= to_ts)
+
+    filter_args = {
+        'action': action_filter,
+        'entity_type': entity_type_filter,
+        'user_id': user_id_filter,
+        'from': from_filter,
+        'to': to_filter,
+    }
+    entries, newer_url, older_url = _keyset_page(query, AuditLog, per_page, 'auth.audit_log',
+                                                 filter_args)
+
+    distinct_actions, distinct_entity_types = _audit_filter_options()
 
     return render_template(
         'auth/audit_log.html',
         entries=entries,
-        page=page,
-        total_pages=total_pages,
-        total=total,
+        newer_url=newer_url,
+        older_url=older_url,
         action_filter=action_filter,
         entity_type_filter=entity_type_filter,
         user_id_filter=user_id_filter,
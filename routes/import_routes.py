@@ -26,12 +26,20 @@ from flask import (
 from database import db
 from models import Event, EventResult, ProCompetitor, Tournament
 from services.audit import log_action
+from services.background_jobs import get as get_job
+from services.background_jobs import submit as submit_job
 from services.gear_sharing import build_name_index, parse_gear_sharing_details, resolve_partner_name
 from services.upload_security import malware_scan, save_upload, validate_excel_upload
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _orjson = None
+
 import_pro_bp = Blueprint('import_pro', __name__)
 
 _ALLOWED = {'xlsx', 'xls'}
+_ALLOWED_SUFFIXES = tuple(f'.{ext}' for ext in _ALLOWED)
 
 # Fee lookup: canonical event name -> amount (used when writing entry_fees JSON)
 _EVENT_FEES = {
@@ -58,7 +66,7 @@ _EVENT_FEES = {
 
 
 def _allowed(filename: str) -> bool:
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in _ALLOWED
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
 
 
 def _identity_key(value) -> str:
@@ -81,67 +89,56 @@ def _temp_path(filename: str) -> str:
     return os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
 
 
-# ---------------------------------------------------------------------------
-# GET /import/<id>/pro-entries  — show upload form
-# POST /import/<id>/pro-entries — process uploaded file, redirect to review
-# ---------------------------------------------------------------------------
-@import_pro_bp.route('/<int:tournament_id>/pro-entries', methods=['GET', 'POST'])
-def upload_pro_entries(tournament_id):
-    tournament = Tournament.query.get_or_404(tournament_id)
+def _write_entries(temp_name: str, entries: list) -> None:
+    with open(_temp_path(temp_name), 'wb') as fh:
+        if _orjson is not None:
+            fh.write(_orjson.dumps(entries))
+        else:
+            fh.write(json.dumps(entries, ensure_ascii=False).encode('utf-8'))
 
-    if request.method == 'GET':
-        return render_template('pro/import_upload.html', tournament=tournament)
 
-    # --- POST: receive file ---
-    if 'file' not in request.files:
-        flash('No file selected.', 'error')
-        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+def _read_entries(temp_name: str) -> list:
+    """Parsed entries staged by the upload step. Raises OSError when the
+    file is gone and ValueError when it does not parse."""
+    with open(_temp_path(temp_name), 'rb') as fh:
+        raw = fh.read()
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
 
-    f = request.files['file']
-    if f.filename == '':
-        flash('No file selected.', 'error')
-        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
 
-    if not _allowed(f.filename):
-        flash('File must be an .xlsx or .xls spreadsheet.', 'error')
-        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+def _job_key(tournament_id: int) -> str:
+    return f'pro_import_job_{tournament_id}'
 
-    validation = validate_excel_upload(f, _ALLOWED)
-    if not validation.ok:
-        flash(validation.error, 'error')
-        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
 
-    upload_path = save_upload(f, current_app.config['UPLOAD_FOLDER'], validation.safe_name)
+def _parse_upload_for_job(tournament_id: int, upload_path: str) -> dict:
+    """Background-job entry point: scan and parse an uploaded workbook.
+
+    Stages the parsed entries and the import report next to the upload and
+    returns ``{'temp_name': ..., 'entries': n}``. ``temp_name`` is None when
+    the file held no entries.
+    """
+    from services.pro_entry_importer import compute_review_flags, parse_pro_entries
 
-    # Parse
     try:
         malware_scan(
             upload_path,
             enabled=bool(current_app.config.get('ENABLE_UPLOAD_MALWARE_SCAN', False)),
             command_template=current_app.config.get('MALWARE_SCAN_COMMAND', '')
         )
-        from services.pro_entry_importer import compute_review_flags, parse_pro_entries
         entries = parse_pro_entries(upload_path)
-    except Exception as exc:
-        current_app.logger.exception(
+    except Exception:
+        logger.exception(
             'Pro-entry parse failed for tournament %s upload %s', tournament_id, upload_path,
         )
-        flash(
-            'Could not parse file. Confirm it is a valid .xlsx export from the entry form, '
-            'then try again. If the problem persists, contact admin.',
-            'error',
-        )
-        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+        raise
 
     if not entries:
-        flash('No competitor entries found in the file.', 'warning')
-        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+        return {'temp_name': None, 'entries': 0}
 
     # Run enhanced import pipeline for validation, cross-validation, and report
     import_report_text = ''
     try:
         from services.registration_import import run_import_pipeline, to_entry_dicts
-        import_result = run_import_pipeline(upload_path)
+        import_result = run_import_pipeline(upload_path, raw_entries=entries)
         import_report_text = import_result.report_text()
         # Use enhanced entries (with resolved partners, deduped, etc.)
         if import_result.competitors and not import_result.errors:
@@ -151,14 +148,14 @@ def upload_pro_entries(tournament_id):
 
     # Compute review flags (#18: pass existing competitor names for duplicate detection)
     existing_names = [
-        c.name for c in tournament.pro_competitors.filter_by(status='active').all()
+        name for (name,) in db.session.query(ProCompetitor.name)
+        .filter_by(tournament_id=tournament_id, status='active')
     ]
     compute_review_flags(entries, existing_names=existing_names)
 
     # Persist parsed data and import report to temp JSON files
     temp_name = f'pro_import_{tournament_id}_{uuid.uuid4().hex}.json'
-    with open(_temp_path(temp_name), 'w', encoding='utf-8') as fh:
-        json.dump(entries, fh, ensure_ascii=False)
+    _write_entries(temp_name, entries)
 
     # Store import report alongside parsed data
     report_name = temp_name.replace('.json', '_report.txt')
@@ -169,10 +166,95 @@ def upload_pro_entries(tournament_id):
         except OSError:
             pass
 
+    return {'temp_name': temp_name, 'entries': len(entries)}
+
+
+def _await_parse(tournament, job_id: str):
+    """Review-page response while the upload's parse job is outstanding.
+
+    Shows a waiting page until the job finishes, then either puts the staged
+    file in the session and reloads the review page, or sends the judge back
+    to the upload form.
+    """
+    tournament_id = tournament.id
+    job = get_job(job_id)
+    if not job or int((job.get('metadata') or {}).get('tournament_id', -1)) != tournament_id:
+        session.pop(_job_key(tournament_id), None)
+        flash('No import data found. Please upload the file again.', 'error')
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
+    if job['status'] in ('queued', 'running'):
+        return render_template('pro/import_processing.html', tournament=tournament, job=job)
+
+    session.pop(_job_key(tournament_id), None)
+    if job['status'] != 'completed':
+        flash(
+            'Could not parse file. Confirm it is a valid .xlsx export from the entry form, '
+            'then try again. If the problem persists, contact admin.',
+            'error',
+        )
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
+    result = job['result'] or {}
+    if not result.get('temp_name'):
+        flash('No competitor entries found in the file.', 'warning')
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
     # Store only the filename in the session
-    session[_session_key(tournament_id)] = temp_name
-    log_action('pro_upload_parsed', 'tournament', tournament_id, {'entries': len(entries), 'filename': validation.safe_name})
+    session[_session_key(tournament_id)] = result['temp_name']
+    log_action('pro_upload_parsed', 'tournament', tournament_id,
+               {'entries': result['entries'], 'filename': job['metadata'].get('filename')})
     db.session.commit()
+    return redirect(url_for('import_pro.review_pro_entries', tournament_id=tournament_id))
+
+
+# ---------------------------------------------------------------------------
+# GET /import/<id>/pro-entries  — show upload form
+# POST /import/<id>/pro-entries — process uploaded file, redirect to review
+# ---------------------------------------------------------------------------
+@import_pro_bp.route('/<int:tournament_id>/pro-entries', methods=['GET', 'POST'])
+def upload_pro_entries(tournament_id):
+    tournament = Tournament.query.get_or_404(tournament_id)
+
+    if request.method == 'GET':
+        return render_template('pro/import_upload.html', tournament=tournament)
+
+    # --- POST: receive file ---
+    if 'file' not in request.files:
+        flash('No file selected.', 'error')
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
+    f = request.files['file']
+    if f.filename == '':
+        flash('No file selected.', 'error')
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
+    if not _allowed(f.filename):
+        flash('File must be an .xlsx or .xls spreadsheet.', 'error')
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
+    validation = validate_excel_upload(f, _ALLOWED)
+    if not validation.ok:
+        flash(validation.error, 'error')
+        return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
+
+    upload_path = save_upload(f, current_app.config['UPLOAD_FOLDER'], validation.safe_name)
+
+    # The malware scan and both workbook parses take seconds on a full entry
+    # list, so they run as a background job. The review page waits on it.
+    job_id = submit_job(
+        f'pro_import_parse:{tournament_id}',
+        _parse_upload_for_job,
+        tournament_id,
+        upload_path,
+        metadata={
+            'tournament_id': tournament_id,
+            'kind': 'pro_import_parse',
+            'filename': validation.safe_name,
+        },
+    )
+    session.pop(_session_key(tournament_id), None)
+    session[_job_key(tournament_id)] = job_id
 
     return redirect(url_for('import_pro.review_pro_entries', tournament_id=tournament_id))
 
@@ -186,13 +268,15 @@ def review_pro_entries(tournament_id):
 
     temp_name = session.get(_session_key(tournament_id))
     if not temp_name:
+        job_id = session.get(_job_key(tournament_id))
+        if job_id:
+            return _await_parse(tournament, job_id)
         flash('No import data found. Please upload the file again.', 'error')
         return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
 
     try:
-        with open(_temp_path(temp_name), encoding='utf-8') as fh:
-            entries = json.load(fh)
-    except (OSError, json.JSONDecodeError):
+        entries = _read_entries(temp_name)
+    except (OSError, ValueError):
         flash('Import data is missing or corrupt. Please upload the file again.', 'error')
         session.pop(_session_key(tournament_id), None)
         return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
@@ -234,9 +318,8 @@ def confirm_pro_entries(tournament_id):
         return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
 
     try:
-        with open(_temp_path(temp_name), encoding='utf-8') as fh:
-            entries = json.load(fh)
-    except (OSError, json.JSONDecodeError):
+        entries = _read_entries(temp_name)
+    except (OSError, ValueError):
         flash('Import data is missing or corrupt. Please upload the file again.', 'error')
         session.pop(_session_key(tournament_id), None)
         return redirect(url_for('import_pro.upload_pro_entries', tournament_id=tournament_id))
@@ -249,6 +332,9 @@ def confirm_pro_entries(tournament_id):
     for e in pro_events:
         event_by_name[e.name.strip()] = e
         event_by_name[e.display_name.strip()] = e
+    # Bound once; both are hit for every event of every entry below.
+    event_get = event_by_name.get
+    fee_for = _EVENT_FEES.get
 
     imported = 0
     updated  = 0
@@ -307,6 +393,18 @@ def confirm_pro_entries(tournament_id):
             by_name.setdefault(nkey, comp)
 
     matched_by_name = []
+    written = []
+
+    # (event_id, competitor_id) of every pro result row already on these
+    # events, so the per-event check below is a set lookup, not a query.
+    existing_results = set(
+        db.session.query(EventResult.event_id, EventResult.competitor_id)
+        .filter(
+            EventResult.event_id.in_([e.id for e in pro_events]),
+            EventResult.competitor_type == 'pro',
+        )
+        .all()
+    )
 
     for entry in entries:
         try:
@@ -359,30 +457,33 @@ def confirm_pro_entries(tournament_id):
                 except (ValueError, TypeError):
                     pass
 
-            # ---- Event entry list ----
+            # ---- Event entry list, entry fees and result rows, one pass ----
             # Prefer event IDs when the event exists; fall back to name strings.
             event_ids_or_names = []
+            fees = {}
+            configured = []  # (event_name, Event): these get an EventResult row
             for event_name in entry.get('events', []):
-                ev = event_by_name.get(event_name)
-                event_ids_or_names.append(ev.id if ev else event_name)
+                ev = event_get(event_name)
+                if ev is None:
+                    event_ids_or_names.append(event_name)
+                    fees[event_name] = fee_for(event_name, 0)
+                else:
+                    event_ids_or_names.append(ev.id)
+                    fees[str(ev.id)] = fee_for(event_name, 0)
+                    configured.append((event_name, ev))
+            if entry.get('relay_lottery'):
+                fees['relay'] = 5
             competitor.set_events_entered(event_ids_or_names)
 
             # Refresh mapping payloads on import update to avoid stale keys.
-            competitor.entry_fees = '{}'
+            # The fee map is written whole rather than one key at a time.
+            competitor.entry_fees = json.dumps(fees)
             competitor.partners = '{}'
             competitor.gear_sharing = '{}'
 
-            # ---- Entry fees JSON ----
-            for event_name in entry.get('events', []):
-                ev  = event_by_name.get(event_name)
-                key = str(ev.id) if ev else event_name
-                competitor.set_entry_fee(key, _EVENT_FEES.get(event_name, 0))
-            if entry.get('relay_lottery'):
-                competitor.set_entry_fee('relay', 5)
-
             # ---- Partners JSON ----
             for event_name, partner_name in entry.get('partners', {}).items():
-                ev  = event_by_name.get(event_name)
+                ev  = event_get(event_name)
                 key = str(ev.id) if ev else event_name
                 canonical_partner = resolve_partner_name(partner_name, name_index)
                 if canonical_partner:
@@ -428,29 +529,9 @@ def confirm_pro_entries(tournament_id):
             # of the same person later in this same upload updates this row
             # rather than adding a third one.
             _remember(competitor)
-
-            db.session.flush()  # ensure competitor.id is available
-
-            # ---- EventResult records (only when event exists in tournament) ----
-            for event_name in entry.get('events', []):
-                ev = event_by_name.get(event_name)
-                if ev is None:
-                    continue  # event not yet configured — skip result row
-                existing_result = EventResult.query.filter_by(
-                    event_id=ev.id,
-                    competitor_id=competitor.id,
-                    competitor_type='pro'
-                ).first()
-                if not existing_result:
-                    partner_name = entry.get('partners', {}).get(event_name)
-                    db.session.add(EventResult(
-                        event_id=ev.id,
-                        competitor_id=competitor.id,
-                        competitor_type='pro',
-                        competitor_name=competitor.display_name,
-                        partner_name=partner_name,
-                        status='pending',
-                    ))
+            # Result rows need competitor.id, which new rows only have after
+            # the flush below, so they are written in a second pass.
+            written.append((competitor, configured, entry.get('partners', {})))
 
             if is_new:
                 imported += 1
@@ -461,6 +542,26 @@ def confirm_pro_entries(tournament_id):
             errors.append(f"{entry.get('name', 'Unknown')}: {exc}")
 
     try:
+        db.session.flush()  # one INSERT pass for every new competitor
+
+        # ---- EventResult records (only when event exists in tournament) ----
+        result_rows = []
+        for competitor, configured, entry_partners in written:
+            for event_name, ev in configured:
+                if (ev.id, competitor.id) in existing_results:
+                    continue
+                existing_results.add((ev.id, competitor.id))
+                result_rows.append({
+                    'event_id': ev.id,
+                    'competitor_id': competitor.id,
+                    'competitor_type': 'pro',
+                    'competitor_name': competitor.display_name,
+                    'partner_name': entry_partners.get(event_name),
+                    'status': 'pending',
+                })
+        if result_rows:
+            db.session.bulk_insert_mappings(EventResult, result_rows)
+
         db.session.commit()
     except Exception as exc:
         db.session.rollback()
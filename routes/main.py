@@ -1,18 +1,21 @@
 """
 Main routes for dashboard and navigation.
 """
+import heapq
 import json
 import logging
 import time
 from urllib.parse import urlsplit
 
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
+from sqlalchemy import select
 from sqlalchemy import text as sql_text
+from sqlalchemy.orm import lazyload
 
 import strings as text
 from config import TournamentStatus
 from database import db
-from models import Event, Flight, Heat, HeatAssignment, Tournament
+from models import Event, EventResult, Flight, Heat, HeatAssignment, Team, Tournament
 from models.competitor import CollegeCompetitor, ProCompetitor
 from services.audit import log_action
 
@@ -185,6 +188,17 @@ def _safe_redirect_target(target: str | None):
     return target
 
 
+def _newest_active(tournaments):
+    """First active tournament in a newest-first list, or None.
+
+    The landing pages already load every tournament for their picker, so
+    the active one is taken from that list rather than a second query.
+    """
+    return next(
+        (t for t in tournaments if t.status in TournamentStatus.ACTIVE_STATUSES), None
+    )
+
+
 @main_bp.route('/')
 def index():
     """Public entry page where users choose judge/competitor/spectator mode."""
@@ -193,13 +207,10 @@ def index():
     ):
         return redirect(url_for('main.judge_dashboard'))
 
-    active_tournament = Tournament.query.filter(
-        Tournament.status.in_(TournamentStatus.ACTIVE_STATUSES)
-    ).order_by(Tournament.year.desc()).first()
     tournaments = Tournament.query.order_by(Tournament.year.desc()).all()
     return render_template(
         'role_entry.html',
-        active_tournament=active_tournament,
+        active_tournament=_newest_active(tournaments),
         tournaments=tournaments,
     )
 
@@ -208,13 +219,10 @@ def index():
 def judge_dashboard():
     """Judge dashboard - show active tournament or tournament selection."""
     tournaments = Tournament.query.order_by(Tournament.year.desc()).all()
-    active_tournament = Tournament.query.filter(
-        Tournament.status.in_(TournamentStatus.ACTIVE_STATUSES)
-    ).first()
 
     return render_template('dashboard.html',
                            tournaments=tournaments,
-                           active_tournament=active_tournament)
+                           active_tournament=_newest_active(tournaments))
 
 
 @main_bp.route('/language/<lang_code>')
@@ -293,19 +301,8 @@ def tournament_detail(tournament_id):
     """Tournament detail and management page."""
     tournament = Tournament.query.get_or_404(tournament_id)
 
-    from models.wood_config import WoodConfig
     # Get summary statistics
-    flights_built = Flight.query.filter_by(tournament_id=tournament_id).count() > 0
-    stats = {
-        'college_teams': tournament.college_team_count,
-        'college_competitors': tournament.college_competitor_count,
-        'pro_competitors': tournament.pro_competitor_count,
-        'events': tournament.events.count(),
-        'completed_events': tournament.events.filter_by(status='completed').count(),
-        'heats_generated': Heat.query.join(Event).filter(Event.tournament_id == tournament_id).count(),
-        'wood_configured': WoodConfig.query.filter_by(tournament_id=tournament_id).first() is not None,
-        'flights_built': flights_built,
-    }
+    stats = tournament.summary_counts()
 
     return render_template('tournament_detail.html',
                            tournament=tournament,
@@ -492,20 +489,22 @@ def delete_tournament(tournament_id):
 
     try:
         # Clear heat assignments that are not ORM-linked for cascade delete.
-        event_ids = [eid for (eid,) in tournament.events.with_entities(Event.id).all()]
-        if event_ids:
-            heat_ids = [hid for (hid,) in Heat.query.filter(Heat.event_id.in_(event_ids)).with_entities(Heat.id).all()]
-            if heat_ids:
-                HeatAssignment.query.filter(HeatAssignment.heat_id.in_(heat_ids)).delete(synchronize_session=False)
+        # The id sets stay subqueries so the database resolves them inside
+        # each statement instead of round-tripping them through Python.
+        tournament_heats = (select(Heat.id)
+                            .join(Event, Heat.event_id == Event.id)
+                            .where(Event.tournament_id == tournament_id))
+        HeatAssignment.query.filter(HeatAssignment.heat_id.in_(tournament_heats)).delete(
+            synchronize_session=False
+        )
 
         # Remove flight references before deleting flights.
-        flight_ids = [fid for (fid,) in Flight.query.filter_by(tournament_id=tournament_id).with_entities(Flight.id).all()]
-        if flight_ids:
-            Heat.query.filter(Heat.flight_id.in_(flight_ids)).update(
-                {Heat.flight_id: None},
-                synchronize_session=False
-            )
-            Flight.query.filter(Flight.id.in_(flight_ids)).delete(synchronize_session=False)
+        tournament_flights = select(Flight.id).where(Flight.tournament_id == tournament_id)
+        Heat.query.filter(Heat.flight_id.in_(tournament_flights)).update(
+            {Heat.flight_id: None},
+            synchronize_session=False
+        )
+        Flight.query.filter_by(tournament_id=tournament_id).delete(synchronize_session=False)
 
         log_action('tournament_deleted', 'tournament', tournament.id, {
             'tournament_id': tournament.id,
@@ -533,24 +532,14 @@ def college_dashboard(tournament_id):
     tournament = Tournament.query.get_or_404(tournament_id)
 
     teams = tournament.teams.all()
+    Team.prime_roster_counts(tournament_id)
     events = tournament.events.filter_by(event_type='college').all()
 
-    # Get top performers
-    bull = tournament.get_bull_of_woods(5)
-    belle = tournament.get_belle_of_woods(5)
+    # Get top performers. The cards print display_name and points; the
+    # contact details on the identity row are never read here.
+    bull, belle = tournament.get_top_competitors_by_gender(
+        5, options=(lazyload(CollegeCompetitor.identity),))
     team_standings = tournament.get_team_standings()[:5]
-    completed_events = tournament.events.filter_by(event_type='college', status='completed').all()
-    live_event_leaders = []
-    for event in completed_events:
-        winner = event.results.filter_by(final_position=1).first()
-        if winner:
-            live_event_leaders.append({
-                'event_name': event.display_name,
-                'competitor': winner.competitor_name,
-                'result': winner.result_value,
-                'scoring_type': event.scoring_type,
-            })
-    live_event_leaders = live_event_leaders[:5]
 
     return render_template('college/dashboard.html',
                            tournament=tournament,
@@ -558,8 +547,7 @@ def college_dashboard(tournament_id):
                            events=events,
                            bull=bull,
                            belle=belle,
-                           team_standings=team_standings,
-                           live_event_leaders=live_event_leaders)
+                           team_standings=team_standings)
 
 
 @main_bp.route('/tournament/<int:tournament_id>/pro')
@@ -571,21 +559,8 @@ def pro_dashboard(tournament_id):
     events = tournament.events.filter_by(event_type='pro').all()
 
     # Calculate fee summary
-    total_fees = sum(c.total_fees_owed for c in competitors)
-    collected_fees = sum(c.total_fees_paid for c in competitors)
-    top_earners = sorted(competitors, key=lambda c: c.total_earnings, reverse=True)[:5]
-    completed_events = tournament.events.filter_by(event_type='pro', status='completed').all()
-    live_event_leaders = []
-    for event in completed_events:
-        winner = event.results.filter_by(final_position=1).first()
-        if winner:
-            live_event_leaders.append({
-                'event_name': event.display_name,
-                'competitor': winner.competitor_name,
-                'result': winner.result_value,
-                'scoring_type': event.scoring_type,
-            })
-    live_event_leaders = live_event_leaders[:5]
+    total_fees, collected_fees = ProCompetitor.sum_fee_totals(competitors)
+    top_earners = heapq.nlargest(5, competitors, key=lambda c: c.total_earnings)
 
     # Which scratched competitors can still be undone.  Without this the
     # 30-minute undo window is unreachable from anywhere in the product:
@@ -601,11 +576,12 @@ def pro_dashboard(tournament_id):
                            tournament=tournament,
                            competitors=competitors,
                            events=events,
+                           result_counts=Event.result_counts([e.id for e in events]),
+                           heat_counts=Event.heat_counts([e.id for e in events]),
                            total_fees=total_fees,
                            collected_fees=collected_fees,
                            top_earners=top_earners,
-                           undoable_scratch_ids=undoable_scratch_ids,
-                           live_event_leaders=live_event_leaders)
+                           undoable_scratch_ids=undoable_scratch_ids)
 
 
 # ---------------------------------------------------------------------------
@@ -627,7 +603,6 @@ def clone_tournament(tournament_id):
     db.session.flush()
 
     # Copy teams. school_abbreviation is NOT NULL on Team — must be copied.
-    from models.team import Team
     team_id_map = {}
     for team in source.teams.all():
         new_team = Team(
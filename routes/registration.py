@@ -91,6 +91,7 @@ def college_registration(tournament_id):
     """College team registration page."""
     tournament = Tournament.query.get_or_404(tournament_id)
     all_teams = tournament.teams.all()
+    Team.prime_roster_counts(tournament_id)
     valid_teams = [t for t in all_teams if t.status != 'invalid']
     invalid_teams = [t for t in all_teams if t.status == 'invalid']
 
@@ -3,6 +3,7 @@ Reporting routes for standings, results, and exports.
 """
 import json
 import os
+import sqlite3
 import tempfile
 
 from flask import (
@@ -18,6 +19,7 @@ from flask import (
     send_file,
     url_for,
 )
+from sqlalchemy.orm import selectinload
 
 try:
     from flask_login import current_user
@@ -31,6 +33,7 @@ from database import db
 from models import Event, Tournament
 from services.audit import log_action
 from services.background_jobs import get as get_job
+from services.backup import discard_sqlite_sidecars, snapshot_sqlite
 from services.print_catalog import record_print
 from services.report_cache import get as cache_get
 from services.report_cache import set as cache_set
@@ -148,18 +151,20 @@ def college_standings(tournament_id):
     """
     tournament = Tournament.query.get_or_404(tournament_id)
 
-    payload = _cached_payload(
-        f'reports:{tournament_id}:college_standings',
-        lambda: {
-            'bull': _serialize_competitors(tournament.get_bull_of_woods(10)),
-            'belle': _serialize_competitors(tournament.get_belle_of_woods(10)),
-            'bull_tiebreak': _serialize_bull_belle(
-                tournament.get_bull_belle_with_tiebreak_data('M', 10)),
-            'belle_tiebreak': _serialize_bull_belle(
-                tournament.get_bull_belle_with_tiebreak_data('F', 10)),
+    def _build():
+        # The tiebreak rows carry the same competitors in the same order as
+        # get_bull_of_woods, so the plain lists are read off them.
+        bull = tournament.get_bull_belle_with_tiebreak_data('M', 10)
+        belle = tournament.get_bull_belle_with_tiebreak_data('F', 10)
+        return {
+            'bull': _serialize_competitors([row['competitor'] for row in bull]),
+            'belle': _serialize_competitors([row['competitor'] for row in belle]),
+            'bull_tiebreak': _serialize_bull_belle(bull),
+            'belle_tiebreak': _serialize_bull_belle(belle),
             'team_standings': _serialize_teams(tournament.get_team_standings()),
         }
-    )
+
+    payload = _cached_payload(f'reports:{tournament_id}:college_standings', _build)
 
     # Events that are not finalized but have at least one completed result —
     # these mean standings may be incomplete / provisional.
@@ -198,8 +203,7 @@ def college_standings_print(tournament_id):
     """Printable version of college standings."""
     tournament = Tournament.query.get_or_404(tournament_id)
 
-    bull = tournament.get_bull_of_woods(5)
-    belle = tournament.get_belle_of_woods(5)
+    bull, belle = tournament.get_top_competitors_by_gender(5)
     team_standings = tournament.get_team_standings()[:5]
 
     return render_template('reports/college_standings_print.html',
@@ -331,8 +335,10 @@ def all_results(tournament_id):
     """View all event results for the tournament."""
     tournament = Tournament.query.get_or_404(tournament_id)
 
-    college_events = tournament.events.filter_by(event_type='college', status='completed').all()
-    pro_events = tournament.events.filter_by(event_type='pro', status='completed').all()
+    completed = tournament.events.filter_by(status='completed').options(
+        selectinload(Event.results_by_position))
+    college_events = completed.filter_by(event_type='college').all()
+    pro_events = completed.filter_by(event_type='pro').all()
 
     return render_template('reports/all_results.html',
                            tournament=tournament,
@@ -346,8 +352,10 @@ def all_results_print(tournament_id):
     """Printable version of all results."""
     tournament = Tournament.query.get_or_404(tournament_id)
 
-    college_events = tournament.events.filter_by(event_type='college', status='completed').all()
-    pro_events = tournament.events.filter_by(event_type='pro', status='completed').all()
+    completed = tournament.events.filter_by(status='completed').options(
+        selectinload(Event.results_by_position))
+    college_events = completed.filter_by(event_type='college').all()
+    pro_events = completed.filter_by(event_type='pro').all()
 
     return render_template('reports/all_results_print.html',
                            tournament=tournament,
@@ -548,9 +556,26 @@ def backup_database(tournament_id):
         return redirect(url_for('main.tournament_detail', tournament_id=tournament_id))
 
     db_path = backup_plan['path']
+    fd, snapshot = tempfile.mkstemp(prefix='proam_backup_', suffix='.db')
+    os.close(fd)
+    try:
+        snapshot_sqlite(db_path, snapshot)
+    except sqlite3.Error as exc:
+        os.remove(snapshot)
+        flash(f'Backup failed: {exc}', 'error')
+        return redirect(url_for('main.tournament_detail', tournament_id=tournament_id))
     log_action('database_backup_downloaded', 'tournament', tournament_id, {'path': db_path})
     db.session.commit()
-    return send_file(db_path, as_attachment=True, download_name=f'proam_backup_{tournament_id}.db')
+
+    @after_this_request
+    def cleanup_file(response):
+        try:
+            os.remove(snapshot)
+        except OSError:
+            pass
+        return response
+
+    return send_file(snapshot, as_attachment=True, download_name=f'proam_backup_{tournament_id}.db')
 
 
 @reporting_bp.route('/<int:tournament_id>/restore', methods=['POST'])
@@ -595,6 +620,7 @@ def restore_database(tournament_id):
         db_path = restore_plan['target_path']
         db.session.remove()
         db.engine.dispose()
+        discard_sqlite_sidecars(db_path)
         os.replace(temp_path, db_path)
         log_action('database_restored', 'tournament', tournament_id, {'target_path': db_path})
         db.session.commit()
@@ -690,8 +716,7 @@ def fee_tracker(tournament_id):
     # Sort: outstanding balance descending (those who owe most shown first)
     competitor_data.sort(key=lambda x: x['competitor'].fees_balance, reverse=True)
 
-    total_owed = sum(d['competitor'].total_fees_owed for d in competitor_data)
-    total_paid = sum(d['competitor'].total_fees_paid for d in competitor_data)
+    total_owed, total_paid = ProCompetitor.sum_fee_totals(d['competitor'] for d in competitor_data)
     total_outstanding = total_owed - total_paid
 
     return render_template(
@@ -26,6 +26,7 @@ from config import LIST_ONLY_EVENT_NAMES
 from database import db
 from models import Event, Flight, Heat, HeatAssignment, Tournament
 from models.competitor import CollegeCompetitor, ProCompetitor
+from services.heat_generator import _competitor_entered_event
 
 scheduling_bp = Blueprint('scheduling', __name__)
 
@@ -94,38 +95,6 @@ def _signed_up_competitors(event: Event) -> list:
     return sorted(signed, key=lambda c: c.name.lower())
 
 
-def _competitor_entered_event(event: Event, entered_events: list) -> bool:
-    entered = entered_events if isinstance(entered_events, list) else []
-    target_id = str(event.id)
-    target_name = _normalize_name(event.name)
-    target_display_name = _normalize_name(event.display_name)
-    aliases = {target_name, target_display_name}
-
-    # Backward-compatible aliases for historic imports and form-label variants.
-    if event.event_type == 'pro':
-        if target_name == 'springboard':
-            aliases.update({'springboardl', 'springboardr'})
-        elif target_name in {'pro1board', '1boardspringboard'}:
-            aliases.update({'intermediate1boardspringboard', 'pro1board', '1boardspringboard'})
-        elif target_name == 'jackjillsawing':
-            aliases.update({'jackjill', 'jackandjill'})
-        elif target_name in {'poleclimb', 'speedclimb'}:
-            aliases.update({'poleclimb', 'speedclimb'})
-        elif target_name == 'partneredaxethrow':
-            aliases.update({'partneredaxethrow', 'axethrow'})
-
-    for raw in entered:
-        value = str(raw).strip()
-        if not value:
-            continue
-        if value == target_id:
-            return True
-        normalized = _normalize_name(value)
-        if normalized in aliases:
-            return True
-    return False
-
-
 def _resolve_partner_name(competitor, event: Event) -> str:
     partners = competitor.get_partners() if hasattr(competitor, 'get_partners') else {}
     if not isinstance(partners, dict):
@@ -33,10 +33,9 @@ from . import (
 
 def _snapshot_flights(tournament_id: int) -> dict:
     """Capture per-flight heat counts for the build-diff modal."""
-    snapshot = {}
-    for fl in Flight.query.filter_by(tournament_id=tournament_id).all():
-        snapshot[fl.flight_number] = len(fl.get_heats_ordered())
-    return snapshot
+    flights = Flight.query.filter_by(tournament_id=tournament_id).all()
+    heats_by_flight = Flight.ordered_heats(fl.id for fl in flights)
+    return {fl.flight_number: len(heats_by_flight[fl.id]) for fl in flights}
 
 
 def _resolve_num_flights_from_form(tournament, form):
@@ -88,10 +88,11 @@ def flight_list(tournament_id):
 
     # Pre-fetch competitor names + stand assignments for display.
     # Preserve flight sequence order so the displayed opener matches the actual show order.
+    heats_by_flight = Flight.ordered_heats(f.id for f in flights)
     flight_data = []
     for flight in flights:
         heat_rows = []
-        for heat in flight.get_heats_ordered():
+        for heat in heats_by_flight[flight.id]:
             event = Event.query.get(heat.event_id)
             if not event:
                 continue
@@ -519,6 +520,8 @@ def build_flights(tournament_id):
     return render_template('pro/build_flights.html',
                            tournament=tournament,
                            events=pro_events,
+                           heat_counts=Event.heat_counts([e.id for e in pro_events]),
+                           result_counts=Event.result_counts([e.id for e in pro_events]),
                            total_heats=total_heats,
                            flight_sizing=sizing,
                            flight_count_min=FLIGHT_COUNT_MIN,
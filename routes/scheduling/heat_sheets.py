@@ -181,9 +181,11 @@ def heat_sheets(tournament_id):
         .all()
     )
 
+    heats_by_flight = Flight.ordered_heats(f.id for f in flights)
+
     flight_data = []
     for flight in flights:
-        heats_in_flight = flight.get_heats_ordered()
+        heats_in_flight = heats_by_flight[flight.id]
         heat_rows = []
         for heat in heats_in_flight:
             comp_ids = heat.get_competitors()
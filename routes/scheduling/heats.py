@@ -5,6 +5,7 @@ move_competitor_between_heats, scratch_competitor.
 
 from flask import abort, flash, redirect, render_template, request, url_for
 from flask_login import current_user
+from sqlalchemy.orm import undefer_group
 
 import config
 import strings as text
@@ -144,7 +145,7 @@ def generate_heats(tournament_id, event_id):
                     ProCompetitor.id.in_(enrolled_ids),
                     ProCompetitor.tournament_id == tournament_id,
                     ProCompetitor.status == 'active',
-                ).all()
+                ).options(undefer_group('import_text')).all()
                 if str(getattr(c, 'gear_sharing_details', '') or '').strip()
                 and not c.get_gear_sharing()
             ]
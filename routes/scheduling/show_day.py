@@ -17,9 +17,11 @@ def show_day(tournament_id):
     tournament = Tournament.query.get_or_404(tournament_id)
     flights = Flight.query.filter_by(tournament_id=tournament_id).order_by(Flight.flight_number).all()
 
+    heats_by_flight = Flight.ordered_heats(f.id for f in flights)
+
     flight_data = []
     for flight in flights:
-        heats_ordered = flight.get_heats_ordered()
+        heats_ordered = heats_by_flight[flight.id]
         total = len(heats_ordered)
         completed = sum(1 for h in heats_ordered if h.status == 'completed')
         in_progress = sum(1 for h in heats_ordered if h.status == 'in_progress')
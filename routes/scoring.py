@@ -884,11 +884,7 @@ def undo_heat_save(tournament_id, heat_id):
                     .filter(CollegeCompetitor.id.in_(competitor_ids))
                     .all()
                 )
-                touched_team_ids = {c.team_id for c in touched_comps if c.team_id}
-                for team_id in touched_team_ids:
-                    team = Team.query.get(team_id)
-                    if team:
-                        team.recalculate_points()
+                Team.bulk_recalculate(team_ids={c.team_id for c in touched_comps if c.team_id})
 
             heat.status = 'pending'
             event.status = 'in_progress'
@@ -1884,15 +1880,12 @@ def repair_points(tournament_id):
     competitors = CollegeCompetitor.query.filter_by(tournament_id=tournament_id).all()
     competitor_ids = [c.id for c in competitors]
 
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
-
     try:
         with db.session.begin_nested():
             # Rebuild every competitor's individual_points from SUM.
             _rebuild_individual_points(competitor_ids)
             # Then rebuild every team's total_points from its members.
-            for team in teams:
-                team.recalculate_points()
+            teams_rebuilt = Team.bulk_recalculate(tournament_id=tournament_id)
         db.session.commit()
     except Exception as exc:
         db.session.rollback()
@@ -1904,7 +1897,7 @@ def repair_points(tournament_id):
     invalidate_tournament_caches(tournament_id)
     log_action('points_cache_rebuilt', 'tournament', tournament_id, {
         'competitors_rebuilt': len(competitor_ids),
-        'teams_rebuilt': len(teams),
+        'teams_rebuilt': teams_rebuilt,
         'judge_user_id': _current_user_id(),
     })
 
@@ -1913,7 +1906,7 @@ def repair_points(tournament_id):
         'tournament_id': tournament_id,
         'tournament_name': tournament.name,
         'competitors_rebuilt': len(competitor_ids),
-        'teams_rebuilt': len(teams),
+        'teams_rebuilt': teams_rebuilt,
         'message': (f'Rebuilt {len(competitor_ids)} competitor(s) and '
-                    f'{len(teams)} team(s) for {tournament.name}.'),
+                    f'{teams_rebuilt} team(s) for {tournament.name}.'),
     })
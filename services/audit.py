@@ -3,6 +3,7 @@ import json
 import logging
 from datetime import datetime
 
+import sqlalchemy as sa
 from flask import request
 
 try:
@@ -34,6 +35,27 @@ def _supports_independent_write() -> bool:
         return False
 
 
+def _actor_id():
+    """Return the signed-in user's id without loading the user row.
+
+    Callers log after they commit, and the commit expires ``current_user``
+    along with everything else in the session. Reading ``.id`` off an expired
+    instance refreshes it: a SELECT, and on PostgreSQL a transaction the
+    caller's following ``commit()`` then has to close, all for a value the
+    identity map already holds.
+    """
+    try:
+        user = getattr(current_user, '_get_current_object', lambda: current_user)()
+        # A mapped User with an identity is a signed-in user; asking
+        # is_authenticated first would itself refresh the expired row.
+        state = sa.inspect(user, raiseerr=False)
+        if state is not None and state.identity:
+            return state.identity[0]
+        return user.id if getattr(user, 'is_authenticated', False) else None
+    except Exception:
+        return None
+
+
 def log_action(action: str, entity_type: str, entity_id: int | None = None, details: dict | None = None) -> None:
     """Append an audit log record on its own connection.
 
@@ -75,10 +97,7 @@ def log_action(action: str, entity_type: str, entity_id: int | None = None, deta
     which is where payout settlement, fee payment and Saturday ordering actually
     run, and PostgreSQL is where the durable write applies.
     """
-    try:
-        actor_id = current_user.id if getattr(current_user, 'is_authenticated', False) else None
-    except Exception:
-        actor_id = None
+    actor_id = _actor_id()
 
     try:
         ip_address = request.headers.get('X-Forwarded-For', request.remote_addr)
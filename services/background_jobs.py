@@ -1,7 +1,27 @@
-"""In-process background job execution for long-running tasks."""
+"""Background job execution for long-running tasks.
+
+Jobs run on an in-process thread pool by default. When REDIS_URL is set and
+the optional ``rq``/``redis`` packages are installed, they are handed to an
+RQ queue instead, so schedule builds and exports run in a separate worker
+process rather than competing with request threads for the GIL:
+
+    rq worker proam --url "$REDIS_URL"
+
+The worker must see the same database and the same filesystem as the web
+process (export jobs return a path the web process later serves), so run it
+in the same container or against a shared volume. Job status lives in the
+``background_jobs`` table either way, which is what ``get`` reads for jobs
+this process did not run.
+
+Anything RQ cannot take falls back to the thread pool: a lambda or a
+function defined inside another function (RQ re-imports the callable by
+dotted name in the worker), or an enqueue that fails because Redis is
+unreachable.
+"""
 from __future__ import annotations
 
 import json
+import logging
 import threading
 import uuid
 from concurrent.futures import ThreadPoolExecutor
@@ -11,14 +31,31 @@ from database import db
 from models.background_job import BackgroundJob
 from services.time_utils import utc_now_naive
 
+logger = logging.getLogger(__name__)
+
+RQ_QUEUE_NAME = 'proam'
+
 _executor = ThreadPoolExecutor(max_workers=2)
 _jobs = {}
 _lock = threading.Lock()
 _app = None
+_queue = None
+
+
+def _rq_queue(redis_url: str):
+    """Return an RQ queue for *redis_url*, or None if rq/redis are missing."""
+    try:
+        from redis import Redis
+        from rq import Queue
+    except ImportError:
+        logger.warning('REDIS_URL is set but rq/redis are not installed; '
+                       'background jobs stay on the in-process thread pool.')
+        return None
+    return Queue(RQ_QUEUE_NAME, connection=Redis.from_url(redis_url))
 
 
-def configure(max_workers: int, app=None) -> None:
-    global _app, _executor
+def configure(max_workers: int, app=None, redis_url: str | None = None) -> None:
+    global _app, _executor, _queue
     if max_workers < 1:
         max_workers = 1
     try:
@@ -28,6 +65,7 @@ def configure(max_workers: int, app=None) -> None:
     _executor = ThreadPoolExecutor(max_workers=max_workers)
     if app is not None:
         _app = app
+    _queue = _rq_queue(redis_url) if redis_url else None
 
 
 def _run_with_app_context(fn, *args, **kwargs):
@@ -143,6 +181,12 @@ def submit(label: str, fn, *args, metadata: dict | None = None, **kwargs) -> str
         metadata=dict(metadata or {}),
     )
 
+    if _enqueue_remote(job_id, fn, args, kwargs):
+        # The worker owns the job from here; get() reads its row.
+        with _lock:
+            _jobs.pop(job_id, None)
+        return job_id
+
     future = _executor.submit(_run_with_app_context, fn, *args, **kwargs)
 
     def _done_callback(done_future):
@@ -177,6 +221,40 @@ def submit(label: str, fn, *args, metadata: dict | None = None, **kwargs) -> str
     return job_id
 
 
+def _enqueue_remote(job_id: str, fn, args: tuple, kwargs: dict) -> bool:
+    """Hand the job to RQ. False means run it on the thread pool instead."""
+    if _queue is None or _app is None:
+        return False
+    # Lambdas and nested functions ('<lambda>', 'f.<locals>.g') have no
+    # dotted name a worker could import.
+    if '<' in getattr(fn, '__qualname__', '<'):
+        return False
+    try:
+        _queue.enqueue(run_queued_job, args=(job_id, fn, *args), kwargs=kwargs,
+                       job_id=job_id)
+    except Exception as exc:
+        logger.warning('RQ enqueue failed for %s, running in-process: %s', job_id, exc)
+        return False
+    return True
+
+
+def run_queued_job(job_id: str, fn, *args, **kwargs):
+    """RQ worker entry point: run *fn* and record the outcome on the job row."""
+    if _app is None:
+        # First job in this worker process. Building the app configures this
+        # module (configure() is called from the factory) with its app.
+        from app import create_app
+        create_app()
+    _persist_job(job_id, status='running', started_at=utc_now_naive())
+    try:
+        result = _run_with_app_context(fn, *args, **kwargs)
+    except Exception as exc:
+        _persist_job(job_id, status='failed', finished_at=utc_now_naive(), error=str(exc))
+        raise
+    _persist_job(job_id, status='completed', finished_at=utc_now_naive(), result=result)
+    return result
+
+
 def get(job_id: str) -> dict | None:
     with _lock:
         job = _jobs.get(job_id)
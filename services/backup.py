@@ -34,6 +34,77 @@ def _timestamp() -> str:
     return utc_timestamp_for_filename()
 
 
+def checkpoint_sqlite(db_path: str) -> None:
+    """Fold the SQLite write-ahead log back into *db_path*.
+
+    The app opens SQLite in WAL mode (see _set_sqlite_pragma in app.py), so
+    recently committed pages can live in the ``-wal`` sidecar rather than the
+    main file. Call this before copying or sending the raw .db file or the
+    copy can be missing the latest scores. A no-op for non-WAL files; a
+    missing or unreadable file is left for the copy itself to report.
+    """
+    import sqlite3
+    from pathlib import Path
+
+    # mode=rw: never create an empty database where the caller expected one.
+    uri = Path(db_path).resolve().as_uri() + '?mode=rw'
+    try:
+        conn = sqlite3.connect(uri, uri=True)
+    except sqlite3.Error:
+        return
+    try:
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    except sqlite3.DatabaseError as exc:
+        logger.warning('WAL checkpoint skipped for %s: %s', db_path, exc)
+    finally:
+        conn.close()
+
+
+def snapshot_sqlite(db_path: str, dest_path: str) -> None:
+    """Write a consistent copy of the SQLite database *db_path* to *dest_path*.
+
+    Uses SQLite's online backup API rather than copying the file. The app
+    runs SQLite in WAL mode, so the raw .db file alone can be missing
+    committed pages, and a checkpoint before a file copy can come back busy
+    or be overtaken by a write before the copy finishes. The backup API
+    reads one snapshot through the log and restarts if a write lands
+    mid-copy. The copy is switched to a rollback journal so it is a single
+    self-contained file. Raises ``sqlite3.Error`` on failure.
+    """
+    import sqlite3
+    from pathlib import Path
+
+    # mode=rw: never create an empty database where the caller expected one.
+    uri = Path(db_path).resolve().as_uri() + '?mode=rw'
+    source = sqlite3.connect(uri, uri=True)
+    try:
+        dest = sqlite3.connect(dest_path)
+        try:
+            source.backup(dest)
+            dest.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            dest.close()
+    finally:
+        source.close()
+
+
+def discard_sqlite_sidecars(db_path: str) -> None:
+    """Checkpoint *db_path* and remove its ``-wal``/``-shm`` files.
+
+    Used right before a restore swaps a different file in at *db_path*:
+    SQLite would otherwise replay the old database's log over the new one.
+    Callers must have disposed the engine first so no pooled connection
+    still holds the sidecars open.
+    """
+    if os.path.exists(db_path):
+        checkpoint_sqlite(db_path)
+    for suffix in ('-wal', '-shm'):
+        try:
+            os.remove(db_path + suffix)
+        except FileNotFoundError:
+            pass
+
+
 def is_postgres(uri: str) -> bool:
     """Return True if the database URI points to PostgreSQL."""
     return uri.startswith('postgresql://') or uri.startswith('postgres://')
@@ -235,7 +306,16 @@ def backup_to_s3(db_path: str, tournament_id: int) -> dict:
 
     prefix = os.environ.get('BACKUP_S3_PREFIX', 'proam-backups').strip().rstrip('/')
     key = f'{prefix}/tournament_{tournament_id}/proam_{_timestamp()}.db'
-    return _upload_to_s3(db_path, key)
+    fd, snapshot = tempfile.mkstemp(suffix='.db', prefix='proam_backup_')
+    os.close(fd)
+    try:
+        snapshot_sqlite(db_path, snapshot)
+        return _upload_to_s3(snapshot, key)
+    except Exception as exc:
+        logger.error('SQLite snapshot for S3 failed: %s', exc)
+        return {'ok': False, 'error': str(exc)}
+    finally:
+        os.unlink(snapshot)
 
 
 def backup_to_local(db_path: str, dest_dir: str, tournament_id: int) -> dict:
@@ -244,7 +324,7 @@ def backup_to_local(db_path: str, dest_dir: str, tournament_id: int) -> dict:
         os.makedirs(dest_dir, exist_ok=True)
         filename = f'proam_t{tournament_id}_{_timestamp()}.db'
         dest = os.path.join(dest_dir, filename)
-        shutil.copy2(db_path, dest)
+        snapshot_sqlite(db_path, dest)
         size = os.path.getsize(dest)
         logger.info('Local DB backup saved to %s (%d bytes)', dest, size)
         return {'ok': True, 'dest': dest, 'size_bytes': size, 'error': None}
@@ -1080,13 +1080,13 @@ class BirlingBracket:
                 from models.competitor import CollegeCompetitor
                 from models.team import Team
                 comp_ids = [int(k) for k in placements.keys()]
-                team_ids = set()
-                for comp in CollegeCompetitor.query.filter(
-                        CollegeCompetitor.id.in_(comp_ids)).all():
-                    if comp.team_id:
-                        team_ids.add(comp.team_id)
-                for team in Team.query.filter(Team.id.in_(list(team_ids))).all():
-                    team.recalculate_points()
+                team_ids = {
+                    team_id for (team_id,) in
+                    db.session.query(CollegeCompetitor.team_id)
+                    .filter(CollegeCompetitor.id.in_(comp_ids))
+                    if team_id
+                }
+                Team.bulk_recalculate(team_ids=team_ids)
                 db.session.commit()
             except Exception:
                 pass  # non-blocking — team totals can be recalculated manually
@@ -9,3 +9,6 @@ def invalidate_tournament_caches(tournament_id: int) -> None:
     invalidate_prefix(f'portal:college:{tid}')
     invalidate_prefix(f'portal:pro:{tid}')
     invalidate_prefix(f'api:standings-poll:{tid}')
+    invalidate_prefix(f'api:standings:{tid}')
+    invalidate_prefix(f'api:schedule:{tid}')
+    invalidate_prefix(f'api:results:{tid}')
@@ -3,10 +3,11 @@ Excel import/export service for college and pro registration.
 Maintains compatibility with existing college entry form format.
 """
 import pandas as pd
+from sqlalchemy.orm import selectinload
 
 import config
 from database import db
-from models import CollegeCompetitor, ProCompetitor, Team, Tournament
+from models import CollegeCompetitor, Event, ProCompetitor, Team, Tournament
 from services.gear_sharing import infer_equipment_categories, normalize_person_name
 
 
@@ -1060,11 +1061,12 @@ def export_results_to_excel(tournament: Tournament, filepath: str):
 
         # College team standings
         teams = tournament.get_team_standings()
+        roster_counts = Team.get_roster_counts(tournament.id)
         team_data = [{
             'Rank': i + 1,
             'Team': t.team_code,
             'School': t.school_name,
-            'Members': t.member_count,
+            'Members': roster_counts.get(t.id, (0, 0, 0))[2],
             'Points': t.total_points
         } for i, t in enumerate(teams)]
 
@@ -1073,8 +1075,7 @@ def export_results_to_excel(tournament: Tournament, filepath: str):
             sheets_written += 1
 
         # Individual standings
-        bull = tournament.get_bull_of_woods(20)
-        belle = tournament.get_belle_of_woods(20)
+        bull, belle = tournament.get_top_competitors_by_gender(20)
 
         bull_data = [{
             'Rank': i + 1,
@@ -1098,7 +1099,7 @@ def export_results_to_excel(tournament: Tournament, filepath: str):
             sheets_written += 1
 
         # Event results
-        for event in tournament.events.all():
+        for event in tournament.events.options(selectinload(Event.results_by_position)).all():
             results = event.get_results_sorted()
             if not results:
                 continue
@@ -15,8 +15,15 @@ import logging
 import re
 from typing import Iterable
 
+from sqlalchemy.orm import undefer_group
+
 logger = logging.getLogger(__name__)
 
+# ProCompetitor's deferred free-text group; gear_sharing_details is in it.
+# Readers that walk a whole roster for the details undefer it in their own
+# SELECT instead of paying one load per competitor.
+_IMPORT_TEXT = 'import_text'
+
 _CATEGORY_KEYS = {
     'category:crosscut',
     'category:chainsaw',
@@ -1054,7 +1061,7 @@ def build_parse_review(tournament) -> list:
 
     pro_comps = ProCompetitor.query.filter_by(
         tournament_id=tournament.id, status='active'
-    ).all()
+    ).options(undefer_group(_IMPORT_TEXT)).all()
     pro_events = Event.query.filter_by(tournament_id=tournament.id, event_type='pro').all()
     name_index = build_name_index(c.name for c in pro_comps)
     event_labels = {str(e.id): e.display_name for e in pro_events}
@@ -1392,7 +1399,7 @@ def build_gear_report(tournament) -> dict:
 
     pro_comps = ProCompetitor.query.filter_by(
         tournament_id=tournament.id, status='active'
-    ).order_by(ProCompetitor.name).all()
+    ).options(undefer_group(_IMPORT_TEXT)).order_by(ProCompetitor.name).all()
 
     college_comps = CollegeCompetitor.query.filter_by(
         tournament_id=tournament.id, status='active'
@@ -1636,7 +1643,7 @@ def parse_all_gear_details(tournament) -> dict:
 
     pro_comps = ProCompetitor.query.filter_by(
         tournament_id=tournament.id, status='active'
-    ).all()
+    ).options(undefer_group(_IMPORT_TEXT)).all()
     pro_events = Event.query.filter_by(tournament_id=tournament.id, event_type='pro').all()
     name_index = build_name_index(c.name for c in pro_comps)
 
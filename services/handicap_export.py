@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import re
 
-import pandas as pd
+from sqlalchemy.orm import selectinload
 
 from models import Event, Tournament
 
@@ -30,7 +30,8 @@ def is_chopping_event(event: Event) -> bool:
 
 def build_chopping_rows(tournament: Tournament) -> list[dict]:
     rows: list[dict] = []
-    for event in tournament.events.order_by(Event.event_type, Event.name, Event.gender).all():
+    events = tournament.events.order_by(Event.event_type, Event.name, Event.gender)
+    for event in events.options(selectinload(Event.results_by_position)).all():
         if not is_chopping_event(event):
             continue
         for result in event.get_results_sorted():
@@ -60,6 +61,11 @@ def build_chopping_rows(tournament: Tournament) -> list[dict]:
 
 
 def export_chopping_results_to_excel(tournament: Tournament, filepath: str) -> None:
+    # pandas is imported here rather than at module top: routes.api imports
+    # build_chopping_rows at app boot, and pandas is most of the cold-start
+    # cost of a worker that never exports a spreadsheet.
+    import pandas as pd
+
     rows = build_chopping_rows(tournament)
     with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
         pd.DataFrame(rows).to_excel(writer, sheet_name='Chopping Results', index=False)
@@ -4,6 +4,7 @@ Adapted from STRATHEX tournament_ui.py patterns.
 """
 import logging
 import math
+from functools import lru_cache
 
 import config
 from config import LIST_ONLY_EVENT_NAMES
@@ -1186,24 +1187,41 @@ def _normalize_name(value: str) -> str:
     return ''.join(ch for ch in str(value or '').lower() if ch.isalnum())
 
 
-def _competitor_entered_event(event: Event, entered_events: list) -> bool:
-    entered = entered_events if isinstance(entered_events, list) else []
-    target_id = str(event.id)
-    target_name = _normalize_name(event.name)
-    target_display_name = _normalize_name(event.display_name)
-    aliases = {target_name, target_display_name}
+@lru_cache(maxsize=4096)
+def _entry_key(value: str) -> str:
+    return _normalize_name(value)
 
-    if event.event_type == 'pro':
-        if target_name == 'springboard':
+
+@lru_cache(maxsize=1024)
+def _event_entry_aliases(event_type: str, event_name: str, display_name: str) -> frozenset:
+    name = _normalize_name(event_name)
+    aliases = {name, _normalize_name(display_name)}
+
+    if event_type == 'pro':
+        if name == 'springboard':
             aliases.update({'springboardl', 'springboardr'})
-        elif target_name in {'pro1board', '1boardspringboard'}:
+        elif name in {'pro1board', '1boardspringboard'}:
             aliases.update({'intermediate1boardspringboard', 'pro1board', '1boardspringboard'})
-        elif target_name == 'jackjillsawing':
+        elif name == 'jackjillsawing':
             aliases.update({'jackjill', 'jackandjill'})
-        elif target_name in {'poleclimb', 'speedclimb'}:
+        elif name in {'poleclimb', 'speedclimb'}:
             aliases.update({'poleclimb', 'speedclimb'})
-        elif target_name == 'partneredaxethrow':
+        elif name == 'partneredaxethrow':
             aliases.update({'partneredaxethrow', 'axethrow'})
+    return frozenset(aliases)
+
+
+def _competitor_entered_event(event: Event, entered_events: list) -> bool:
+    """Whether ``entered_events`` (a competitor's events_entered) names ``event``.
+
+    Entries are event ids or free-text event names, matched after
+    normalization. This runs once per competitor per event on the heat and
+    status pages, so the event's alias set and each normalized entry are
+    memoized; both are pure functions of their strings.
+    """
+    entered = entered_events if isinstance(entered_events, list) else []
+    target_id = str(event.id)
+    aliases = _event_entry_aliases(event.event_type, event.name, event.display_name)
 
     for raw in entered:
         value = str(raw).strip()
@@ -1211,8 +1229,7 @@ def _competitor_entered_event(event: Event, entered_events: list) -> bool:
             continue
         if value == target_id:
             return True
-        normalized = _normalize_name(value)
-        if normalized in aliases:
+        if _entry_key(value) in aliases:
             return True
     return False
 
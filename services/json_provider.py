@@ -0,0 +1,53 @@
+"""Flask JSON provider backed by orjson.
+
+Every ``jsonify`` goes through ``app.json``. The public schedule and results
+payloads run to thousands of nested dicts on a full show, and the stdlib
+encoder spends most of that time in Python. orjson encodes the same structure
+several times faster.
+
+The output matches Flask's DefaultJSONProvider in everything a client reads:
+keys sorted when ``sort_keys`` is set, non-string dict keys stringified, and
+Decimal, date/datetime, UUID and ``__html__`` values sent through Flask's own
+``default`` hook, so a datetime is still an HTTP date and a Decimal still a
+string. orjson writes non-ASCII characters as UTF-8 instead of ``\\uXXXX``
+escapes; both are the same JSON. Anything orjson refuses (integers wider than
+64 bits) falls back to the stdlib encoder, as do calls with dump options other
+than Flask's own ``indent``/``separators``. Without orjson installed the app
+keeps the default provider.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _orjson = None
+
+_FLASK_DUMP_ARGS = frozenset({'indent', 'separators'})
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        indent = kwargs.get('indent')
+        if set(kwargs) - _FLASK_DUMP_ARGS or indent not in (None, 2):
+            return super().dumps(obj, **kwargs)
+        option = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        try:
+            return _orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except _orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return _orjson.loads(s)
+
+
+def init_app(app) -> None:
+    if _orjson is not None:
+        app.json = ORJSONProvider(app)
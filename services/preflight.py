@@ -9,6 +9,8 @@ click-path fix rather than as advisory warnings.
 """
 from __future__ import annotations
 
+from sqlalchemy.orm import undefer_group
+
 from models import Event, Flight, Tournament
 from models.competitor import CollegeCompetitor, ProCompetitor
 from services.gear_sharing import (
@@ -359,7 +361,8 @@ def build_preflight_report(tournament: Tournament, saturday_college_event_ids: l
                     if competitor.name not in unknown_partner_names:
                         unknown_partner_names.append(competitor.name)
 
-    _scan_rows(ProCompetitor.query.filter_by(tournament_id=tournament.id, status='active').all(), pro_events, pro_names)
+    _scan_rows(ProCompetitor.query.filter_by(tournament_id=tournament.id, status='active')
+               .options(undefer_group('import_text')).all(), pro_events, pro_names)
     _scan_rows(CollegeCompetitor.query.filter_by(tournament_id=tournament.id, status='active').all(), college_events, college_names)
 
     def _name_list(names: list[str], limit: int = 5) -> str:
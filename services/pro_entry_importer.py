@@ -90,11 +90,18 @@ def parse_pro_entries(filepath: str) -> list:
     Datetime objects are converted to ISO strings for JSON serialisability.
     Rows where 'Full Name' is blank are silently skipped.
     """
-    wb = openpyxl.load_workbook(filepath, data_only=True)
-    ws = wb.worksheets[0]
+    # Read-only mode streams the sheet XML and yields plain value tuples
+    # instead of building a Cell object for every cell in the workbook.
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = list(wb.worksheets[0].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    if not rows:
+        return []
 
     # Read and strip every header cell from row 1
-    raw_headers = next(ws.iter_rows(min_row=1, max_row=1, values_only=True))
+    raw_headers = rows[0]
     stripped = [h.strip() if isinstance(h, str) else (h or '') for h in raw_headers]
 
     # Exact-match lookup: stripped_header -> 0-based column index.
@@ -121,7 +128,7 @@ def parse_pro_entries(filepath: str) -> list:
 
     entries = []
 
-    for row in ws.iter_rows(min_row=2, values_only=True):
+    for row in rows[1:]:
         # Skip rows with no name (trailing blank rows, etc.)
         name_val = _get(row, hmap.get('Full Name'))
         if not name_val or not str(name_val).strip():
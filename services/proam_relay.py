@@ -103,8 +103,11 @@ class ProAmRelay:
         """
         Get active college competitors who opted into the relay lottery.
         """
-        college = CollegeCompetitor.query.filter_by(tournament_id=self.tournament.id, status='active').all()
-        college = [c for c in college if c.pro_am_lottery_opt_in]
+        college = CollegeCompetitor.query.filter_by(
+            tournament_id=self.tournament.id,
+            status='active',
+            pro_am_lottery_opt_in=True
+        ).all()
 
         return [{'id': c.id, 'name': c.name, 'gender': c.gender,
                  'team': c.team.team_code if c.team else 'N/A'} for c in college]
@@ -652,21 +652,25 @@ def _extract_names_from_text(
 # ---------------------------------------------------------------------------
 
 
-def run_import_pipeline(filepath: str) -> ImportResult:
+def run_import_pipeline(filepath: str, raw_entries: list[dict] | None = None) -> ImportResult:
     """Run the full import pipeline on an xlsx file.
 
     This wraps parse_pro_entries() and adds all validation/cross-validation.
+    A caller that has already run parse_pro_entries() on *filepath* passes
+    its output as *raw_entries* so the workbook is not read a second time.
+    The entries are read, not modified.
     """
     result = ImportResult()
 
     # Step 1: Parse with existing parser
-    try:
-        from services.pro_entry_importer import parse_pro_entries
+    if raw_entries is None:
+        try:
+            from services.pro_entry_importer import parse_pro_entries
 
-        raw_entries = parse_pro_entries(filepath)
-    except Exception as exc:
-        result.errors.append(f"Failed to parse xlsx: {exc}")
-        return result
+            raw_entries = parse_pro_entries(filepath)
+        except Exception as exc:
+            result.errors.append(f"Failed to parse xlsx: {exc}")
+            return result
 
     if not raw_entries:
         result.errors.append("No entries found in file.")
@@ -11,7 +11,6 @@ import tempfile
 from database import db
 from models import Tournament
 from services.background_jobs import submit as submit_job
-from services.excel_io import export_results_to_excel
 from services.handicap_export import build_chopping_rows, export_chopping_results_to_excel
 
 
@@ -29,6 +28,17 @@ def _reserve_export_path(tournament_id: int, *, suffix: str = '.xlsx', label: st
     return path
 
 
+def export_results_to_excel(tournament: Tournament, path: str) -> None:
+    """Deferred-import shim for services.excel_io.export_results_to_excel.
+
+    excel_io imports pandas at module top. This module is imported by
+    routes.reporting at app boot, so a top-level import here made every
+    worker pay for pandas before its first request.
+    """
+    from services.excel_io import export_results_to_excel as _export
+    _export(tournament, path)
+
+
 def build_results_export(tournament: Tournament) -> dict:
     """Create a full results Excel export and return file metadata."""
     path = _reserve_export_path(tournament.id, suffix='.xlsx')
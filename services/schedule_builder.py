@@ -166,10 +166,11 @@ def _build_saturday_from_flights(tournament: Tournament, allowed_event_ids: set[
     if not flights:
         return []
 
+    heats_by_flight = Flight.ordered_heats(f.id for f in flights)
     entries = []
     slot = 1
     for flight in flights:
-        heats = flight.get_heats_ordered()
+        heats = heats_by_flight[flight.id]
         for heat in heats:
             event = heat.event
             if not event:
@@ -492,7 +493,7 @@ def get_saturday_ordered_heats(tournament: Tournament) -> list:
     """Return all Saturday heats in the authoritative run order.
 
     When Flight rows exist: iterates flights by flight_number ascending,
-    calling flight.get_heats_ordered() within each flight. Day-split
+    taking each flight's heats in get_heats_ordered order. Day-split
     Run 2 heats are assumed to be attached to flights via the spillover
     integration; any that are not get appended defensively at the end.
 
@@ -514,8 +515,9 @@ def get_saturday_ordered_heats(tournament: Tournament) -> list:
     seen_ids: set[int] = set()
 
     if flights:
+        heats_by_flight = Flight.ordered_heats(f.id for f in flights)
         for flight in flights:
-            for heat in flight.get_heats_ordered():
+            for heat in heats_by_flight[flight.id]:
                 heats.append(heat)
                 seen_ids.add(heat.id)
     else:
@@ -426,7 +426,7 @@ def _apply_state_machine_ranking(event: Event, completed: list[EventResult],
         result.payout_amount = payout
         comp = comp_lookup.get(result.competitor_id)
         if comp:
-            comp.total_earnings += payout
+            comp.add_earnings(payout)
 
     for result in ranked:
         _award(result, position_by_competitor[result.competitor_id])
@@ -490,7 +490,7 @@ def calculate_positions(event: Event) -> None:
             if awarded:
                 comp = ProCompetitor.query.get(r.competitor_id)
                 if comp:
-                    comp.total_earnings = max(0.0, comp.total_earnings - awarded)
+                    comp.total_earnings = max(0.0, round(comp.total_earnings - awarded, 2))
             r.payout_amount = 0.0
             r.final_position = None
 
@@ -508,11 +508,7 @@ def calculate_positions(event: Event) -> None:
                 .filter(CollegeCompetitor.id.in_(stripped_competitor_ids))
                 .all()
             )
-            stripped_team_ids = {c.team_id for c in stripped_comps if c.team_id}
-            for tid in stripped_team_ids:
-                team = Team.query.get(tid)
-                if team:
-                    team.recalculate_points()
+            Team.bulk_recalculate(team_ids={c.team_id for c in stripped_comps if c.team_id})
         return
 
     # --- state-machine events: take the order from event_state, not from
@@ -615,7 +611,7 @@ def calculate_positions(event: Event) -> None:
                 completed[j].payout_amount = payout
                 comp = comp_lookup.get(completed[j].competitor_id)
                 if comp:
-                    comp.total_earnings += payout
+                    comp.add_earnings(payout)
 
         # Advance the position counter by the number of unique pairs (one per
         # entity), not the number of rows.  For solo events these are equal.
@@ -639,11 +635,7 @@ def calculate_positions(event: Event) -> None:
             .filter(CollegeCompetitor.id.in_(all_touched_ids))
             .all()
         )
-        touched_team_ids = {c.team_id for c in all_touched_comps if c.team_id}
-        for team_id in touched_team_ids:
-            team = Team.query.get(team_id)
-            if team:
-                team.recalculate_points()
+        Team.bulk_recalculate(team_ids={c.team_id for c in all_touched_comps if c.team_id})
 
     # --- outlier flagging ---
     flag_score_outliers(completed, event)
@@ -979,7 +971,7 @@ def record_throwoff_result(event: Event, position_map: dict[int, int]) -> None:
             result.payout_amount = new_pay
             comp = ProCompetitor.query.get(result.competitor_id)
             if comp:
-                comp.total_earnings = max(0.0, comp.total_earnings + diff)
+                comp.total_earnings = max(0.0, round(comp.total_earnings + diff, 2))
 
     if event.event_type == 'college':
         # Rebuild from SUM — single source of truth, same path as
@@ -991,11 +983,8 @@ def record_throwoff_result(event: Event, position_map: dict[int, int]) -> None:
             .filter(CollegeCompetitor.id.in_(all_comp_ids))
             .all()
         )
-        touched_team_ids = {c.team_id for c in comp_rows if getattr(c, 'team_id', None)}
-        for team_id in touched_team_ids:
-            team = Team.query.get(team_id)
-            if team:
-                team.recalculate_points()
+        Team.bulk_recalculate(
+            team_ids={c.team_id for c in comp_rows if getattr(c, 'team_id', None)})
 
     log_action('throwoff_recorded', 'event', event.id,
                {'positions': position_map})
@@ -1082,9 +1071,7 @@ def get_team_standings(tournament_id: int, limit: int = None) -> list:
 
 def recalculate_all_team_points(tournament_id: int) -> None:
     """Recalculate all team points from member individual_points. Use after corrections."""
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
-    for team in teams:
-        team.recalculate_points()
+    Team.bulk_recalculate(tournament_id=tournament_id)
     db.session.commit()
 
 
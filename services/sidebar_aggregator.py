@@ -31,3 +31,59 @@ def unscored_heats_count(tournament_id: int) -> int:
         )
     except Exception:
         return 0
+
+
+class LazyUnscoredCount:
+    """``unscored_heats_count(tid)``, run the first time a template reads it.
+
+    inject_strings runs for every render, but only _sidebar.html (judge
+    pages) shows the badge. Flask merges context-processor results with
+    dict.update, which would force a lazy mapping immediately, so the
+    laziness lives in the value: it behaves like the int it stands for in
+    comparisons and output, and only then queries.
+    """
+
+    __slots__ = ('_tournament_id', '_value')
+
+    def __init__(self, tournament_id):
+        self._tournament_id = tournament_id
+        self._value = None
+
+    def _resolve(self) -> int:
+        if self._value is None:
+            self._value = unscored_heats_count(self._tournament_id)
+        return self._value
+
+    def __int__(self):
+        return self._resolve()
+
+    __index__ = __int__
+
+    def __bool__(self):
+        return bool(self._resolve())
+
+    def __eq__(self, other):
+        return self._resolve() == other
+
+    def __ne__(self, other):
+        return self._resolve() != other
+
+    def __lt__(self, other):
+        return self._resolve() < other
+
+    def __le__(self, other):
+        return self._resolve() <= other
+
+    def __gt__(self, other):
+        return self._resolve() > other
+
+    def __ge__(self, other):
+        return self._resolve() >= other
+
+    def __hash__(self):
+        return hash(self._resolve())
+
+    def __str__(self):
+        return str(self._resolve())
+
+    __repr__ = __str__
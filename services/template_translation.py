@@ -0,0 +1,183 @@
+"""Render-time page translation as a Jinja extension.
+
+The default path translates a page after it is rendered: apply_html_post_processing
+in app.py re-reads the whole body, splits it on tags, and runs the phrase map
+over every text chunk. That pass pays for every byte of navigation chrome and
+inline script on every request.
+
+This extension moves the work into the template pipeline. While a template is
+compiled, its literal HTML is rewritten into calls to ``_tr_segment`` and its
+``{{ ... }}`` outputs are piped through ``_tr_value``. Compilation happens once
+per template, so the rewriting rides Jinja's template cache; at render time a
+constant costs one memoized lookup (strings.translate_segment) and an English
+request costs a function call that hands the value straight back.
+
+The rewrite has to preserve exactly what the post-render pass would and would
+not touch, so the lexer's token stream is walked with a small state machine:
+
+  * text inside a tag (attribute values: ``href``, ``value``, ``data-*``) is
+    never translated — a translated ``<input value>`` changes what the form
+    submits;
+  * ``<script>`` and ``<style>`` bodies are never translated;
+  * everything else is translated with strings.translate_html semantics.
+
+Templates that are not autoescaped (plain-text email bodies and the like) are
+passed through untouched; the post-render pass only ever saw text/html.
+
+Enabled by TRANSLATE_AT_RENDER=1. When on, app.py skips the post-render
+translation step; CSP nonce injection still runs there.
+"""
+from __future__ import annotations
+
+import re
+
+from jinja2.ext import Extension
+from jinja2.lexer import Token
+from markupsafe import Markup, escape
+
+import strings as text
+
+_TAG_NAME_RE = re.compile(r'</?\s*([a-zA-Z][a-zA-Z0-9]*)')
+_RAW_TEXT_TAGS = ('script', 'style')
+
+
+def _tr_segment(segment: str) -> Markup:
+    """Runtime half of a rewritten template constant."""
+    return Markup(text.translate_segment(segment))
+
+
+def _tr_value(value):
+    """Runtime half of a rewritten ``{{ ... }}`` output."""
+    lang = text.get_language()
+    if lang == text.DEFAULT_LANGUAGE:
+        return value
+    return Markup(text.translate_html(str(escape(value)), lang=lang))
+
+
+class _MarkupState:
+    """Where the lexer is in the HTML, carried across template tokens.
+
+    ``open_tag`` is the name of a tag whose ``<`` has been seen but whose
+    ``>`` has not (``'/script'`` for a closing tag). ``raw_until`` is the
+    closing-tag prefix that ends a script or style body.
+    """
+
+    __slots__ = ('open_tag', 'raw_until')
+
+    def __init__(self):
+        self.open_tag: str | None = None
+        self.raw_until: str | None = None
+
+    @property
+    def translatable(self) -> bool:
+        return self.open_tag is None and self.raw_until is None
+
+
+def _tag_name(value: str, lt: int) -> str:
+    match = _TAG_NAME_RE.match(value, lt)
+    if not match:
+        return ''
+    name = match.group(1).lower()
+    return '/' + name if value.startswith('</', lt) else name
+
+
+def split_segment(value: str, state: _MarkupState) -> list[tuple[bool, str]]:
+    """Cut one template constant into (translate?, text) pieces.
+
+    Advances ``state`` past the constant. Translatable pieces always begin
+    outside any tag, so strings.translate_html sees them exactly as it would
+    have seen them in the rendered page.
+    """
+    pieces: list[tuple[bool, str]] = []
+    pos = 0
+    end = len(value)
+    while pos < end:
+        if state.raw_until is not None:
+            close = value.lower().find(state.raw_until, pos)
+            if close < 0:
+                pieces.append((False, value[pos:]))
+                return pieces
+            state.raw_until = None
+            state.open_tag = _tag_name(value, close)
+            pieces.append((False, value[pos:close]))
+            pos = close
+            continue
+
+        if state.open_tag is not None:
+            gt = value.find('>', pos)
+            if gt < 0:
+                pieces.append((False, value[pos:]))
+                return pieces
+            if state.open_tag in _RAW_TEXT_TAGS:
+                state.raw_until = '</' + state.open_tag
+            state.open_tag = None
+            pieces.append((False, value[pos:gt + 1]))
+            pos = gt + 1
+            continue
+
+        # Outside any tag: translatable up to the first tag left open at the
+        # end of the constant, or the first script/style body.
+        start = pos
+        while True:
+            lt = value.find('<', pos)
+            if lt < 0:
+                pieces.append((True, value[start:]))
+                return pieces
+            name = _tag_name(value, lt)
+            gt = value.find('>', lt)
+            if gt < 0 or name in _RAW_TEXT_TAGS:
+                if lt > start:
+                    pieces.append((True, value[start:lt]))
+                state.open_tag = name
+                pos = lt
+                break
+            pos = gt + 1
+    return pieces
+
+
+class TemplateTranslationExtension(Extension):
+    """Rewrite template constants and outputs into translating calls."""
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.globals['_tr_segment'] = _tr_segment
+        environment.filters['_tr_value'] = _tr_value
+
+    def _autoescaped(self, name: str | None) -> bool:
+        autoescape = self.environment.autoescape
+        return bool(autoescape(name) if callable(autoescape) else autoescape)
+
+    def filter_stream(self, stream):
+        if not self._autoescaped(stream.name):
+            yield from stream
+            return
+
+        state = _MarkupState()
+        wrap_output = False
+        for token in stream:
+            lineno = token.lineno
+            if token.type == 'data':
+                for translate, piece in split_segment(token.value, state):
+                    if not piece:
+                        continue
+                    if not translate or piece.isspace():
+                        yield Token(lineno, 'data', piece)
+                        continue
+                    yield Token(lineno, 'variable_begin', '{{')
+                    yield Token(lineno, 'name', '_tr_segment')
+                    yield Token(lineno, 'lparen', '(')
+                    yield Token(lineno, 'string', piece)
+                    yield Token(lineno, 'rparen', ')')
+                    yield Token(lineno, 'variable_end', '}}')
+            elif token.type == 'variable_begin' and state.translatable:
+                wrap_output = True
+                yield token
+                yield Token(lineno, 'lparen', '(')
+            elif token.type == 'variable_end' and wrap_output:
+                wrap_output = False
+                yield Token(lineno, 'rparen', ')')
+                yield Token(lineno, 'pipe', '|')
+                yield Token(lineno, 'name', '_tr_value')
+                yield token
+            else:
+                yield token
@@ -0,0 +1,127 @@
+"""Short-lived cache behind Flask-Login's user_loader.
+
+Every request from a signed-in judge, scorer or portal user calls the user
+loader, and every one of those calls was a primary-key SELECT on ``users``.
+During a show the same handful of tablets poll the same pages every few
+seconds, so the row almost never changes between two loads.
+
+What is cached is a plain snapshot of the row's columns, never the mapped
+instance. An instance outlives the request's session, comes back detached,
+and raises DetachedInstanceError on the first expired attribute (see the
+module docstring of services/report_cache.py). On a hit the snapshot is
+rebuilt into a User and attached to the current session with
+``merge(load=False)``, which adds it to the identity map without a query.
+
+Any insert, update or delete of a User through the ORM drops that id from
+every cache in this process twice: at flush, and again once the session
+commits. The second drop covers a request that loaded the user between the
+flush and the commit and so re-cached the old committed row. A role change,
+deactivation or password reset therefore takes effect on the next request
+served by this process. Other worker processes keep their own caches and
+pick the change up when their entry expires, at most
+``USER_CACHE_TTL_SECONDS`` later, as do changes made behind the ORM (raw SQL
+from a maintenance script). ``USER_CACHE_TTL_SECONDS=0`` turns the cache off.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+
+import sqlalchemy as sa
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from database import db
+from models.user import User
+
+_MAX_ENTRIES = 2048
+
+# Every live cache, so the mapper events below can reach all of them. Each
+# app gets its own cache: two apps in one process (the test suite builds many)
+# can have different users behind the same id.
+_caches: weakref.WeakSet = weakref.WeakSet()
+
+
+class UserCache:
+    """Per-app map of user id -> (expiry, column snapshot)."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[int, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def load(self, user_id: int) -> User | None:
+        if self.ttl_seconds <= 0:
+            return db.session.get(User, user_id)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            user = User(**entry[1])
+            make_transient_to_detached(user)
+            return db.session.merge(user, load=False)
+
+        user = db.session.get(User, user_id)
+        if user is None:
+            self.invalidate(user_id)
+            return None
+        snapshot = {attr.key: getattr(user, attr.key)
+                    for attr in sa.inspect(User).column_attrs}
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._entries[user_id] = (now + self.ttl_seconds, snapshot)
+            while len(self._entries) > _MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+        return user
+
+    def invalidate(self, user_id) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def init_app(app) -> UserCache:
+    cache = UserCache(float(app.config.get('USER_CACHE_TTL_SECONDS', 30)))
+    app.extensions['user_cache'] = cache
+    return cache
+
+
+# Session.info key for the user ids flushed in the open transaction.
+_CHANGED_KEY = 'user_cache_changed_ids'
+
+
+def _invalidate_everywhere(user_ids) -> None:
+    for cache in list(_caches):
+        for user_id in user_ids:
+            cache.invalidate(user_id)
+
+
+@sa_event.listens_for(User, 'after_insert')
+@sa_event.listens_for(User, 'after_update')
+@sa_event.listens_for(User, 'after_delete')
+def _drop_changed_user(mapper, connection, target):
+    _invalidate_everywhere((target.id,))
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_CHANGED_KEY, set()).add(target.id)
+
+
+@sa_event.listens_for(Session, 'after_commit')
+def _drop_committed_users(session):
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if changed:
+        _invalidate_everywhere(changed)
+
+
+@sa_event.listens_for(Session, 'after_soft_rollback')
+def _forget_rolled_back_users(session, previous_transaction):
+    # A savepoint rollback leaves the outer transaction's flushes in place;
+    # only the outermost rollback discards them all.
+    if previous_transaction.parent is None:
+        session.info.pop(_CHANGED_KEY, None)
@@ -80,42 +80,49 @@ class TeamValidator:
     MIN_FEMALE = 2
 
     @classmethod
-    def validate(cls, team: Team) -> ValidationResult:
-        """Validate a single team."""
+    def validate(cls, team: Team, counts: Optional[Tuple[int, int, int]] = None) -> ValidationResult:
+        """Validate a single team.
+
+        ``counts`` is the team's (male, female, total) from
+        Team.get_roster_counts; without it the counts are queried.
+        """
         result = ValidationResult()
+        if counts is None:
+            counts = (team.male_count, team.female_count, team.member_count)
+        male_count, female_count, member_count = counts
 
         # Check member count
-        if team.member_count < cls.MIN_MEMBERS:
+        if member_count < cls.MIN_MEMBERS:
             result.add_error(
                 'TEAM_TOO_SMALL',
-                f'Team {team.team_code} has only {team.member_count} members (minimum {cls.MIN_MEMBERS})',
+                f'Team {team.team_code} has only {member_count} members (minimum {cls.MIN_MEMBERS})',
                 entity_id=team.id
             )
 
-        if team.member_count > cls.MAX_MEMBERS:
+        if member_count > cls.MAX_MEMBERS:
             result.add_error(
                 'TEAM_TOO_LARGE',
-                f'Team {team.team_code} has {team.member_count} members (maximum {cls.MAX_MEMBERS})',
+                f'Team {team.team_code} has {member_count} members (maximum {cls.MAX_MEMBERS})',
                 entity_id=team.id
             )
 
         # Check gender requirements
-        if team.male_count < cls.MIN_MALE:
+        if male_count < cls.MIN_MALE:
             result.add_error(
                 'INSUFFICIENT_MALES',
-                f'Team {team.team_code} has only {team.male_count} male members (minimum {cls.MIN_MALE})',
+                f'Team {team.team_code} has only {male_count} male members (minimum {cls.MIN_MALE})',
                 entity_id=team.id
             )
 
-        if team.female_count < cls.MIN_FEMALE:
+        if female_count < cls.MIN_FEMALE:
             result.add_error(
                 'INSUFFICIENT_FEMALES',
-                f'Team {team.team_code} has only {team.female_count} female members (minimum {cls.MIN_FEMALE})',
+                f'Team {team.team_code} has only {female_count} female members (minimum {cls.MIN_FEMALE})',
                 entity_id=team.id
             )
 
         # Warnings
-        if team.member_count == cls.MIN_MEMBERS:
+        if member_count == cls.MIN_MEMBERS:
             result.add_warning(
                 'TEAM_AT_MINIMUM',
                 f'Team {team.team_code} has minimum members - no substitutes available',
@@ -129,9 +136,10 @@ class TeamValidator:
         """Validate all teams in a tournament."""
         result = ValidationResult()
         teams = Team.query.filter_by(tournament_id=tournament_id).all()
+        counts = Team.get_roster_counts(tournament_id)
 
         for team in teams:
-            result.merge(cls.validate(team))
+            result.merge(cls.validate(team, counts.get(team.id, (0, 0, 0))))
 
         return result
 
@@ -141,6 +149,7 @@ class CollegeCompetitorValidator:
 
     MAX_CLOSED_EVENTS = 6
     REQUIRED_FIELDS = ['name', 'gender']
+    CLOSED_EVENT_NAMES = frozenset(e['name'] for e in config.COLLEGE_CLOSED_EVENTS)
 
     @classmethod
     def validate(cls, competitor: CollegeCompetitor) -> ValidationResult:
@@ -167,11 +176,9 @@ class CollegeCompetitorValidator:
 
         # Check event entries
         events = competitor.get_events_entered()
-        closed_event_count = 0
-
-        for event_name in events:
-            if event_name in [e['name'] for e in config.COLLEGE_CLOSED_EVENTS]:
-                closed_event_count += 1
+        closed_event_count = sum(1 for event_name in events
+                                 if isinstance(event_name, str)
+                                 and event_name in cls.CLOSED_EVENT_NAMES)
 
         if closed_event_count > cls.MAX_CLOSED_EVENTS:
             result.add_error(
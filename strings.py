@@ -7,11 +7,13 @@ from __future__ import annotations
 
 import json
 import re
-from collections.abc import Mapping
+import time
+from collections.abc import Iterable, Iterator, Mapping
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
-from flask import has_request_context, session
+from flask import has_request_context, request, session
 
 DEFAULT_LANGUAGE = 'en'
 
@@ -192,6 +194,10 @@ ARAPAHO_VERIFIED_PHRASES = {
 }
 
 _GLOSSARY_FILE = Path(__file__).with_name('arapaho_glossary.json')
+# phrase_map_version() re-stats the glossary at most this often (seconds).
+_GLOSSARY_STAT_INTERVAL = 1.0
+# [monotonic time of the last stat, version it returned]
+_glossary_version = [float('-inf'), 0]
 
 # ---------------------------------------------------------------------------
 # Russian
@@ -571,17 +577,31 @@ TRANSLATIONS = {
 }
 
 
+# Request attribute holding the resolved language. A page asks for it from
+# the access guard, the context processor, every translated template output
+# and the after-request pass; the session lookup and validation run once.
+# Kept on the request rather than flask.g: g belongs to the app context, which
+# an outer ``with app.app_context()`` shares across requests.
+_LANG_ATTR = '_proam_lang'
+
+
 def get_language() -> str:
     if not has_request_context():
         return DEFAULT_LANGUAGE
-    lang = session.get('lang', DEFAULT_LANGUAGE)
-    return lang if lang in TRANSLATIONS else DEFAULT_LANGUAGE
+    lang = getattr(request, _LANG_ATTR, None)
+    if lang is None:
+        lang = session.get('lang', DEFAULT_LANGUAGE)
+        if lang not in TRANSLATIONS:
+            lang = DEFAULT_LANGUAGE
+        setattr(request, _LANG_ATTR, lang)
+    return lang
 
 
 def set_language(lang: str) -> bool:
     if not has_request_context() or lang not in TRANSLATIONS:
         return False
     session['lang'] = lang
+    setattr(request, _LANG_ATTR, lang)
     return True
 
 
@@ -608,11 +628,6 @@ def ui(key: str, **kwargs) -> str:
     return tr('UI', key, **kwargs)
 
 
-def _replace_phrase_case_insensitive(text_value: str, source: str, target: str) -> str:
-    pattern = re.compile(re.escape(source), re.IGNORECASE)
-    return pattern.sub(target, text_value)
-
-
 def _load_custom_glossary() -> dict[str, str]:
     """
     Load user-approved glossary overrides.
@@ -633,6 +648,25 @@ def _load_custom_glossary() -> dict[str, str]:
     return clean
 
 
+def phrase_map_version() -> int:
+    """Change marker for the phrase maps behind ``translate_html``.
+
+    The built-in maps are module constants; only the user glossary file can
+    change under a running process. Callers that cache translated output fold
+    this into their key. The file is stat'ed at most once per
+    ``_GLOSSARY_STAT_INTERVAL``, so a glossary edit shows up within about a
+    second rather than costing a syscall on every translated segment.
+    """
+    now = time.monotonic()
+    if now - _glossary_version[0] >= _GLOSSARY_STAT_INTERVAL:
+        try:
+            version = _GLOSSARY_FILE.stat().st_mtime_ns
+        except OSError:
+            version = 0
+        _glossary_version[:] = [now, version]
+    return _glossary_version[1]
+
+
 def _phrase_map(lang_code: str) -> dict[str, str]:
     if lang_code == 'arp':
         # User glossary wins over built-ins for community-approved phrasing.
@@ -644,34 +678,60 @@ def _phrase_map(lang_code: str) -> dict[str, str]:
     return {}
 
 
+# (lang, phrase_map_version()) -> (pattern, lowercased source -> target).
+_PHRASE_MATCHERS: dict[tuple[str, int], tuple[re.Pattern | None, dict[str, str]]] = {}
+
+
+def _phrase_matcher(lang_code: str) -> tuple[re.Pattern | None, dict[str, str]]:
+    """One compiled alternation over every phrase for a language.
+
+    Alternatives are ordered longest first, so at each position the longest
+    phrase wins — the same precedence the old one-regex-per-phrase loop got
+    from sorting by length — but the text is scanned once instead of once
+    per phrase. Rebuilt only when the glossary file changes.
+    """
+    key = (lang_code, phrase_map_version())
+    matcher = _PHRASE_MATCHERS.get(key)
+    if matcher is not None:
+        return matcher
+
+    targets: dict[str, str] = {}
+    for src, dst in sorted(_phrase_map(lang_code).items(), key=lambda item: len(item[0]), reverse=True):
+        targets.setdefault(src.lower(), dst)
+    pattern = None
+    if targets:
+        pattern = re.compile('|'.join(re.escape(src) for src in targets), re.IGNORECASE)
+    matcher = (pattern, targets)
+
+    for stale in [k for k in _PHRASE_MATCHERS if k[0] == lang_code]:
+        del _PHRASE_MATCHERS[stale]
+    _PHRASE_MATCHERS[key] = matcher
+    return matcher
+
+
+def _apply_phrases(text_value: str, matcher: tuple[re.Pattern | None, dict[str, str]]) -> str:
+    pattern, targets = matcher
+    if pattern is None:
+        return text_value
+    return pattern.sub(lambda m: targets.get(m.group(0).lower(), m.group(0)), text_value)
+
+
 def free_text(text_value: str, lang: str | None = None) -> str:
     """Translate free-form UI text with strict phrase-level substitutions only."""
     lang_code = lang or get_language()
     if lang_code == 'en' or not text_value:
         return text_value
+    return _apply_phrases(text_value, _phrase_matcher(lang_code))
 
-    translated = text_value
-    phrase_map = _phrase_map(lang_code)
-
-    for src, dst in sorted(phrase_map.items(), key=lambda item: len(item[0]), reverse=True):
-        translated = _replace_phrase_case_insensitive(translated, src, dst)
-
-    return translated
 
+def _translate_tagged(html: str, matcher, state: list[bool]) -> str:
+    """Translate text nodes in ``html``; ``state`` is [in_style, in_script].
 
-def translate_html(html: str, lang: str | None = None) -> str:
+    ``state`` is updated in place so a caller feeding a page in pieces (cut
+    on tag boundaries) carries script/style context from one piece to the
+    next.
     """
-    Translate all text nodes in rendered HTML.
-    Splits on tags and only transforms plain text chunks.
-    """
-    lang_code = lang or get_language()
-    if lang_code == 'en' or not html:
-        return html
-
     parts = re.split(r'(<[^>]+>)', html)
-    in_style = False
-    in_script = False
-
     for idx, chunk in enumerate(parts):
         if not chunk:
             continue
@@ -679,22 +739,88 @@ def translate_html(html: str, lang: str | None = None) -> str:
         if chunk.startswith('<'):
             tag = chunk.lower()
             if tag.startswith('<style'):
-                in_style = True
+                state[0] = True
             elif tag.startswith('</style'):
-                in_style = False
+                state[0] = False
             elif tag.startswith('<script'):
-                in_script = True
+                state[1] = True
             elif tag.startswith('</script'):
-                in_script = False
+                state[1] = False
             continue
 
-        if in_style or in_script or chunk.isspace():
+        if state[0] or state[1] or chunk.isspace():
             continue
 
-        parts[idx] = free_text(chunk, lang=lang_code)
+        parts[idx] = _apply_phrases(chunk, matcher)
     return ''.join(parts)
 
 
+def contains_phrase(html: str, lang: str) -> bool:
+    """Cheap pre-check: could ``translate_html(html, lang)`` change anything?
+
+    One scan of the raw page with the compiled alternation, stopping at the
+    first hit. Every text node is a substring of the page, so a page with no
+    hit anywhere provably has nothing to translate and the tag split, the
+    per-node substitution and the re-join can all be skipped. A hit inside
+    an attribute or a script is a false positive, which only costs the full
+    pass the page would have had anyway.
+    """
+    pattern, _ = _phrase_matcher(lang)
+    return pattern is not None and pattern.search(html) is not None
+
+
+def translate_html(html: str, lang: str | None = None) -> str:
+    """
+    Translate all text nodes in rendered HTML.
+    Splits on tags and only transforms plain text chunks.
+    """
+    lang_code = lang or get_language()
+    if lang_code == 'en' or not html or not contains_phrase(html, lang_code):
+        return html
+    return _translate_tagged(html, _phrase_matcher(lang_code), [False, False])
+
+
+def iter_translate_html(pieces: Iterable[str], lang: str) -> Iterator[str]:
+    """Streaming ``translate_html`` over an iterable of HTML text.
+
+    Input may be cut anywhere. Output is re-cut after the last ``>`` seen, so
+    no tag and no text node is ever split across two translate calls and the
+    concatenated output equals ``translate_html(''.join(pieces), lang)``. The
+    re-cutting also happens for English, which passes text through
+    unchanged, so callers can rely on never seeing half a tag.
+    """
+    matcher = _phrase_matcher(lang) if lang != DEFAULT_LANGUAGE else None
+    state = [False, False]
+    pending = ''
+    for piece in pieces:
+        pending += piece
+        cut = pending.rfind('>') + 1
+        if cut:
+            head, pending = pending[:cut], pending[cut:]
+            yield head if matcher is None else _translate_tagged(head, matcher, state)
+    if pending:
+        yield pending if matcher is None else _translate_tagged(pending, matcher, state)
+
+
+@lru_cache(maxsize=4096)
+def _translate_segment_cached(segment: str, lang_code: str, version: int) -> str:
+    return translate_html(segment, lang=lang_code)
+
+
+def translate_segment(segment: str, lang: str | None = None) -> str:
+    """Translate one HTML fragment that begins outside any tag, script or style.
+
+    Render-time counterpart of ``translate_html`` used by
+    services/template_translation.py for template constants. Those are a
+    bounded set of strings, so results are memoized per language and
+    phrase-map version.
+    """
+    lang_code = lang or get_language()
+    if lang_code == DEFAULT_LANGUAGE or not segment:
+        return segment
+    return _translate_segment_cached(segment, lang_code, phrase_map_version())
+
+
 class _LocalizedSection(Mapping):
     def __init__(self, section_name: str):
         self.section_name = section_name
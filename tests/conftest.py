@@ -31,6 +31,9 @@ from sqlalchemy import text as sa_text
 
 os.environ.setdefault('SECRET_KEY', 'test-secret-conftest')
 os.environ.setdefault('WTF_CSRF_ENABLED', 'False')
+# The public API payload cache is shared by every app in the process and its
+# disk layer by every xdist worker; tests that exercise it turn it back on.
+os.environ.setdefault('PUBLIC_CACHE_TTL_SECONDS', '0')
 
 from database import db as _db
 from tests.db_test_utils import create_test_app  # noqa: F401 — re-exported
@@ -207,6 +210,28 @@ def auth_client(app, admin_user):
     return c
 
 
+@pytest.fixture()
+def make_admin_client(app, db_session):
+    """Return a factory: ``make_admin_client(username)`` -> logged-in test client.
+
+    For tests whose route commits. A commit makes the shared ``test_admin``
+    row permanent, so each such test creates an admin with its own username.
+    """
+    from models.user import User
+
+    def _make(username):
+        user = User(username=username, role='admin')
+        user.set_password('testpass123')
+        db_session.add(user)
+        db_session.flush()
+        c = app.test_client()
+        with c.session_transaction() as sess:
+            sess['_user_id'] = str(user.id)
+        return c
+
+    return _make
+
+
 # ---------------------------------------------------------------------------
 # Seed helpers — importable by test files
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 import io
 import json
 import os
+import re
 import tempfile
 
 from models.audit_log import AuditLog
@@ -81,6 +82,93 @@ def test_tournament_settings_update_writes_audit_log(app, db_session):
     assert details['providing_shirts'] is True
 
 
+def test_duplicate_username_is_rejected(app, db_session):
+    client, _admin = _make_logged_in_client(app, db_session, 'dup_check_admin')
+
+    response = client.post(
+        '/auth/users',
+        data={'username': 'dup_check_admin', 'password': 'longenough1', 'role': 'judge'},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 302
+    assert User.query.filter_by(username='dup_check_admin').count() == 1
+    assert AuditLog.query.filter_by(action='user_created').count() == 0
+
+
+def test_user_list_pages_newest_first_without_password_hashes(app, db_session, monkeypatch):
+    from datetime import datetime, timedelta
+    from html import unescape
+
+    from sqlalchemy import event as sa_event
+
+    from database import db
+    from routes import auth as auth_routes
+
+    client, _admin = _make_logged_in_client(app, db_session, 'pager_admin')
+    _admin.created_at = datetime(2000, 1, 1)
+    start = datetime(2030, 1, 1)
+    for i in range(5):
+        _make_user(db_session, f'pager_user_{i}').created_at = start + timedelta(minutes=i % 2)
+    db_session.flush()
+    monkeypatch.setattr(auth_routes, '_USERS_PER_PAGE', 2)
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    url, seen = '/auth/users', []
+    sa_event.listen(db.engine, 'before_cursor_execute', _record)
+    try:
+        while url:
+            html = client.get(url).get_data(as_text=True)
+            seen.extend(re.findall(r'<td>(pager_user_\d)</td>', html))
+            older = re.search(r'<a class="page-link" href="([^"]+)">Older</a>', html)
+            url = unescape(older.group(1)) if older else None
+    finally:
+        sa_event.remove(db.engine, 'before_cursor_execute', _record)
+
+    assert seen == ['pager_user_3', 'pager_user_1', 'pager_user_4',
+                    'pager_user_2', 'pager_user_0']
+    listing = [s for s in statements if 'FROM users' in s and 'ORDER BY' in s]
+    assert listing and not any('password_hash' in s for s in listing)
+
+
+def test_user_link_dropdowns_read_competitors_in_one_query_each(app, db_session):
+    from sqlalchemy import event as sa_event
+
+    from database import db
+    from tests.conftest import make_college_competitor, make_pro_competitor, make_team
+
+    client, _admin = _make_logged_in_client(app, db_session, 'dropdown_admin')
+    tournament = make_tournament(db_session)
+    for code in ('UM-A', 'UM-B', 'MSU-A'):
+        team = make_team(db_session, tournament, code=code)
+        make_college_competitor(db_session, tournament, team, f'College {code}')
+    make_pro_competitor(db_session, tournament, 'Pro One')
+    db_session.flush()
+    tournament_id = tournament.id
+    db_session.expunge_all()
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa_event.listen(db.engine, 'before_cursor_execute', _record)
+    try:
+        html = client.get(f'/auth/users?tournament_id={tournament_id}').get_data(as_text=True)
+    finally:
+        sa_event.remove(db.engine, 'before_cursor_execute', _record)
+
+    assert 'College: College UM-B (UM-B)' in html
+    assert 'Pro: Pro One' in html
+    assert len([s for s in statements if 'FROM college_competitors' in s]) == 1
+    assert not [s for s in statements if s.lstrip().startswith('SELECT teams.')]
+    assert not [s for s in statements if 'FROM competitors' in s]
+
+
 def test_self_disable_attempt_is_audited(app, db_session):
     client, admin_user = _make_logged_in_client(app, db_session, 'self_disable_admin')
     tournament = make_tournament(db_session)
@@ -8,8 +8,11 @@ Run:
 """
 import json
 import os
+from contextlib import contextmanager
 
 import pytest
+from flask import jsonify
+from sqlalchemy import event as sa_event
 
 from database import db as _db
 from tests.conftest import (
@@ -30,6 +33,22 @@ def _db_session(db_session):
     yield db_session
 
 
+@contextmanager
+def count_selects():
+    """Collect every SELECT the engine runs inside the block."""
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+
+
 @pytest.fixture()
 def tournament(db_session):
     return make_tournament(db_session, status='pro_active')
@@ -61,6 +80,20 @@ class TestStandingsAPI:
         data = resp.get_json()
         assert isinstance(data, dict)
 
+    def test_leaderboards_read_only_printed_columns(self, client, db_session, tournament):
+        team = make_team(db_session, tournament)
+        for name, gender, points in (('Lean Bull', 'M', 12), ('Lean Belle', 'F', 9)):
+            make_college_competitor(db_session, tournament, team, name, gender).individual_points = points
+        db_session.commit()
+
+        for url in (f'/api/public/tournaments/{tournament.id}/standings',
+                    f'/api/public/tournaments/{tournament.id}/standings-poll'):
+            with count_selects() as statements:
+                data = client.get(url).get_json()
+            assert data['bull'][0]['name'] == f'Lean Bull ({team.team_code})'
+            assert float(data['belle'][0]['points']) == 9
+            assert not any('events_entered' in s or 'FROM competitors' in s for s in statements)
+
     def test_nonexistent_tournament_404(self, client):
         resp = client.get('/api/public/tournaments/99999/standings')
         assert resp.status_code in (200, 404)
@@ -104,6 +137,57 @@ class TestScheduleAPI:
         resp = client.get(f'/api/public/tournaments/{tournament.id}/schedule')
         assert resp.status_code == 200
 
+    def test_schedule_query_count_does_not_grow_with_heats(self, client, db_session, tournament):
+        flights = [make_flight(db_session, tournament, flight_number=n) for n in (1, 2)]
+        for i in range(4):
+            event = make_event(db_session, tournament, f'Sched Event {i}')
+            for heat_number in (1, 2):
+                make_heat(db_session, event, heat_number=heat_number, competitors=[],
+                          flight_id=flights[heat_number - 1].id)
+        db_session.commit()
+
+        with count_selects() as statements:
+            resp = client.get(f'/api/public/tournaments/{tournament.id}/schedule', buffered=True)
+        assert resp.status_code == 200
+        heats = [h for e in resp.get_json()['schedule'] for h in e['heats']]
+        assert sorted({h['flight_number'] for h in heats}) == [1, 2]
+        assert len(statements) <= 4
+        assert not any('flights.notes' in s for s in statements)
+
+    def test_streamed_body_is_what_jsonify_would_send(self, app, client, db_session, tournament):
+        busy = make_event(db_session, tournament, 'B Busy Event')
+        make_event(db_session, tournament, 'A Empty Event')
+        for heat_number in (2, 1):
+            make_heat(db_session, busy, heat_number=heat_number, competitors=[])
+        db_session.commit()
+
+        resp = client.get(f'/api/public/tournaments/{tournament.id}/schedule')
+        assert resp.is_streamed
+        data = json.loads(resp.data)
+        assert [(e['event_name'], [h['heat_number'] for h in e['heats']])
+                for e in data['schedule']] == [('A Empty Event', []), ('B Busy Event', [1, 2])]
+        with app.test_request_context():
+            assert resp.data == jsonify(data).get_data()
+        # A cache hit sends the stored text, byte for byte the same.
+        assert client.get(f'/api/public/tournaments/{tournament.id}/schedule').data == resp.data
+
+    def test_empty_schedule_is_valid_json(self, client, db_session, tournament):
+        db_session.commit()
+        resp = client.get(f'/api/public/tournaments/{tournament.id}/schedule')
+        assert json.loads(resp.data) == {'schedule': [], 'tournament_id': tournament.id}
+
+    def test_columnar_shape_revives_to_default_shape(self, client, db_session, tournament):
+        event = make_event(db_session, tournament, 'Shape Event')
+        for heat_number in (1, 2):
+            make_heat(db_session, event, heat_number=heat_number, competitors=[])
+        db_session.commit()
+
+        url = f'/api/public/tournaments/{tournament.id}/schedule'
+        plain = client.get(url).get_json()['schedule'][0]['heats']
+        packed = client.get(url + '?shape=hc').get_json()['schedule'][0]['heats']
+        assert packed['keys'][0] == 'id'
+        assert [dict(zip(packed['keys'], row)) for row in packed['rows']] == plain
+
 
 # ---------------------------------------------------------------------------
 # /api/public/tournaments/<tid>/results
@@ -136,6 +220,35 @@ class TestResultsAPI:
         data = resp.get_json()
         assert isinstance(data, dict)
 
+    def test_columnar_shape_revives_to_default_shape(self, client, db_session, tournament):
+        event = make_event(db_session, tournament, 'Shape Results',
+                           scoring_type='time', scoring_order='lowest_wins',
+                           status='completed')
+        for i in range(2):
+            pro = make_pro_competitor(db_session, tournament, f'Shape Pro {i}', 'M',
+                                      events=[event.id])
+            make_event_result(db_session, event, pro, result_value=10.0 + i,
+                              final_position=i + 1, status='completed')
+        db_session.commit()
+
+        url = f'/api/public/tournaments/{tournament.id}/results'
+        plain = client.get(url).get_json()['results'][0]['results']
+        packed = client.get(url + '?shape=hc').get_json()['results'][0]['results']
+        assert len(packed['rows']) == 2
+        assert [dict(zip(packed['keys'], row)) for row in packed['rows']] == plain
+
+    def test_row_for_an_unlisted_event_does_not_hold_back_later_events(self):
+        from types import SimpleNamespace
+
+        from routes.api import _rows_by_event
+
+        events = [SimpleNamespace(id=1), SimpleNamespace(id=3)]
+        # Event 2 completed after the event list was read, so only its rows
+        # made it into the second query.
+        rows = [SimpleNamespace(event_id=e, n=n) for e, n in ((1, 'a'), (2, 'b'), (3, 'c'), (3, 'd'))]
+        paired = [(event.id, [row.n for row in batch]) for event, batch in _rows_by_event(events, rows)]
+        assert paired == [(1, ['a']), (3, ['c', 'd'])]
+
     def test_results_nonexistent_tournament(self, client):
         resp = client.get('/api/public/tournaments/99999/results')
         assert resp.status_code in (200, 404)
@@ -218,3 +331,97 @@ class TestHealthEndpoint:
         assert resp.status_code == 200
         data = resp.get_json()
         assert data['status'] == 'ok'
+
+
+# ---------------------------------------------------------------------------
+# Query budget — a public payload must not cost a SELECT per row
+# ---------------------------------------------------------------------------
+
+class TestPublicQueryBudget:
+    """The public endpoints stay at a fixed number of SELECTs.
+
+    Each endpoint's queries carry raiseload('*'), so a relationship read
+    while serializing fails here instead of adding a query per row.
+    """
+
+    @pytest.fixture()
+    def populated(self, db_session, tournament):
+        for code in ('UM-A', 'MSU-A', 'UI-A'):
+            team = make_team(db_session, tournament, code=code)
+            for i, gender in enumerate('MFMF'):
+                c = make_college_competitor(db_session, tournament, team,
+                                            f'{code} Cutter {i}', gender)
+                c.individual_points = 5 + i
+        event = make_event(db_session, tournament, 'Budget Event',
+                           scoring_type='time', scoring_order='lowest_wins',
+                           status='completed')
+        for i in range(6):
+            pro = make_pro_competitor(db_session, tournament, f'Budget Pro {i}', 'M',
+                                      events=[event.id])
+            pro.total_earnings = 100.0 * i
+            make_event_result(db_session, event, pro, result_value=10.0 + i,
+                              final_position=i + 1, status='completed')
+        db_session.commit()
+        return tournament
+
+    @pytest.mark.parametrize('path, budget', [
+        ('standings', 7),
+        ('results', 3),
+        ('standings-poll', 7),
+    ])
+    def test_fixed_select_count(self, client, populated, path, budget):
+        from services.report_cache import invalidate_prefix
+        invalidate_prefix('api:')
+        try:
+            with count_selects() as statements:
+                resp = client.get(f'/api/public/tournaments/{populated.id}/{path}', buffered=True)
+        finally:
+            invalidate_prefix('api:')
+        assert resp.status_code == 200
+        assert len(statements) <= budget
+
+
+
+class TestPublicPayloadCache:
+    """standings, schedule and results are served from report_cache."""
+
+    @pytest.fixture()
+    def cached(self, app, monkeypatch):
+        from services.report_cache import invalidate_prefix
+        monkeypatch.setitem(app.config, 'PUBLIC_CACHE_TTL_SECONDS', 30)
+        invalidate_prefix('api:')
+        yield
+        invalidate_prefix('api:')
+
+    @pytest.mark.parametrize('path', ['standings', 'schedule', 'results'])
+    def test_repeat_hit_skips_payload_queries(self, client, db_session, tournament,
+                                              cached, path):
+        db_session.commit()
+        url = f'/api/public/tournaments/{tournament.id}/{path}'
+        first = client.get(url).get_json()
+        with count_selects() as statements:
+            second = client.get(url).get_json()
+        assert second == first
+        # The tournament behind the 404 check is already in the session.
+        assert statements == []
+
+    def test_tournament_write_invalidates(self, client, db_session, tournament, cached):
+        from services.cache_invalidation import invalidate_tournament_caches
+        db_session.commit()
+        url = f'/api/public/tournaments/{tournament.id}/standings'
+        assert client.get(url).get_json()['teams'] == []
+        make_team(db_session, tournament, code='UM-A')
+        db_session.commit()
+        assert client.get(url).get_json()['teams'] == []
+        invalidate_tournament_caches(tournament.id)
+        assert [t['team_code'] for t in client.get(url).get_json()['teams']] == ['UM-A']
+
+    def test_zero_ttl_disables(self, app, client, db_session, tournament, cached,
+                               monkeypatch):
+        monkeypatch.setitem(app.config, 'PUBLIC_CACHE_TTL_SECONDS', 0)
+        db_session.commit()
+        url = f'/api/public/tournaments/{tournament.id}/schedule'
+        client.get(url, buffered=True)
+        with count_selects() as statements:
+            client.get(url, buffered=True)
+        assert statements
@@ -0,0 +1,136 @@
+"""
+routes/auth.py audit_log — the admin audit viewer's queries.
+"""
+import re
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from html import unescape
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import event as sa_event
+
+from database import db as _db
+from models.audit_log import AuditLog
+from services.report_cache import invalidate_prefix
+
+
+@contextmanager
+def count_selects():
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+
+
+@pytest.fixture()
+def audit_rows(db_session):
+    invalidate_prefix('audit:')
+    for action, entity_type in (('heat.scored', 'heat'), ('event.finalized', 'event'),
+                                ('heat.scored', 'event')):
+        db_session.add(AuditLog(action=action, entity_type=entity_type))
+    db_session.flush()
+    yield
+    invalidate_prefix('audit:')
+
+
+class TestFilterOptions:
+
+    def test_dropdowns_come_from_one_distinct_query(self, app, auth_client, audit_rows, monkeypatch):
+        monkeypatch.setitem(app.config, 'REPORT_CACHE_TTL_SECONDS', 0)
+        with count_selects() as statements:
+            resp = auth_client.get('/auth/audit')
+        assert resp.status_code == 200
+        html = resp.get_data(as_text=True)
+        assert '<option value="event.finalized"' in html
+        assert '<option value="heat"' in html
+        assert len([s for s in statements if 'DISTINCT' in s.upper()]) == 1
+
+    def test_dropdowns_are_cached(self, app, auth_client, audit_rows, monkeypatch):
+        monkeypatch.setitem(app.config, 'REPORT_CACHE_TTL_SECONDS', 60)
+        auth_client.get('/auth/audit')
+        with count_selects() as statements:
+            assert auth_client.get('/auth/audit').status_code == 200
+        assert not any('DISTINCT' in s.upper() for s in statements)
+
+
+class TestKeysetPagination:
+
+    @staticmethod
+    def _page(client, url):
+        html = client.get(url).get_data(as_text=True)
+        ids = [int(i) for i in re.findall(r'<small class="text-muted">#(\d+)</small>', html)]
+        links = {label: unescape(href) for href, label in
+                 re.findall(r'<a class="page-link" href="([^"]+)">(Newer|Older)</a>', html)}
+        return ids, links
+
+    def test_walks_every_entry_once_in_both_directions(self, auth_client, db_session):
+        # 120 rows over 3 distinct timestamps, so pages split inside ties.
+        start = datetime(2026, 4, 18, 9, 0)
+        for i in range(1, 121):
+            db_session.add(AuditLog(action='paging.test', entity_type='paging', entity_id=i,
+                                    created_at=start + timedelta(minutes=i % 3)))
+        db_session.flush()
+        newest_first = [r.entity_id for r in AuditLog.query.filter_by(entity_type='paging')
+                        .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())]
+
+        url, pages = '/auth/audit?entity_type=paging', []
+        with count_selects() as statements:
+            while url:
+                ids, links = self._page(auth_client, url)
+                pages.append(ids)
+                url = links.get('Older')
+        assert [len(p) for p in pages] == [50, 50, 20]
+        assert [i for p in pages for i in p] == newest_first
+        audit_reads = [s.lower() for s in statements if 'FROM audit_logs' in s]
+        assert audit_reads and not any('count(' in s for s in audit_reads)
+
+        ids, links = self._page(auth_client, links['Newer'])
+        assert ids == pages[1]
+        ids, links = self._page(auth_client, links['Newer'])
+        assert ids == pages[0] and 'Newer' not in links
+
+    def test_bad_cursor_shows_first_page(self, auth_client, db_session):
+        db_session.add(AuditLog(action='paging.test', entity_type='paging', entity_id=7))
+        db_session.flush()
+        ids, _ = self._page(auth_client, '/auth/audit?entity_type=paging&before_ts=nope&before_id=1')
+        assert ids == [7]
+
+
+class TestAuditIndexes:
+
+    @pytest.mark.parametrize('where, index', [
+        ('', 'ix_audit_logs_created_id'),
+        ("entity_type = 'heat' AND", 'ix_audit_logs_type_created'),
+        ('actor_user_id = 1 AND', 'ix_audit_logs_actor_created'),
+    ])
+    def test_viewer_pages_need_no_sort(self, db_session, where, index):
+        sql = (f"SELECT id FROM audit_logs WHERE {where} (created_at, id) < ('2026-04-18', 500) "
+               "ORDER BY created_at DESC, id DESC LIMIT 51")
+        plan = ' '.join(row[-1] for row in db_session.execute(sa.text('EXPLAIN QUERY PLAN ' + sql)))
+        assert index in plan
+        assert 'TEMP B-TREE' not in plan
+
+
+class TestDateFilters:
+
+    def test_from_and_to_bound_the_range_and_bad_values_are_ignored(self, auth_client, db_session):
+        for day in (17, 18, 19):
+            db_session.add(AuditLog(action='dated.test', entity_type='dated', entity_id=day,
+                                    created_at=datetime(2026, 4, day, 12, 0)))
+        db_session.flush()
+
+        def ids(query):
+            html = auth_client.get(f'/auth/audit?entity_type=dated&{query}').get_data(as_text=True)
+            return [int(i) for i in re.findall(r'<small class="text-muted">#(\d+)</small>', html)]
+
+        assert ids('from=2026-04-18T00:00&to=2026-04-18T23:59') == [18]
+        assert ids('from=2026-04-18T00:00&to=not-a-date') == [19, 18]
+        assert ids('from=garbage') == [19, 18, 17]
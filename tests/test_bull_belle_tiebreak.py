@@ -387,3 +387,51 @@ class TestScratchedCompetitorExcluded:
             .all()
         )
         assert unfinalized == []
+
+
+# ---------------------------------------------------------------------------
+# 7. Bull and Belle together — one query
+# ---------------------------------------------------------------------------
+
+
+class TestTopCompetitorsByGender:
+    """get_top_competitors_by_gender matches the two single-gender calls."""
+
+    def _seed_both(self, db_session, tournament):
+        team = _make_team(db_session, tournament)
+        _make_competitor(db_session, tournament, team, 'M-Low', 'M', 10)
+        _make_competitor(db_session, tournament, team, 'M-Tie-B', 'M', 30,
+                         placements={1: 1})
+        _make_competitor(db_session, tournament, team, 'M-Tie-A', 'M', 30,
+                         placements={1: 2})
+        _make_competitor(db_session, tournament, team, 'M-Top', 'M', 50)
+        _make_competitor(db_session, tournament, team, 'F-Two', 'F', 20)
+        _make_competitor(db_session, tournament, team, 'F-One', 'F', 40)
+        db_session.flush()
+
+    def test_same_rankings_as_separate_calls(self, db_session, tournament):
+        self._seed_both(db_session, tournament)
+        bull, belle = tournament.get_top_competitors_by_gender(3)
+        assert bull == tournament.get_bull_of_woods(3)
+        assert belle == tournament.get_belle_of_woods(3)
+        assert [c.name for c in bull] == ['M-Top', 'M-Tie-A', 'M-Tie-B']
+        assert [c.name for c in belle] == ['F-One', 'F-Two']
+
+    def test_one_select(self, db_session, tournament):
+        from sqlalchemy import event as sa_event
+        self._seed_both(db_session, tournament)
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            if 'FROM college_competitors' in statement:
+                statements.append(statement)
+
+        sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+        try:
+            tournament.get_top_competitors_by_gender(10)
+        finally:
+            sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+        assert len(statements) == 1
+
+    def test_empty_tournament(self, db_session, tournament):
+        assert tournament.get_top_competitors_by_gender(10) == ([], [])
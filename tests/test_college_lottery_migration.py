@@ -0,0 +1,90 @@
+"""Migration x3f7a8b9c0d1 — college lottery opt-in moves out of partners JSON.
+
+The backfill is called directly against rows written in the old shape; the
+column already exists because the test app ran the whole chain.
+"""
+import importlib.util
+import json
+import pathlib
+
+import sqlalchemy as sa
+
+from models.competitor import CollegeCompetitor
+from tests.conftest import make_college_competitor, make_team, make_tournament
+
+_MIGRATION = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "migrations" / "versions" / "x3f7a8b9c0d1_college_lottery_opt_in_column.py"
+)
+
+
+def _load():
+    spec = importlib.util.spec_from_file_location("mig_x3f7a8b9c0d1", _MIGRATION)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+mig = _load()
+
+
+def _old_shape(db_session, comp, partners):
+    db_session.connection().execute(
+        sa.text("UPDATE college_competitors SET partners = :p, "
+                "pro_am_lottery_opt_in = false WHERE id = :id"),
+        {"p": json.dumps(partners), "id": comp.id})
+
+
+def _row(db_session, comp):
+    db_session.expire_all()
+    fresh = db_session.get(CollegeCompetitor, comp.id)
+    return fresh.pro_am_lottery_opt_in, fresh.get_partners()
+
+
+class TestBackfill:
+
+    def test_marker_becomes_column_and_is_stripped(self, db_session):
+        t = make_tournament(db_session)
+        team = make_team(db_session, t)
+        comp = make_college_competitor(db_session, t, team, "Lottery Yes", "F")
+        _old_shape(db_session, comp, {"3": "Sam", mig.META_KEY: "Yes"})
+        assert mig._backfill(db_session.connection()) == 1
+        assert _row(db_session, comp) == (True, {"3": "Sam"})
+
+    def test_falsey_marker_is_stripped_and_stays_out(self, db_session):
+        t = make_tournament(db_session)
+        team = make_team(db_session, t)
+        comp = make_college_competitor(db_session, t, team, "Lottery No", "M")
+        _old_shape(db_session, comp, {mig.META_KEY: "no"})
+        assert mig._backfill(db_session.connection()) == 0
+        assert _row(db_session, comp) == (False, {})
+
+    def test_rows_without_marker_are_untouched(self, db_session):
+        t = make_tournament(db_session)
+        team = make_team(db_session, t)
+        comp = make_college_competitor(db_session, t, team, "No Marker", "M")
+        _old_shape(db_session, comp, {"__pro_am_lottery_note": "x"})
+        mig._backfill(db_session.connection())
+        assert _row(db_session, comp) == (False, {"__pro_am_lottery_note": "x"})
+
+
+class TestColumn:
+
+    def test_lottery_pool_filters_in_sql(self, db_session):
+        from services.proam_relay import ProAmRelay
+        t = make_tournament(db_session)
+        team = make_team(db_session, t)
+        make_college_competitor(db_session, t, team, "In Pool", "F").pro_am_lottery_opt_in = True
+        make_college_competitor(db_session, t, team, "Out Of Pool", "M")
+        db_session.flush()
+        names = [c["name"] for c in ProAmRelay(t).get_eligible_college_competitors()]
+        assert names == ["In Pool"]
+
+    def test_replacing_partners_keeps_opt_in(self, db_session):
+        t = make_tournament(db_session)
+        team = make_team(db_session, t)
+        comp = make_college_competitor(db_session, t, team, "Keeps Flag", "F")
+        comp.pro_am_lottery_opt_in = True
+        comp.partners = json.dumps({"5": "Alex"})
+        db_session.flush()
+        assert _row(db_session, comp) == (True, {"5": "Alex"})
@@ -69,3 +69,19 @@ def test_csrf_error_falls_back_to_request_path_when_no_referrer(csrf_app):
         assert location.endswith(
             "/scheduling/2/events"
         ), f"expected fallback to request path, got {location!r}"
+
+
+def test_anonymous_public_page_skips_csrf_meta_token(client):
+    """Spectator/portal GETs don't sign a CSRF token or open a session for it."""
+    resp = client.get("/portal/")
+    assert resp.status_code == 200
+    assert 'name="csrf-token"' not in resp.get_data(as_text=True)
+    with client.session_transaction() as sess:
+        assert "csrf_token" not in sess
+
+
+def test_authenticated_page_keeps_csrf_meta_token(auth_client):
+    """Management pages still get the meta tag their fetch() calls read."""
+    resp = auth_client.get("/", follow_redirects=True)
+    assert resp.status_code == 200
+    assert 'name="csrf-token"' in resp.get_data(as_text=True)
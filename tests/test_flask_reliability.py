@@ -164,6 +164,17 @@ class TestConfiguration:
             from config import ProductionConfig, get_config
             assert get_config() is ProductionConfig
 
+    def test_get_config_memo_follows_env(self, monkeypatch):
+        import config as config_module
+        monkeypatch.setenv('DATABASE_URL', 'sqlite:////tmp/memo_a.db')
+        first = config_module.get_config()
+        assert first.SQLALCHEMY_DATABASE_URI == 'sqlite:////tmp/memo_a.db'
+        hits = config_module._resolve_config.cache_info().hits
+        config_module.get_config()
+        assert config_module._resolve_config.cache_info().hits == hits + 1
+        monkeypatch.setenv('DATABASE_URL', 'sqlite:////tmp/memo_b.db')
+        assert config_module.get_config().SQLALCHEMY_DATABASE_URI == 'sqlite:////tmp/memo_b.db'
+
     def test_weak_secret_rejected(self):
         from config import validate_runtime
         with pytest.raises(RuntimeError):
@@ -191,6 +202,25 @@ class TestConfiguration:
     def test_pool_pre_ping(self, app):
         assert app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}).get('pool_pre_ping') is True
 
+    def test_engine_pool_sized_from_env(self, monkeypatch):
+        from config import _engine_options
+        monkeypatch.setenv('DB_POOL_SIZE', '3')
+        monkeypatch.setenv('DB_MAX_OVERFLOW', '4')
+        opts = _engine_options('postgresql://u:p@h/db')
+        assert opts['pool_size'] == 3
+        assert opts['max_overflow'] == 4
+        assert opts['pool_recycle'] == 1800
+        assert 'connect_args' not in opts
+
+    def test_sqlite_engine_options(self):
+        from config import _engine_options
+        opts = _engine_options('sqlite:////tmp/proam.db')
+        assert opts['connect_args'] == {'check_same_thread': False, 'timeout': 30}
+        assert 'pool_size' in opts
+        memory = _engine_options('sqlite://')
+        assert 'pool_size' not in memory
+        assert memory['pool_pre_ping'] is True
+
     def test_create_app_from_parent_directory_uses_project_paths(self, monkeypatch):
         """Verify config.py resolves paths relative to the project root,
         regardless of the current working directory.
@@ -579,6 +609,27 @@ class TestContextProcessor:
                 ctx.update(fn())
             assert ctx.get('unscored_heats', 0) == 0
 
+    def test_unscored_heats_deferred_until_read(self, app, monkeypatch):
+        import services.sidebar_aggregator as sidebar
+        calls = []
+
+        def _count(tid):
+            calls.append(tid)
+            return 3
+
+        monkeypatch.setattr(sidebar, 'unscored_heats_count', _count)
+        tid = 99999
+        with app.test_request_context(f'/tournament/{tid}'):
+            from flask import request as _req
+            _req.view_args = {'tournament_id': tid}
+            ctx = {}
+            for fn in app.template_context_processors[None]:
+                ctx.update(fn())
+            assert calls == []
+            pending = ctx['unscored_heats']
+            assert pending > 0 and str(pending) == '3'
+            assert calls == [tid]
+
 
 # ===========================================================================
 # 12. EVENTRESULT METHODS
@@ -697,6 +748,13 @@ class TestBlueprintPermissionCoverage:
         for bp, attr in BLUEPRINT_PERMISSIONS.items():
             assert hasattr(User, attr)
 
+    def test_policy_tables_are_read_only(self):
+        from app import BLUEPRINT_PERMISSIONS, MANAGEMENT_BLUEPRINTS, PUBLIC_MAIN_ENDPOINTS
+        with pytest.raises(TypeError):
+            BLUEPRINT_PERMISSIONS['main'] = 'is_admin'
+        assert not hasattr(MANAGEMENT_BLUEPRINTS, 'add')
+        assert not hasattr(PUBLIC_MAIN_ENDPOINTS, 'add')
+
 class TestHeatRosterWithoutASession:
     """A detached Heat has no roster, and says so instead of raising.
 
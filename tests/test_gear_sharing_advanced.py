@@ -73,6 +73,45 @@ class TestBuildGearReport:
         assert isinstance(stats, dict)
 
 
+class TestRosterReadersLoadGearDetails:
+    """gear_sharing_details is deferred on ProCompetitor; roster-wide
+    readers must fetch it in their own SELECT, not once per competitor."""
+
+    @staticmethod
+    def _pro_selects(fn, tournament):
+        from sqlalchemy import event as sa_event
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT') and 'FROM pro_competitors' in statement:
+                statements.append(statement)
+
+        sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+        try:
+            fn(tournament)
+        finally:
+            sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+        return statements
+
+    def _seed(self, db_session, tournament):
+        make_event(db_session, tournament, 'Single Buck', stand_type='saw_hand')
+        for n in range(8):
+            comp = make_pro_competitor(db_session, tournament, f'Sharer {n}', 'M')
+            comp.gear_sharing_details = f'SHARING Single Buck saw with Sharer {(n + 1) % 8}'
+        db_session.flush()
+        db_session.expire_all()
+
+    def test_parse_review_reads_details_in_one_select(self, db_session, tournament):
+        from services.gear_sharing import build_parse_review
+        self._seed(db_session, tournament)
+        assert len(self._pro_selects(build_parse_review, tournament)) == 1
+
+    def test_gear_report_reads_details_in_one_select(self, db_session, tournament):
+        from services.gear_sharing import build_gear_report
+        self._seed(db_session, tournament)
+        assert len(self._pro_selects(build_gear_report, tournament)) == 1
+
+
 # ---------------------------------------------------------------------------
 # complete_one_sided_pairs
 # ---------------------------------------------------------------------------
@@ -172,6 +172,14 @@ class TestCompetitorEnteredEvent:
         ev = _event(id=5, name='Underhand', event_type='college')
         assert _competitor_entered_event(ev, ['UNDERHAND']) is True
 
+    def test_renamed_event_matches_new_name(self):
+        # The alias set is memoized by name, not by event id.
+        ev = _event(id=6, name='Underhand', event_type='college')
+        assert _competitor_entered_event(ev, ['Underhand']) is True
+        ev.name = ev.display_name = 'Standing Block'
+        assert _competitor_entered_event(ev, ['Underhand']) is False
+        assert _competitor_entered_event(ev, ['Standing Block']) is True
+
 
 # ---------------------------------------------------------------------------
 # _is_list_only_event
@@ -220,6 +220,33 @@ class TestAudit:
             after_count = AuditLog.query.count()
             assert after_count == before_count + 1
 
+    def test_actor_id_read_without_reloading_user(self, app, db_session, admin_user):
+        from flask_login import login_user
+        from sqlalchemy import event as sa_event
+
+        from models.audit_log import AuditLog
+        from services.audit import log_action
+
+        selects = []
+
+        def _record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                selects.append(statement)
+
+        with app.test_request_context('/test', method='POST'):
+            login_user(admin_user)
+            db_session.expire(admin_user)
+            sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+            try:
+                log_action('expired_actor', 'User', entity_id=1)
+            finally:
+                sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+            db_session.flush()
+
+        assert selects == []
+        record = db_session.query(AuditLog).filter_by(action='expired_actor').one()
+        assert record.actor_user_id == admin_user.id
+
     def test_log_action_outside_request_context(self, app):
         """log_action() should work even without a Flask request context
         (ip_address and user_agent will be None)."""
@@ -369,6 +396,65 @@ class TestBackgroundJobs:
             assert row.tournament_id == 7
 
 
+def _queued_job_target(value):
+    """Module-level, so a queue worker could import it by dotted name."""
+    return value * 2
+
+
+class _RecordingQueue:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def enqueue(self, func, args=(), kwargs=None, job_id=None):
+        if self.fail:
+            raise ConnectionError('redis down')
+        self.calls.append((func, args, kwargs, job_id))
+
+
+class TestBackgroundJobQueue:
+    """REDIS_URL path: importable jobs go to the queue, the rest stay local."""
+
+    def test_no_redis_url_means_no_queue(self):
+        from services import background_jobs
+        assert background_jobs._queue is None
+
+    def test_importable_job_is_enqueued(self, app, monkeypatch):
+        from services import background_jobs
+        queue = _RecordingQueue()
+        monkeypatch.setattr(background_jobs, '_queue', queue)
+        job_id = background_jobs.submit('queued-job', _queued_job_target, 21)
+        assert len(queue.calls) == 1
+        func, args, kwargs, queued_id = queue.calls[0]
+        assert func is background_jobs.run_queued_job
+        assert args == (job_id, _queued_job_target, 21)
+        assert queued_id == job_id
+        assert background_jobs.get(job_id)['status'] == 'queued'
+
+        # What the worker does with it.
+        assert func(*args, **kwargs) == 42
+        info = background_jobs.get(job_id)
+        assert info['status'] == 'completed'
+        assert info['result'] == 42
+
+    def test_lambda_and_unreachable_redis_fall_back(self, app, monkeypatch):
+        from services import background_jobs
+        queue = _RecordingQueue()
+        monkeypatch.setattr(background_jobs, '_queue', queue)
+        done = threading.Event()
+        background_jobs.submit('local-lambda', lambda: done.set())
+        assert done.wait(2.0)
+        assert queue.calls == []
+
+        monkeypatch.setattr(background_jobs, '_queue', _RecordingQueue(fail=True))
+        job_id = background_jobs.submit('redis-down', _queued_job_target, 1)
+        for _ in range(20):
+            if background_jobs.get(job_id)['status'] == 'completed':
+                break
+            time.sleep(0.05)
+        assert background_jobs.get(job_id)['result'] == 2
+
+
 # ===================================================================
 # CacheInvalidation tests  (services/cache_invalidation.py)
 # ===================================================================
@@ -428,6 +514,60 @@ class TestCacheInvalidation:
                 'portal:college:7',
                 'portal:pro:7',
                 'api:standings-poll:7',
+                'api:standings:7',
+                'api:schedule:7',
+                'api:results:7',
             ]
             actual_prefixes = [call.args[0] for call in mock_inv.call_args_list]
             assert actual_prefixes == expected_prefixes
+
+
+# ---------------------------------------------------------------------------
+# Cold start
+# ---------------------------------------------------------------------------
+
+class TestColdStart:
+    """App boot must not pay for the spreadsheet stack."""
+
+    def test_create_app_does_not_import_pandas(self, tmp_path):
+        import os
+        import subprocess
+        import sys
+
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env['DATABASE_URL'] = f"sqlite:///{tmp_path / 'cold_start.db'}"
+        env['SECRET_KEY'] = 'test-secret-cold-start'
+        code = (
+            'import sys, app; app.create_app(); '
+            "print('pandas' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=project_root, env=env, capture_output=True, text=True, timeout=120,
+        )
+        assert out.returncode == 0, out.stderr
+        assert out.stdout.strip().splitlines()[-1] == 'False'
+
+    def test_url_map_compiled_at_boot(self, app):
+        # The module app has served no request yet; its matcher must already
+        # be built so the first request does not pay for the compile.
+        assert app.url_map._remap is False
+        prefixes = {r.rule.split('/')[1] for r in app.url_map.iter_rules()}
+        assert {'registration', 'scheduling', 'scoring', 'reporting', 'auth',
+                'portal', 'api', 'woodboss', 'strathmark', 'demo'} <= prefixes
+        assert 'api_v1' in app.blueprints
+
+    def test_upload_dir_created_once_per_path(self, tmp_path, monkeypatch):
+        import app as app_module
+
+        calls = []
+        real = app_module.os.makedirs
+        monkeypatch.setattr(app_module.os, 'makedirs',
+                            lambda p, **kw: (calls.append(p), real(p, **kw)))
+        monkeypatch.setattr(app_module, '_READY_DIRS', set())
+        first, second = str(tmp_path / 'a'), str(tmp_path / 'b')
+        for path in (first, first, second):
+            app_module._ensure_dir(path)
+        assert calls == [first, second]
+        assert (tmp_path / 'b').is_dir()
@@ -0,0 +1,66 @@
+"""
+services/json_provider.py — orjson behind jsonify.
+
+The bytes may differ from the stdlib encoder's; what a client parses must not.
+"""
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup
+
+from services.json_provider import ORJSONProvider
+
+
+@pytest.fixture()
+def providers():
+    app = Flask(__name__)
+    return ORJSONProvider(app), DefaultJSONProvider(app)
+
+
+SAMPLE = {
+    'b': [1, 2.5, None, True, 'Célestine'],
+    'a': {2: 'two', 1: 'one'},
+    'points': Decimal('12.50'),
+    'when': datetime.datetime(2026, 4, 18, 9, 30),
+    'day': datetime.date(2026, 4, 18),
+    'uid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'html': Markup('<b>x</b>'),
+}
+
+
+class TestORJSONProvider:
+
+    def test_parses_to_what_the_default_provider_emits(self, providers):
+        fast, default = providers
+        assert json.loads(fast.dumps(SAMPLE)) == json.loads(default.dumps(SAMPLE))
+
+    def test_sorts_keys_like_the_default_provider(self, providers):
+        fast, default = providers
+        assert fast.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+        fast.sort_keys = False
+        assert fast.dumps({'b': 1, 'a': 2}) == '{"b":1,"a":2}'
+
+    def test_oversized_int_falls_back_to_stdlib(self, providers):
+        fast, _ = providers
+        assert fast.dumps({'n': 2 ** 70}) == json.dumps({'n': 2 ** 70})
+
+    def test_unserializable_still_raises_type_error(self, providers):
+        fast, _ = providers
+        with pytest.raises(TypeError):
+            fast.dumps({'x': object()})
+
+    def test_loads_accepts_bytes_and_str(self, providers):
+        fast, _ = providers
+        assert fast.loads(b'{"a": [1]}') == fast.loads('{"a": [1]}') == {'a': [1]}
+
+    def test_app_jsonify_uses_orjson(self, app):
+        assert isinstance(app.json, ORJSONProvider)
+        with app.test_request_context():
+            resp = app.json.response({'points': Decimal('3.5')})
+        assert resp.mimetype == 'application/json'
+        assert resp.get_json() == {'points': '3.5'}
@@ -0,0 +1,57 @@
+"""
+routes/main.py index / judge_dashboard — the tournament picker pages.
+"""
+from flask import template_rendered
+from sqlalchemy import event as sa_event
+
+from database import db as _db
+from tests.conftest import make_tournament
+
+
+def _render(app, client, url):
+    contexts, statements = [], []
+
+    def _capture(sender, template, context, **extra):
+        contexts.append(context)
+
+    def _record(conn, cursor, statement, *args):
+        if 'FROM tournaments' in statement:
+            statements.append(statement)
+
+    template_rendered.connect(_capture, app)
+    sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+    try:
+        resp = client.get(url)
+    finally:
+        sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+        template_rendered.disconnect(_capture, app)
+    return resp, contexts[0], statements
+
+
+class TestActiveTournament:
+
+    def test_judge_dashboard_takes_newest_active_from_the_list(self, app, auth_client, db_session):
+        make_tournament(db_session, name='Old Active', year=2997, status='college_active')
+        newest = make_tournament(db_session, name='New Active', year=2999, status='pro_active')
+        make_tournament(db_session, name='Done', year=3000, status='completed')
+
+        resp, context, statements = _render(app, auth_client, '/judge')
+
+        assert resp.status_code == 200
+        assert context['active_tournament'] is newest
+        assert len(statements) == 1
+
+    def test_index_uses_one_tournament_query(self, app, client, db_session):
+        newest = make_tournament(db_session, name='New Active', year=2999, status='setup')
+
+        resp, context, statements = _render(app, client, '/')
+
+        assert resp.status_code == 200
+        assert context['active_tournament'] is newest
+        assert len(statements) == 1
+
+    def test_none_when_every_tournament_is_finished(self, db_session):
+        from routes.main import _newest_active
+        done = make_tournament(db_session, name='Done', year=3000, status='completed')
+        assert _newest_active([done]) is None
+        assert _newest_active([]) is None
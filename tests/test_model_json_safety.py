@@ -112,6 +112,62 @@ class TestProCompetitorJsonSafety:
         assert c.get_partners() == {}
 
 
+class TestCompetitorJsonMemo:
+    """The JSON getters parse a column once per distinct value."""
+
+    def test_repeat_reads_parse_once(self, db_session, tournament):
+        c = make_pro_competitor(db_session, tournament, 'Memo1', 'M')
+        c.entry_fees = json.dumps({'1': 10, '2': 15})
+        c.fees_paid = json.dumps({'1': True})
+        with patch('models._json.loads', wraps=json.loads) as loads:
+            assert c.fees_balance == 15
+            assert c.total_fees_owed == 25
+            c.get_entry_fees()
+        assert loads.call_count == 2
+
+    def test_direct_column_write_is_seen(self, db_session, tournament):
+        c = make_pro_competitor(db_session, tournament, 'Memo2', 'M')
+        c.set_partner(5, 'Alex')
+        assert c.get_partners() == {'5': 'Alex'}
+        c.partners = json.dumps({'5': 'Sam'})
+        assert c.get_partners() == {'5': 'Sam'}
+
+    def test_caller_mutation_does_not_leak(self, db_session, tournament):
+        team = make_team(db_session, tournament)
+        c = make_college_competitor(db_session, tournament, team, 'Memo3', 'F')
+        c.set_events_entered(['Axe Throw'])
+        c.get_events_entered().append('Pulp Toss')
+        assert c.get_events_entered() == ['Axe Throw']
+        assert json.loads(c.events_entered) == ['Axe Throw']
+
+    def test_setter_loop_never_reparses(self, db_session, tournament):
+        c = make_pro_competitor(db_session, tournament, 'Memo4', 'M')
+        with patch('models._json.loads', wraps=json.loads) as loads:
+            for event_id in range(10):
+                c.set_partner(event_id, f'P{event_id}')
+                c.set_fee_paid(event_id)
+        assert loads.call_count == 2
+        assert len(json.loads(c.partners)) == 10
+        assert c.get_fees_paid()['9'] is True
+
+
+class TestJsonCodec:
+    """models/_json.py matches the stdlib on what the columns rely on."""
+
+    def test_int_keys_are_stringified(self):
+        from models import _json
+        assert json.loads(_json.dumps({1: 'a', '2': True})) == {'1': 'a', '2': True}
+
+    def test_returns_text(self):
+        from models import _json
+        assert isinstance(_json.dumps([1, 'x']), str)
+
+    def test_bad_input_raises_stdlib_error(self):
+        from models import _json
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads('{bad')
+
+
 class TestEventJsonSafety:
     """Event JSON getters survive corruption."""
 
@@ -127,6 +183,22 @@ class TestEventJsonSafety:
         e.payouts = None
         assert e.get_payouts() == {}
 
+    def test_payout_lookups_parse_once(self, db_session, tournament):
+        e = make_event(db_session, tournament, 'Memo Payouts')
+        e.payouts = json.dumps({str(p): 100 - p for p in range(1, 21)})
+        with patch('models._json.loads', wraps=json.loads) as loads:
+            amounts = [e.get_payout_for_position(p) for p in range(1, 22)]
+        assert loads.call_count == 1
+        assert amounts[0] == 99 and amounts[-1] == 0
+
+    def test_set_payouts_is_seen_and_not_shared(self, db_session, tournament):
+        e = make_event(db_session, tournament, 'Memo Payouts 2')
+        e.get_payouts()
+        e.set_payouts({'1': 250})
+        assert e.get_payout_for_position(1) == 250
+        e.get_payouts()['1'] = 0
+        assert e.get_payout_for_position(1) == 250
+
 
 # `class TestHeatJsonSafety` stood here: three tests that wrote garbage into
 # `heats.competitors` and `heats.stand_assignments` and asserted the raw
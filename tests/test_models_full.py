@@ -195,6 +195,80 @@ class TestTournamentCountProperties:
         _make_pro_competitor(t)
         assert t.pro_competitor_count == 1
 
+    def test_summary_counts_scoped_to_tournament(self, db_session):
+        t = _make_tournament()
+        other = _make_tournament(name='Other')
+        team = _make_team(t)
+        _make_college_competitor(t, team, name='Alice', gender='F')
+        _make_pro_competitor(t)
+        done = _make_event(t, name='Hot Saw')
+        done.status = 'completed'
+        _make_heat(done)
+        _make_heat(done, heat_number=2)
+        _make_event(t, name='Obstacle Pole')
+        _make_heat(_make_event(other, name='Hot Saw'))
+        _db.session.flush()
+
+        assert t.summary_counts() == {
+            'college_teams': 1,
+            'college_competitors': 1,
+            'pro_competitors': 1,
+            'events': 2,
+            'completed_events': 1,
+            'heats_generated': 2,
+            'wood_configured': False,
+            'flights_built': False,
+        }
+        assert other.summary_counts()['heats_generated'] == 1
+
+
+class TestTournamentStandingsQueries:
+    """Bull/Belle and team standings sort and limit in the database."""
+
+    def test_bull_of_woods_limits_in_sql(self, db_session):
+        from sqlalchemy import event as sa_event
+        t = _make_tournament()
+        team = _make_team(t)
+        for i in range(4):
+            _make_college_competitor(t, team, f'Bull {i}', 'M').individual_points = i
+        _make_college_competitor(t, team, 'Belle', 'F').individual_points = 99
+        _db.session.flush()
+
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            if 'FROM college_competitors' in statement:
+                statements.append(statement)
+
+        sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+        try:
+            top = t.get_bull_of_woods(2)
+        finally:
+            sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+        assert [c.name for c in top] == ['Bull 3', 'Bull 2']
+        assert len(statements) == 1 and 'LIMIT' in statements[0]
+
+    def test_standings_indexes_exist(self, db_session):
+        import sqlalchemy as sa
+        inspector = sa.inspect(_db.engine)
+        college = {ix['name']: ix['column_names']
+                   for ix in inspector.get_indexes('college_competitors')}
+        assert college['ix_college_competitors_standings'] == [
+            'tournament_id', 'gender', 'status', 'individual_points']
+
+    @pytest.mark.parametrize('sql, index', [
+        ("SELECT id FROM teams WHERE tournament_id = 1 AND status = 'active' "
+         "ORDER BY total_points DESC, team_code LIMIT 15", 'ix_teams_standings'),
+        ("SELECT id FROM pro_competitors WHERE tournament_id = 1 AND status = 'active' "
+         "ORDER BY total_earnings DESC, name LIMIT 15", 'ix_pro_competitors_earnings'),
+    ])
+    def test_leaderboard_reads_need_no_sort(self, db_session, sql, index):
+        import sqlalchemy as sa
+        plan = ' '.join(row[-1] for row in
+                        _db.session.execute(sa.text('EXPLAIN QUERY PLAN ' + sql)))
+        assert index in plan
+        assert 'TEMP B-TREE' not in plan
+
 
 # ===========================================================================
 # Team Tests
@@ -257,6 +331,36 @@ class TestTeamProperties:
         assert team.member_count == 9
         assert team.is_valid is False
 
+    def test_roster_counts_cover_every_team(self, db_session):
+        from models.team import Team
+        t = _make_tournament()
+        full = _make_team(t)
+        empty = _make_team(t, team_code='UM-B')
+        _make_college_competitor(t, full, 'M1', 'M')
+        _make_college_competitor(t, full, 'F1', 'F')
+        _make_college_competitor(t, full, 'F2', 'F')
+        _make_college_competitor(t, full, 'Gone', 'M').status = 'scratched'
+        _db.session.flush()
+        assert Team.get_roster_counts(t.id) == {full.id: (1, 2, 3), empty.id: (0, 0, 0)}
+
+    def test_primed_counts_skip_per_team_queries(self, app, db_session):
+        from models.team import Team
+        t = _make_tournament()
+        teams = [_make_team(t, team_code=f'UM-{c}') for c in 'ABC']
+        for team in teams:
+            for i, g in enumerate('MMFF'):
+                _make_college_competitor(t, team, f'{team.team_code} {i}', g)
+        _db.session.flush()
+        with app.test_request_context():
+            Team.prime_roster_counts(t.id)
+            statements, stop = TestEagerLoads._count_selects()
+            try:
+                assert [tm.is_valid for tm in teams] == [True, True, True]
+                assert [tm.member_count for tm in teams] == [4, 4, 4]
+            finally:
+                stop()
+        assert statements == []
+
 
 class TestTeamRecalculatePoints:
     """recalculate_points sums member individual_points."""
@@ -290,6 +394,35 @@ class TestTeamRecalculatePoints:
         result = team.recalculate_points()
         assert result == 10
 
+    def test_bulk_recalculate_by_tournament(self, db_session):
+        from models.team import Team
+        t = _make_tournament()
+        other = _make_tournament(name='Other')
+        a, b = _make_team(t), _make_team(t, team_code='UM-B')
+        untouched = _make_team(other)
+        untouched.total_points = 5
+        _make_college_competitor(t, a, 'A1', 'M').individual_points = 4
+        _make_college_competitor(t, a, 'A2', 'F').individual_points = 3.5
+        scratched = _make_college_competitor(t, b, 'B1', 'M')
+        scratched.individual_points = 9
+        scratched.status = 'scratched'
+        assert Team.bulk_recalculate(tournament_id=t.id) == 2
+        # Pending member changes were flushed and stale totals expired.
+        assert (float(a.total_points), float(b.total_points)) == (7.5, 0.0)
+        assert untouched.total_points == 5
+
+    def test_bulk_recalculate_by_team_ids(self, db_session):
+        from models.team import Team
+        t = _make_tournament()
+        a, b = _make_team(t), _make_team(t, team_code='UM-B')
+        _make_college_competitor(t, a, 'A1', 'M').individual_points = 4
+        _make_college_competitor(t, b, 'B1', 'M').individual_points = 6
+        assert Team.bulk_recalculate(team_ids=[a.id]) == 1
+        assert (a.total_points, b.total_points) == (4, 0)
+        assert Team.bulk_recalculate(team_ids=[]) == 0
+        with pytest.raises(ValueError):
+            Team.bulk_recalculate()
+
 
 class TestTeamValidationErrors:
     """get_validation_errors / set_validation_errors round-trip."""
@@ -343,6 +476,36 @@ class TestCollegeCompetitorNameTruncation:
         assert len(c.name) == 100
 
 
+class TestCollegeCompetitorRepr:
+    """__repr__ never emits SQL."""
+
+    def test_repr_uses_loaded_team(self, db_session):
+        from models.competitor import CollegeCompetitor
+        t = _make_tournament()
+        c = _make_college_competitor(t, _make_team(t), name='Repr Cutter')
+        _db.session.expire_all()
+        loaded = _db.session.get(CollegeCompetitor, c.id)
+        statements, stop = TestEagerLoads._count_selects()
+        try:
+            text = repr(loaded)
+        finally:
+            stop()
+        assert text == '<CollegeCompetitor Repr Cutter (UM-A)>'
+        assert statements == []
+
+    def test_repr_of_expired_row_does_not_load(self, db_session):
+        t = _make_tournament()
+        c = _make_college_competitor(t, _make_team(t))
+        _db.session.expire(c)
+        statements, stop = TestEagerLoads._count_selects()
+        try:
+            text = repr(c)
+        finally:
+            stop()
+        assert text == '<CollegeCompetitor ? (team not loaded)>'
+        assert statements == []
+
+
 class TestCollegeCompetitorEventsEntered:
     """get_events_entered / set_events_entered round-trip."""
 
@@ -613,6 +776,13 @@ class TestProCompetitorAddEarnings:
         p.add_earnings(250.0)
         assert p.total_earnings == 750.0
 
+    def test_add_earnings_stays_on_cents(self, db_session):
+        t = _make_tournament()
+        p = _make_pro_competitor(t)
+        for _ in range(10):
+            p.add_earnings(0.1)
+        assert p.total_earnings == 1.0
+
 
 class TestProCompetitorFeeProperties:
     """total_fees_owed, total_fees_paid, fees_balance."""
@@ -653,6 +823,26 @@ class TestProCompetitorFeeProperties:
         p = _make_pro_competitor(t)
         assert p.fees_balance == 0.0
 
+    def test_paid_flag_without_fee_counts_nothing(self, db_session):
+        t = _make_tournament()
+        p = _make_pro_competitor(t)
+        p.set_entry_fee(1, 25.0)
+        p.set_fee_paid(9, True)
+        assert p.total_fees_paid == 0
+        assert p.fees_balance == 25.0
+
+    def test_sum_fee_totals_across_competitors(self, db_session):
+        from models.competitor import ProCompetitor
+        t = _make_tournament()
+        a = _make_pro_competitor(t, name='A Pro')
+        b = _make_pro_competitor(t, name='B Pro')
+        a.set_entry_fee(1, 25.0)
+        a.set_entry_fee(2, 50.0)
+        a.set_fee_paid(2, True)
+        b.set_entry_fee(1, 10.0)
+        assert ProCompetitor.sum_fee_totals([a, b]) == (85.0, 50.0)
+        assert ProCompetitor.sum_fee_totals([]) == (0, 0)
+
 
 class TestProCompetitorPortalPin:
     """Portal PIN methods for ProCompetitor."""
@@ -675,6 +865,22 @@ class TestProCompetitorPortalPin:
         p = _make_pro_competitor(t)
         assert p.check_portal_pin('1234') is False
 
+    def test_pin_uses_portal_hash_method(self, db_session):
+        from models.competitor import PIN_HASH_METHOD
+        t = _make_tournament()
+        p = _make_pro_competitor(t)
+        p.set_portal_pin('2468')
+        assert p.portal_pin_hash.startswith(PIN_HASH_METHOD + '$')
+        assert p.check_portal_pin('2468') is True
+
+    def test_pin_hashed_with_default_method_still_checks(self, db_session):
+        from werkzeug.security import generate_password_hash
+        t = _make_tournament()
+        p = _make_pro_competitor(t)
+        p.portal_pin_hash = generate_password_hash('1357')
+        assert p.check_portal_pin('1357') is True
+        assert p.check_portal_pin('7531') is False
+
 
 # ===========================================================================
 # Event Tests
@@ -745,6 +951,119 @@ class TestEventPayouts:
         assert e.get_payouts() == {}
 
 
+class TestEagerLoads:
+    """Listing pages load results and teams without a query per row."""
+
+    @staticmethod
+    def _count_selects():
+        from sqlalchemy import event as sa_event
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append(statement)
+
+        sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+        return statements, lambda: sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+
+    def test_selectin_results_sorted_by_position(self, db_session):
+        from sqlalchemy.orm import selectinload
+
+        from models.event import Event
+        t = _make_tournament()
+        events = [_make_event(t, name=f'Event {i}') for i in range(3)]
+        for e in events:
+            for pos, cid in ((2, 1), (1, 2)):
+                r = _make_event_result(e, competitor_id=cid, competitor_name=f'C{cid}')
+                r.final_position = pos
+        _db.session.flush()
+        _db.session.expire_all()
+
+        loaded = Event.query.filter_by(tournament_id=t.id).options(
+            selectinload(Event.results_by_position)).all()
+        statements, stop = self._count_selects()
+        try:
+            positions = [[r.final_position for r in e.get_results_sorted()] for e in loaded]
+        finally:
+            stop()
+        assert positions == [[1, 2]] * 3
+        assert statements == []
+
+    def test_results_sorted_without_preload_still_queries(self, db_session):
+        t = _make_tournament()
+        e = _make_event(t)
+        _make_event_result(e).final_position = 1
+        _db.session.flush()
+        assert [r.final_position for r in e.get_results_sorted()] == [1]
+
+    def test_team_is_joined_into_competitor_load(self, db_session):
+        from models.competitor import CollegeCompetitor
+        t = _make_tournament()
+        for code in ('UM-A', 'MSU-A'):
+            _make_college_competitor(t, _make_team(t, team_code=code), name=f'Cutter {code}')
+        _db.session.expire_all()
+
+        comps = CollegeCompetitor.query.filter_by(tournament_id=t.id).all()
+        statements, stop = self._count_selects()
+        try:
+            codes = sorted(c.team.team_code for c in comps)
+        finally:
+            stop()
+        assert codes == ['MSU-A', 'UM-A']
+        assert statements == []
+
+    def test_pro_import_text_is_deferred_as_a_group(self, db_session):
+        from models.competitor import ProCompetitor
+        t = _make_tournament()
+        p = _make_pro_competitor(t)
+        p.notes = 'Bringing own bucks'
+        p.waiver_signature = 'Jane Pro'
+        _db.session.flush()
+        _db.session.expire_all()
+
+        statements, stop = self._count_selects()
+        try:
+            loaded = ProCompetitor.query.filter_by(tournament_id=t.id).one()
+            listing = [s for s in statements if 'FROM pro_competitors' in s]
+            assert len(listing) == 1 and 'notes' not in listing[0]
+            del statements[:]
+            assert (loaded.notes, loaded.waiver_signature) == ('Bringing own bucks', 'Jane Pro')
+        finally:
+            stop()
+        assert len(statements) == 1
+
+
+class TestEventChildCounts:
+    """Event.result_counts / heat_counts replace per-event count() queries."""
+
+    def test_counts_grouped_by_event(self, db_session):
+        from models.event import Event
+        t = _make_tournament()
+        busy, empty = _make_event(t, name='Busy'), _make_event(t, name='Empty')
+        for cid in (1, 2, 3):
+            _make_event_result(busy, competitor_id=cid)
+        _make_heat(busy, heat_number=1)
+        _make_heat(busy, heat_number=1, run_number=2)
+
+        assert Event.result_counts([busy.id, empty.id]) == {busy.id: 3}
+        assert Event.heat_counts([busy.id, empty.id]) == {busy.id: 2}
+        assert Event.result_counts([]) == {}
+
+    def test_get_competitors_selects_only_names(self, db_session):
+        t = _make_tournament()
+        e = _make_event(t)
+        for cid in (1, 2):
+            _make_event_result(e, competitor_id=cid, competitor_name=f'Cutter {cid}')
+        _db.session.flush()
+        statements, stop = TestEagerLoads._count_selects()
+        try:
+            names = e.get_competitors()
+        finally:
+            stop()
+        assert sorted(names) == ['Cutter 1', 'Cutter 2']
+        assert 'final_position' not in statements[-1]
+
+
 # ===========================================================================
 # EventResult Tests
 # ===========================================================================
@@ -801,6 +1120,16 @@ class TestEventResultCalculateBestRun:
         result = r.calculate_best_run('lowest_wins')
         assert result == 10.0
 
+    def test_no_runs_leaves_stored_values_alone(self, db_session):
+        t = _make_tournament()
+        e = _make_event(t)
+        r = _make_event_result(e)
+        r.best_run = 11.0
+        r.result_value = 11.0
+        r.run1_value = r.run2_value = None
+        assert r.calculate_best_run('lowest_wins') == 11.0
+        assert r.result_value == 11.0
+
 
 class TestEventResultCalculateCumulativeScore:
     """calculate_cumulative_score sums run1+run2+run3."""
@@ -1074,6 +1403,82 @@ class TestHeatLocking:
         assert h.is_locked() is False
 
 
+class TestFlightCounts:
+    """heat_count / event_variety are SQL subqueries, not heat loads."""
+
+    @staticmethod
+    def _flight_with_heats(t):
+        from models.heat import Flight
+        f = Flight(tournament_id=t.id, flight_number=1)
+        _db.session.add(f)
+        _db.session.flush()
+        springboard = _make_event(t, 'Springboard')
+        underhand = _make_event(t, 'Underhand')
+        for n, event in enumerate((springboard, springboard, underhand), start=1):
+            _make_heat(event, heat_number=n).flight_id = f.id
+        _db.session.flush()
+        return f
+
+    def test_counts(self, db_session):
+        from models.heat import Flight
+        t = _make_tournament()
+        f = self._flight_with_heats(t)
+        empty = Flight(tournament_id=t.id, flight_number=2)
+        _db.session.add(empty)
+        _db.session.flush()
+        assert (f.heat_count, f.event_variety) == (3, 2)
+        assert (empty.heat_count, empty.event_variety) == (0, 0)
+
+    def test_undeferred_counts_ride_the_flight_select(self, db_session):
+        from sqlalchemy.orm import undefer_group
+
+        from models.heat import Flight
+        t = _make_tournament()
+        self._flight_with_heats(t)
+        tournament_id = t.id
+        _db.session.expire_all()
+
+        statements, stop = TestEagerLoads._count_selects()
+        try:
+            flights = Flight.query.filter_by(tournament_id=tournament_id).options(undefer_group('counts')).all()
+            assert [(f.heat_count, f.event_variety) for f in flights] == [(3, 2)]
+        finally:
+            stop()
+        assert len(statements) == 1
+
+
+class TestFlightOrderedHeats:
+    """Flight.ordered_heats batches get_heats_ordered across flights."""
+
+    def test_matches_get_heats_ordered_in_one_query(self, db_session):
+        from models.heat import Flight
+        t = _make_tournament()
+        e = _make_event(t)
+        flights = []
+        for number in (1, 2, 3):
+            f = Flight(tournament_id=t.id, flight_number=number)
+            _db.session.add(f)
+            flights.append(f)
+        _db.session.flush()
+        for n, (flight, position) in enumerate(
+                [(flights[0], 2), (flights[0], None), (flights[0], 1), (flights[1], 1)], start=1):
+            h = _make_heat(e, heat_number=n)
+            h.flight_id, h.flight_position = flight.id, position
+        _db.session.flush()
+
+        statements, stop = TestEagerLoads._count_selects()
+        try:
+            by_flight = Flight.ordered_heats(f.id for f in flights)
+        finally:
+            stop()
+        assert len([s for s in statements if 'FROM heats' in s]) == 1
+        assert {fid: [h.id for h in heats] for fid, heats in by_flight.items()} == {
+            f.id: [h.id for h in f.get_heats_ordered()] for f in flights
+        }
+        assert by_flight[flights[2].id] == []
+        assert Flight.ordered_heats([]) == {}
+
+
 # ===========================================================================
 # User Tests
 # ===========================================================================
@@ -1160,6 +1565,18 @@ class TestUserRoleProperties:
         assert _make_user('rp3', 'spectator').can_report is True
         assert _make_user('rp4', 'competitor').can_report is False
 
+    def test_unknown_role_has_no_permissions(self, db_session):
+        from models.user import User
+        u = User(username='future', role='timekeeper')
+        assert not any((u.is_judge, u.is_spectator, u.can_register, u.can_schedule,
+                        u.can_score, u.can_report, u.can_write))
+
+    def test_can_write_only_for_state_changing_roles(self, db_session):
+        writers = {role for role in ('admin', 'judge', 'scorer', 'registrar',
+                                     'competitor', 'spectator', 'viewer')
+                   if _make_user(f'w_{role}', role).can_write}
+        assert writers == {'admin', 'judge', 'scorer', 'registrar'}
+
     def test_is_active_default(self, db_session):
         u = _make_user('act1', 'admin')
         assert u.is_active is True
@@ -391,3 +391,24 @@ def test_woodboss_report_renders_with_wood_configs(auth_client, app):
     assert (
         "Yellow Pine" in body or "Poplar" in body
     ), "woodboss_report empty-body short-circuit — seeded WoodConfig not rendered"
+
+
+def test_college_dashboard_renders_leaders_without_contact_rows(auth_client, app):
+    from sqlalchemy import event as sa_event
+
+    d = app.config["_DASH"]
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa_event.listen(_db.engine, "before_cursor_execute", _record)
+    try:
+        r = auth_client.get(f"/tournament/{d['tid']}/college")
+    finally:
+        sa_event.remove(_db.engine, "before_cursor_execute", _record)
+    assert r.status_code == 200, r.data.decode()[:1500]
+    assert "College Man A" in r.data.decode()
+    # Bull/Belle cards print name and points; the identity spine holds
+    # contact details only and is not read for them.
+    assert not [s for s in statements if "FROM competitors" in s]
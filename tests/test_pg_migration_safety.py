@@ -377,6 +377,29 @@ class TestNoRenderAsInUpgrades:
             pytest.fail(msg)
 
 
+class TestConcurrentIndexBuildsLeaveTheTransaction:
+    """CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+
+    env.py runs every migration inside context.begin_transaction(), so a
+    migration that asks for postgresql_concurrently must step out of it with
+    op.get_context().autocommit_block(), or the deploy fails with "cannot run
+    inside a transaction block" on PostgreSQL while SQLite tests stay green.
+    """
+
+    def test_concurrently_is_paired_with_autocommit_block(self):
+        violations = []
+        for filepath in _migration_files():
+            source = filepath.read_text(encoding="utf-8")
+            if "postgresql_concurrently" in source and "autocommit_block" not in source:
+                violations.append(f"  {filepath.name}")
+
+        if violations:
+            pytest.fail(
+                "postgresql_concurrently used without autocommit_block():\n"
+                + "\n".join(violations)
+            )
+
+
 # ── Engine-level listener hygiene (D14-B phase 2, c44) ──────────────────────
 
 
@@ -434,7 +457,7 @@ class TestEngineConnectListenerHygiene:
         module is not sqlite3. If the guard consults anything other than the
         connection, this blows up or wrongly issues a PRAGMA.
         """
-        from app import _set_sqlite_pragma
+        from app import _SQLITE_PRAGMAS, _set_sqlite_pragma
 
         class _FakeCursor:
             executed = []
@@ -463,7 +486,8 @@ class TestEngineConnectListenerHygiene:
 
         _FakeSQLiteConnection.__module__ = 'sqlite3'
         _set_sqlite_pragma(_FakeSQLiteConnection(), None)
-        assert _FakeCursor.executed == ['PRAGMA foreign_keys=ON'], (
+        assert _FakeCursor.executed == list(_SQLITE_PRAGMAS)
+        assert _FakeCursor.executed[0] == 'PRAGMA foreign_keys=ON', (
             f'sqlite connections must still get FK enforcement; got '
             f'{_FakeCursor.executed}. Silently dropping this is worse than '
             f'the bug it replaced.'
@@ -0,0 +1,120 @@
+"""
+routes/import_routes.py confirm_pro_entries — writing a reviewed pro import.
+"""
+import json
+from contextlib import contextmanager
+
+from sqlalchemy import event as sa_event
+
+from database import db as _db
+from models import EventResult
+from routes import import_routes
+from tests.conftest import make_event, make_event_result, make_pro_competitor, make_tournament
+
+
+@contextmanager
+def record_statements(verb):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith(verb):
+            statements.append(statement)
+
+    sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+
+
+def _confirm(app, client, tournament_id, entries, tmp_path):
+    app.config['UPLOAD_FOLDER'] = str(tmp_path)
+    (tmp_path / 'entries.json').write_text(json.dumps(entries), encoding='utf-8')
+    with client.session_transaction() as sess:
+        sess[f'pro_import_{tournament_id}'] = 'entries.json'
+    return client.post(f'/import/{tournament_id}/pro-entries/confirm')
+
+
+def _entry(name, gender, email, events):
+    return {'name': name, 'gender': gender, 'email': email, 'events': events}
+
+
+class TestConfirmProEntries:
+
+    def test_result_rows_checked_without_a_query_per_event(self, app, db_session, make_admin_client, tmp_path):
+        client = make_admin_client('confirm_lookup_admin')
+        t = make_tournament(db_session)
+        names = ['Underhand', 'Standing Block', 'Hot Saw', 'Single Buck']
+        events = [make_event(db_session, t, name) for name in names]
+        existing = make_pro_competitor(db_session, t, 'Already Entered')
+        existing.email = 'already@example.com'
+        make_event_result(db_session, events[0], existing)
+
+        entries = [
+            _entry('Already Entered', 'M', 'already@example.com', names),
+            _entry('Brand New', 'F', 'new@example.com', names),
+            # Same person twice in one upload updates the row just written.
+            _entry('Brand New', 'F', 'new@example.com', names[:2]),
+        ]
+        with record_statements('SELECT') as statements:
+            resp = _confirm(app, client, t.id, entries, tmp_path)
+
+        assert resp.status_code == 302
+        result_selects = [s for s in statements if 'FROM event_results' in s]
+        assert len(result_selects) <= 2, result_selects
+
+        rows = (EventResult.query
+                .filter(EventResult.event_id.in_([e.id for e in events]))
+                .with_entities(EventResult.competitor_name, EventResult.event_id)
+                .all())
+        assert len(rows) == len(set(rows)) == 2 * len(names)
+
+    def test_new_rows_are_inserted_in_one_pass(self, app, db_session, make_admin_client, tmp_path):
+        client = make_admin_client('confirm_insert_admin')
+        t = make_tournament(db_session)
+        names = ['Underhand', 'Standing Block', 'Hot Saw']
+        events = [make_event(db_session, t, name) for name in names]
+
+        entries = [_entry(f'Pro {n}', 'M', f'pro{n}@example.com', names) for n in range(6)]
+        with record_statements('INSERT') as statements:
+            resp = _confirm(app, client, t.id, entries, tmp_path)
+
+        assert resp.status_code == 302
+        assert len([s for s in statements if 'INTO event_results' in s]) == 1
+        assert EventResult.query.filter(EventResult.event_id.in_([e.id for e in events])).count() == 6 * len(names)
+
+    def test_corrupt_staging_file_sends_back_to_upload(self, app, db_session, make_admin_client, tmp_path):
+        client = make_admin_client('confirm_corrupt_admin')
+        t = make_tournament(db_session)
+        app.config['UPLOAD_FOLDER'] = str(tmp_path)
+        (tmp_path / 'entries.json').write_bytes(b'[{"name": ')
+        with client.session_transaction() as sess:
+            sess[f'pro_import_{t.id}'] = 'entries.json'
+
+        resp = client.post(f'/import/{t.id}/pro-entries/confirm')
+
+        assert resp.status_code == 302
+        assert resp.headers['Location'].endswith(f'/import/{t.id}/pro-entries')
+        with client.session_transaction() as sess:
+            assert f'pro_import_{t.id}' not in sess
+
+    def test_entry_list_and_fees_key_configured_events_by_id(self, app, db_session, make_admin_client, tmp_path):
+        from models import ProCompetitor
+        client = make_admin_client('confirm_fees_admin')
+        t = make_tournament(db_session)
+        hot_saw = make_event(db_session, t, 'Hot Saw')
+
+        entry = _entry('Fee Payer', 'M', 'fees@example.com', ['Hot Saw', 'Obstacle Pole'])
+        entry['relay_lottery'] = True
+        resp = _confirm(app, client, t.id, [entry], tmp_path)
+
+        assert resp.status_code == 302
+        comp = ProCompetitor.query.filter_by(tournament_id=t.id, name='Fee Payer').one()
+        assert comp.get_events_entered() == [hot_saw.id, 'Obstacle Pole']
+        assert comp.get_entry_fees() == {
+            str(hot_saw.id): import_routes._EVENT_FEES['Hot Saw'],
+            'Obstacle Pole': import_routes._EVENT_FEES['Obstacle Pole'],
+            'relay': 5,
+        }
+        assert [r.event_id for r in EventResult.query.filter_by(competitor_id=comp.id,
+                                                                 competitor_type='pro')] == [hot_saw.id]
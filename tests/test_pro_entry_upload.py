@@ -0,0 +1,146 @@
+"""
+routes/import_routes.py upload_pro_entries — the workbook is parsed on a
+background job and the review page waits for it.
+"""
+import io
+import time
+
+import openpyxl
+
+from models.audit_log import AuditLog
+from routes import import_routes
+from tests.conftest import make_tournament
+
+_HEADERS = ['Timestamp', 'Email Address', 'Full Name', 'Gender', "Men's Underhand"]
+
+
+def _workbook(rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'Form Responses 1'
+    ws.append(_HEADERS)
+    for row in rows:
+        ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+    buf.seek(0)
+    return buf
+
+
+def _job(tournament_id, status, result=None):
+    return {'id': 'job', 'label': 'pro_import_parse', 'status': status, 'result': result,
+            'error': None, 'metadata': {'tournament_id': tournament_id, 'filename': 'f.xlsx'}}
+
+
+class TestUploadParseJob:
+
+    def test_upload_returns_before_parse_and_review_picks_it_up(
+            self, app, db_session, make_admin_client, tmp_path):
+        client = make_admin_client('upload_job_admin')
+        t = make_tournament(db_session)
+        # The job records its status from its own app context, on a second
+        # connection, which SQLite would block behind these pending writes.
+        db_session.commit()
+        app.config['UPLOAD_FOLDER'] = str(tmp_path)
+
+        resp = client.post(
+            f'/import/{t.id}/pro-entries',
+            data={'file': (_workbook([['2026-03-01 09:00:00', 'a@example.com',
+                                       'Alex Axe', 'Male', 'Yes']]), 'entries.xlsx')},
+            content_type='multipart/form-data',
+        )
+        assert resp.status_code == 302
+        assert resp.headers['Location'].endswith(f'/import/{t.id}/pro-entries/review')
+
+        staged = None
+        deadline = time.monotonic() + 10
+        while staged is None and time.monotonic() < deadline:
+            review = client.get(f'/import/{t.id}/pro-entries/review')
+            assert review.status_code in (200, 302)
+            with client.session_transaction() as sess:
+                staged = sess.get(f'pro_import_{t.id}')
+            if staged is None:
+                time.sleep(0.05)
+
+        assert staged is not None
+        page = client.get(f'/import/{t.id}/pro-entries/review')
+        assert page.status_code == 200
+        assert b'Alex Axe' in page.data
+        assert AuditLog.query.filter_by(action='pro_upload_parsed', entity_id=t.id).count() == 1
+
+    def test_review_waits_while_job_runs(self, app, db_session, make_admin_client, monkeypatch):
+        client = make_admin_client('upload_wait_admin')
+        t = make_tournament(db_session)
+        monkeypatch.setattr(import_routes, 'get_job', lambda job_id: _job(t.id, 'running'))
+        with client.session_transaction() as sess:
+            sess[f'pro_import_job_{t.id}'] = 'job'
+
+        resp = client.get(f'/import/{t.id}/pro-entries/review')
+
+        assert resp.status_code == 200
+        assert b'Reading the entry form export' in resp.data
+        with client.session_transaction() as sess:
+            assert sess.get(f'pro_import_job_{t.id}') == 'job'
+
+    def test_failed_job_sends_back_to_upload(self, app, db_session, make_admin_client, monkeypatch):
+        client = make_admin_client('upload_fail_admin')
+        t = make_tournament(db_session)
+        monkeypatch.setattr(import_routes, 'get_job', lambda job_id: _job(t.id, 'failed'))
+        with client.session_transaction() as sess:
+            sess[f'pro_import_job_{t.id}'] = 'job'
+
+        resp = client.get(f'/import/{t.id}/pro-entries/review')
+
+        assert resp.status_code == 302
+        assert resp.headers['Location'].endswith(f'/import/{t.id}/pro-entries')
+        with client.session_transaction() as sess:
+            assert f'pro_import_job_{t.id}' not in sess
+            assert f'pro_import_{t.id}' not in sess
+
+    def test_job_for_another_tournament_is_ignored(self, app, db_session, make_admin_client, monkeypatch):
+        client = make_admin_client('upload_other_admin')
+        t = make_tournament(db_session)
+        monkeypatch.setattr(import_routes, 'get_job',
+                            lambda job_id: _job(t.id + 1, 'completed', {'temp_name': 'x.json'}))
+        with client.session_transaction() as sess:
+            sess[f'pro_import_job_{t.id}'] = 'job'
+
+        resp = client.get(f'/import/{t.id}/pro-entries/review')
+
+        assert resp.status_code == 302
+        with client.session_transaction() as sess:
+            assert f'pro_import_{t.id}' not in sess
+
+
+class TestAllowedFilename:
+
+    def test_accepts_spreadsheet_extensions_in_any_case(self):
+        for name in ('entries.xlsx', 'ENTRIES.XLS', 'form.responses.Xlsx'):
+            assert import_routes._allowed(name), name
+
+    def test_rejects_other_or_missing_extensions(self):
+        for name in ('entries.csv', 'xlsx', 'entries.xlsx.exe', 'entries'):
+            assert not import_routes._allowed(name), name
+
+
+class TestParseJob:
+
+    def test_workbook_is_parsed_once(self, app, db_session, tmp_path, monkeypatch):
+        import services.pro_entry_importer as importer
+        t = make_tournament(db_session)
+        app.config['UPLOAD_FOLDER'] = str(tmp_path)
+        path = tmp_path / 'entries.xlsx'
+        path.write_bytes(_workbook([['2026-03-01 09:00:00', 'a@example.com',
+                                     'Alex Axe', 'Male', 'Yes']]).getvalue())
+        calls = []
+        real_parse = importer.parse_pro_entries
+
+        def _counting_parse(filepath):
+            calls.append(filepath)
+            return real_parse(filepath)
+
+        monkeypatch.setattr(importer, 'parse_pro_entries', _counting_parse)
+        result = import_routes._parse_upload_for_job(t.id, str(path))
+
+        assert result['entries'] == 1
+        assert calls == [str(path)]
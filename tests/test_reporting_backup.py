@@ -114,3 +114,57 @@ def test_restore_refuses_on_non_sqlite_engines(app, db_session, auth_client, mon
         'intentional, the gap filed in PROAM_2026_C44 is closed and this '
         'guard should be replaced with a real restore test.'
     )
+
+
+def _wal_db_with_unchecked_row(path):
+    """A WAL database whose only committed row still lives in the -wal file."""
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA wal_autocheckpoint=0')
+    conn.execute('CREATE TABLE scores (name TEXT)')
+    conn.execute("INSERT INTO scores VALUES ('Alex Axe')")
+    conn.commit()
+    return conn
+
+
+def test_snapshot_sqlite_includes_rows_still_in_the_wal(tmp_path):
+    import sqlite3
+
+    from services.backup import snapshot_sqlite
+
+    src = tmp_path / 'live.db'
+    writer = _wal_db_with_unchecked_row(str(src))
+    try:
+        dest = tmp_path / 'copy.db'
+        snapshot_sqlite(str(src), str(dest))
+    finally:
+        writer.close()
+
+    copy = sqlite3.connect(str(dest))
+    try:
+        assert copy.execute('SELECT name FROM scores').fetchall() == [('Alex Axe',)]
+        assert copy.execute('PRAGMA journal_mode').fetchone() == ('delete',)
+    finally:
+        copy.close()
+
+
+def test_backup_to_local_writes_a_snapshot(tmp_path):
+    import sqlite3
+
+    from services.backup import backup_to_local
+
+    src = tmp_path / 'live.db'
+    writer = _wal_db_with_unchecked_row(str(src))
+    try:
+        result = backup_to_local(str(src), str(tmp_path / 'backups'), 7)
+    finally:
+        writer.close()
+
+    assert result['ok'] is True
+    copy = sqlite3.connect(result['dest'])
+    try:
+        assert copy.execute('SELECT count(*) FROM scores').fetchone() == (1,)
+    finally:
+        copy.close()
@@ -542,3 +542,43 @@ class TestSpectatorReportingAccess:
         for url in _management_routes(tid)['validation']:
             r = spectator_client.get(url)
             assert r.status_code != 403, f'Spectator should NOT be 403 on {url}, got {r.status_code}'
+
+
+# ---------------------------------------------------------------------------
+# Precomputed endpoint policy table
+# ---------------------------------------------------------------------------
+
+class TestEndpointPolicyTable:
+    """The table built at app creation must agree with the live rule."""
+
+    def test_table_covers_every_registered_endpoint(self, app):
+        from app import _endpoint_permission
+        policy = app.extensions['endpoint_policy']
+        for endpoint in app.view_functions:
+            assert policy.get(endpoint, 'missing') == _endpoint_permission(endpoint)
+
+    def test_known_classifications(self):
+        from app import _endpoint_permission
+        assert _endpoint_permission('main.index') is None
+        assert _endpoint_permission('portal.spectator_dashboard') is None
+        assert _endpoint_permission('static') is None
+        assert _endpoint_permission('scoring.enter_heat_results') == 'can_score'
+        assert _endpoint_permission('reporting.fee_tracker') == 'can_report'
+
+
+
+class TestArapahoAccessMemo:
+    """The Arapaho access rule runs once per request, however many renders."""
+
+    def test_evaluated_once_per_request(self, app, monkeypatch):
+        import app as app_module
+        calls = []
+        monkeypatch.setattr(app_module, '_can_access_arapaho_mode',
+                            lambda endpoint: calls.append(endpoint) or False)
+        with app.test_request_context('/judge'):
+            for _ in range(3):
+                app_module._request_arapaho_allowed()
+        assert calls == ['main.judge_dashboard']
+        with app.test_request_context('/judge'):
+            app_module._request_arapaho_allowed()
+        assert len(calls) == 2
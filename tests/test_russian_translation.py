@@ -9,9 +9,29 @@ translated only the navbar labels and left every page body in English.
 
 import re
 
+import pytest
+
 import strings as text
 
 
+@pytest.fixture()
+def fresh_app():
+    import os
+
+    from database import db
+    from tests.db_test_utils import create_test_app
+
+    app, db_path = create_test_app()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+    try:
+        os.unlink(db_path)
+    except OSError:
+        pass
+
+
 class TestRussianPhraseMap:
     """strings.translate_html on its own."""
 
@@ -68,3 +88,230 @@ class TestRussianAfterRequestHook:
         assert (
             not re.search(r"[А-Яа-яЁё]", body) or "Русский" in body
         ), "English session leaked Cyrillic content unexpectedly."
+
+
+class TestTranslationCache:
+    """app._translate_cached memoizes translate_html by body digest."""
+
+    def setup_method(self):
+        import app as app_module
+        app_module._clear_translation_cache()
+
+    def test_repeat_body_skips_translator(self, monkeypatch):
+        import app as app_module
+        calls = []
+        real = text.translate_html
+
+        def _counting(body, lang=None):
+            calls.append(body)
+            return real(body, lang=lang)
+
+        monkeypatch.setattr(text, "translate_html", _counting)
+        html = "<p>Tournaments</p>"
+        first = app_module._translate_cached(html, "ru")
+        second = app_module._translate_cached(html, "ru")
+        assert first == second
+        assert "Турниры" in first
+        assert len(calls) == 1
+
+    def test_cache_keyed_by_language(self, monkeypatch):
+        import app as app_module
+        html = "<p>Save</p>"
+        ru = app_module._translate_cached(html, "ru")
+        arp = app_module._translate_cached(html, "arp")
+        assert ru == text.translate_html(html, lang="ru")
+        assert arp == text.translate_html(html, lang="arp")
+
+    def test_oversized_body_not_stored(self, monkeypatch):
+        import app as app_module
+        monkeypatch.setattr(app_module, "_TRANSLATION_CACHE_MAX_BODY_BYTES", 8)
+        app_module._translate_cached("<p>Tournaments</p>", "ru")
+        assert len(app_module._translation_cache) == 0
+
+    def test_total_size_bounded(self, monkeypatch):
+        import app as app_module
+        pages = [f"<p>Tournaments {n}{' ' * 40}</p>" for n in range(4)]
+        sizes = [len(text.translate_html(p, lang="ru")) for p in pages]
+        monkeypatch.setattr(app_module, "_TRANSLATION_CACHE_MAX_BYTES", sum(sizes[-2:]))
+        for page in pages:
+            app_module._translate_cached(page, "ru")
+        assert len(app_module._translation_cache) == 2
+        assert app_module._translation_cache_bytes == sum(sizes[-2:])
+
+    def test_pages_with_csrf_token_not_stored(self):
+        import app as app_module
+        html = '<meta name="csrf-token" content="abc.def"><p>Tournaments</p>'
+        assert "Турниры" in app_module._translate_cached(html, "ru")
+        assert len(app_module._translation_cache) == 0
+
+
+class TestLanguageContextCache:
+    """app._language_context builds the static template context once per key."""
+
+    def test_same_key_returns_same_mapping(self):
+        import app as app_module
+        first = app_module._language_context("ru", False)
+        assert app_module._language_context("ru", False) is first
+        assert first["NAV"] is text.section("NAV", "ru")
+        assert first["CURRENT_LANG"] == "ru"
+
+    def test_restricted_languages_only_when_allowed(self):
+        import app as app_module
+        assert "arp" not in app_module._language_context("en", False)["LANGUAGES"]
+        assert "arp" in app_module._language_context("en", True)["LANGUAGES"]
+
+
+class TestLanguageMemo:
+    """get_language() resolves the session once per request."""
+
+    def test_memo_is_per_request_and_follows_set_language(self):
+        from flask import Flask, session
+
+        app = Flask(__name__)
+        app.secret_key = "test"
+        with app.app_context():
+            with app.test_request_context():
+                session["lang"] = "ru"
+                assert text.get_language() == "ru"
+                session["lang"] = "en"  # memo wins within the request
+                assert text.get_language() == "ru"
+                assert text.set_language("en")
+                assert text.get_language() == "en"
+            # Same app context, new request: nothing carried over.
+            with app.test_request_context():
+                assert text.get_language() == text.DEFAULT_LANGUAGE
+
+
+class TestPhraseMatcher:
+    """strings._phrase_matcher: one compiled scan per language + glossary version."""
+
+    def test_longest_phrase_wins_at_a_position(self):
+        pattern, targets = text._phrase_matcher("arp")
+        assert text._apply_phrases("College Competition", (pattern, targets)) == \
+            text.ARAPAHO_VERIFIED_PHRASES["College Competition"]
+
+    def test_case_insensitive(self):
+        assert text.free_text("SAVE", lang="ru") == text.free_text("Save", lang="ru")
+
+    def test_matcher_reused_until_glossary_changes(self, monkeypatch):
+        first = text._phrase_matcher("ru")
+        assert text._phrase_matcher("ru") is first
+        monkeypatch.setattr(text, "phrase_map_version", lambda: -1)
+        rebuilt = text._phrase_matcher("ru")
+        assert rebuilt is not first
+        assert [k for k in text._PHRASE_MATCHERS if k[0] == "ru"] == [("ru", -1)]
+
+    def test_page_without_phrases_is_returned_as_is(self, monkeypatch):
+        html = '<div class="x">12345</div>'
+        assert not text.contains_phrase(html, "ru")
+        monkeypatch.setattr(text, "_translate_tagged", lambda *a: pytest.fail("split ran"))
+        assert text.translate_html(html, lang="ru") is html
+
+    def test_attribute_hit_is_only_a_false_positive(self):
+        html = '<input title="Save" value="1">'
+        assert text.contains_phrase(html, "ru")
+        assert text.translate_html(html, lang="ru") == html
+
+
+class TestPhraseMapVersion:
+    """strings.phrase_map_version: glossary stat throttled, not per call."""
+
+    class _Glossary:
+        def __init__(self):
+            self.stats = 0
+            self.mtime_ns = 1
+
+        def stat(self):
+            self.stats += 1
+            return type("st", (), {"st_mtime_ns": self.mtime_ns})()
+
+    def test_stat_at_most_once_per_interval(self, monkeypatch):
+        glossary = self._Glossary()
+        clock = [100.0]
+        monkeypatch.setattr(text, "_GLOSSARY_FILE", glossary)
+        monkeypatch.setattr(text, "_glossary_version", [float("-inf"), 0])
+        monkeypatch.setattr(text.time, "monotonic", lambda: clock[0])
+
+        assert text.phrase_map_version() == 1
+        glossary.mtime_ns = 2
+        for _ in range(50):
+            assert text.phrase_map_version() == 1
+        assert glossary.stats == 1
+
+        clock[0] += text._GLOSSARY_STAT_INTERVAL
+        assert text.phrase_map_version() == 2
+        assert glossary.stats == 2
+
+
+class TestStreamedTranslation:
+    """Streamed HTML is translated piece by piece, never materialized."""
+
+    def test_iter_translate_matches_whole_page(self):
+        html = "<style>.Save{}</style><script>var Save=1;</script><p>Save</p><p>Cancel</p>"
+        whole = text.translate_html(html, lang="ru")
+        for size in (1, 3, 16):
+            pieces = [html[i:i + size] for i in range(0, len(html), size)]
+            assert "".join(text.iter_translate_html(pieces, "ru")) == whole
+
+    def test_english_pieces_are_tag_aligned(self):
+        pieces = ["<scr", "ipt>x</scr", "ipt><p>Save</p>"]
+        out = list(text.iter_translate_html(pieces, "en"))
+        assert "".join(out) == "".join(pieces)
+        assert all(p.endswith(">") for p in out)
+
+    def test_streamed_route_translated_and_nonced(self, fresh_app):
+        from flask import Response, stream_with_context
+
+        app = fresh_app
+
+        def _streamed_page():
+            def _gen():
+                yield "<html><body><script>var a"
+                yield " = 1;</script><p>Sa"
+                yield "ve</p></body></html>"
+            return Response(stream_with_context(_gen()), mimetype="text/html")
+
+        app.add_url_rule("/_streamed_page_test", "_streamed_page_test", _streamed_page)
+        client = app.test_client()
+        client.get("/language/ru")
+        resp = client.get("/_streamed_page_test")
+        assert resp.is_streamed
+        body = resp.get_data(as_text=True)
+        assert "<p>Сохранить</p>" in body
+        assert re.search(r'<script nonce="[^"]+">var a = 1;</script>', body)
+
+
+class TestConditionalGet:
+    """Unchanged pages answer If-None-Match with 304 before any translation."""
+
+    @staticmethod
+    def _client(app):
+        app.add_url_rule("/_etag_page_test", "_etag_page_test",
+                         lambda: "<html><body><script>var a;</script><p>Save</p></body></html>")
+        return app.test_client()
+
+    def test_repeat_get_is_not_modified(self, fresh_app, monkeypatch):
+        import app as app_module
+
+        client = self._client(fresh_app)
+        client.get("/language/ru")
+        first = client.get("/_etag_page_test")
+        etag = first.headers["ETag"]
+        assert "<p>Сохранить</p>" in first.get_data(as_text=True)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("translated a page the client already has")
+
+        monkeypatch.setattr(app_module, "_translate_cached", _fail)
+        again = client.get("/_etag_page_test", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.get_data() == b""
+        assert "Content-Security-Policy" not in again.headers
+
+    def test_etag_depends_on_language(self, fresh_app):
+        client = self._client(fresh_app)
+        english = client.get("/_etag_page_test").headers["ETag"]
+        client.get("/language/ru")
+        russian = client.get("/_etag_page_test", headers={"If-None-Match": english})
+        assert russian.status_code == 200
+        assert russian.headers["ETag"] != english
@@ -16,10 +16,22 @@ Design notes:
     (sms_notify depends only on env vars and the twilio package).
 """
 import os
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+
+def _make_sqlite_db(path):
+    """Write a small real SQLite database at *path* (backups use the backup API)."""
+    conn = sqlite3.connect(str(path))
+    try:
+        conn.execute('CREATE TABLE t (x INTEGER)')
+        conn.execute('INSERT INTO t VALUES (1)')
+        conn.commit()
+    finally:
+        conn.close()
+
 # =====================================================================
 # SMS Notify Tests
 # =====================================================================
@@ -325,11 +337,10 @@ class TestBackupToLocal:
     """Test backup.backup_to_local() with real filesystem via tmp_path."""
 
     def test_creates_backup_file(self, tmp_path):
-        """backup_to_local() copies the source DB to dest_dir."""
+        """backup_to_local() snapshots the source DB into dest_dir."""
         from services.backup import backup_to_local
-        # Create a fake source DB
         src = tmp_path / 'source.db'
-        src.write_bytes(b'SQLite format 3' + b'\x00' * 100)
+        _make_sqlite_db(src)
 
         dest_dir = tmp_path / 'backups'
         result = backup_to_local(str(src), str(dest_dir), tournament_id=1)
@@ -343,7 +354,7 @@ class TestBackupToLocal:
         """backup_to_local() returns dict with ok, dest, size_bytes, error."""
         from services.backup import backup_to_local
         src = tmp_path / 'source.db'
-        src.write_bytes(b'test data')
+        _make_sqlite_db(src)
 
         dest_dir = tmp_path / 'backups'
         result = backup_to_local(str(src), str(dest_dir), tournament_id=42)
@@ -356,7 +367,7 @@ class TestBackupToLocal:
         """backup_to_local() creates the destination directory if it does not exist."""
         from services.backup import backup_to_local
         src = tmp_path / 'source.db'
-        src.write_bytes(b'test')
+        _make_sqlite_db(src)
 
         nested_dir = tmp_path / 'a' / 'b' / 'c'
         assert not nested_dir.exists()
@@ -376,6 +387,28 @@ class TestBackupToLocal:
         assert result['ok'] is False
         assert result['error'] is not None
 
+    def test_copy_includes_rows_still_in_wal(self, tmp_path):
+        """backup_to_local() snapshots via the backup API so WAL-only commits are copied."""
+        from services.backup import backup_to_local
+        src = tmp_path / 'source.db'
+        live = sqlite3.connect(str(src))
+        live.execute('PRAGMA journal_mode=WAL')
+        live.execute('PRAGMA wal_autocheckpoint=0')
+        live.execute('CREATE TABLE scores (v INTEGER)')
+        live.execute('INSERT INTO scores VALUES (42)')
+        live.commit()
+        try:
+            result = backup_to_local(str(src), str(tmp_path / 'backups'), tournament_id=1)
+        finally:
+            live.close()
+
+        assert result['ok'] is True
+        copy = sqlite3.connect(result['dest'])
+        try:
+            assert copy.execute('SELECT v FROM scores').fetchall() == [(42,)]
+        finally:
+            copy.close()
+
 
 class TestBackupToS3:
     """Test backup.backup_to_s3() with mocked boto3."""
@@ -392,9 +425,8 @@ class TestBackupToS3:
         """backup_to_s3() calls s3.upload_file() when configured."""
         from services.backup import backup_to_s3
 
-        # Create a fake source DB
         src = tmp_path / 'source.db'
-        src.write_bytes(b'SQLite format 3' + b'\x00' * 100)
+        _make_sqlite_db(src)
 
         mock_s3_client = MagicMock()
         mock_session = MagicMock()
@@ -426,7 +458,7 @@ class TestBackupToS3:
         from services.backup import backup_to_s3
 
         src = tmp_path / 'source.db'
-        src.write_bytes(b'test')
+        _make_sqlite_db(src)
 
         mock_s3_client = MagicMock()
         mock_s3_client.upload_file.side_effect = Exception('Access Denied')
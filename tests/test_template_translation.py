@@ -0,0 +1,154 @@
+"""
+Render-time translation (services/template_translation.py).
+
+The extension must translate exactly what the post-render pass in app.py
+translates: text nodes yes, attribute values and script/style bodies no.
+The strongest check is equivalence — the same page rendered both ways must
+come out identical.
+"""
+import os
+import re
+
+import pytest
+from flask import Flask, render_template_string, session
+
+import strings as text
+from database import db as _db
+from services.template_translation import (
+    TemplateTranslationExtension,
+    _MarkupState,
+    split_segment,
+)
+
+# Per-request values that legitimately differ between two renders.
+_NONCE_RE = re.compile(r' nonce="[^"]*"')
+_CSRF_META_RE = re.compile(r'(<meta name="csrf-token" content=")[^"]*')
+
+
+def _render(template, lang, **ctx):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.jinja_env.add_extension(TemplateTranslationExtension)
+    with app.test_request_context():
+        session['lang'] = lang
+        return render_template_string(template, **ctx)
+
+
+class TestSplitSegment:
+
+    def test_plain_text_is_translatable(self):
+        assert split_segment('<p>Save</p>', _MarkupState()) == [(True, '<p>Save</p>')]
+
+    def test_segment_ending_inside_tag_keeps_tag_raw(self):
+        state = _MarkupState()
+        pieces = split_segment('<p>Save</p><input title="Save" value="', state)
+        assert pieces == [(True, '<p>Save</p>'), (False, '<input title="Save" value="')]
+        assert state.open_tag == 'input'
+        assert not state.translatable
+
+    def test_tag_closed_by_next_segment(self):
+        state = _MarkupState()
+        state.open_tag = 'a'
+        pieces = split_segment('" class="btn">Save</a>', state)
+        assert pieces == [(False, '" class="btn">'), (True, 'Save</a>')]
+        assert state.translatable
+
+    def test_script_body_is_raw(self):
+        state = _MarkupState()
+        pieces = split_segment('<p>Save</p><script>var Save = 1;</script><p>Save</p>', state)
+        assert pieces == [
+            (True, '<p>Save</p>'),
+            (False, '<script>'),
+            (False, 'var Save = 1;'),
+            (False, '</script>'),
+            (True, '<p>Save</p>'),
+        ]
+
+    def test_script_body_spanning_segments(self):
+        state = _MarkupState()
+        split_segment('<script>var x = "', state)
+        assert state.raw_until == '</script'
+        pieces = split_segment('";</script><p>Save</p>', state)
+        assert pieces == [(False, '";'), (False, '</script>'), (True, '<p>Save</p>')]
+
+
+class TestExtensionRendering:
+
+    TEMPLATE = (
+        '<html><head><style>.Save{}</style>'
+        '<script>var Save = "{{ v }}";</script></head>'
+        '<body><p>Save</p><input value="{{ v }}" title="Save">'
+        '<a href="/x" class="{{ cls }}">Cancel</a>'
+        '<div>{{ v }}</div>{% if show %}<span>Tournaments</span>{% endif %}'
+        '</body></html>'
+    )
+
+    def test_matches_post_render_pass(self):
+        ctx = {'v': 'Save', 'cls': 'Save', 'show': True}
+        english = _render(self.TEMPLATE, 'en', **ctx)
+        assert _render(self.TEMPLATE, 'ru', **ctx) == text.translate_html(english, lang='ru')
+
+    def test_attributes_and_scripts_untouched(self):
+        out = _render(self.TEMPLATE, 'ru', v='Save', cls='Save', show=True)
+        assert 'value="Save"' in out
+        assert 'title="Save"' in out
+        assert 'var Save = "Save"' in out
+        assert '<div>Сохранить</div>' in out
+
+    def test_english_renders_unchanged(self):
+        app = Flask(__name__)
+        app.secret_key = 'test'
+        with app.test_request_context():
+            plain = render_template_string(self.TEMPLATE, v='<b>', cls='x', show=False)
+        assert _render(self.TEMPLATE, 'en', v='<b>', cls='x', show=False) == plain
+
+    def test_values_still_escaped_when_translated(self):
+        out = _render('<p>{{ v }}</p>', 'ru', v='<b>Save</b>')
+        assert '<b>' not in out
+        assert '&lt;b&gt;' in out
+
+
+class TestTranslateAtRenderApp:
+    """Whole-app round trip with TRANSLATE_AT_RENDER on and off."""
+
+    @pytest.fixture()
+    def make_app(self, monkeypatch):
+        import config
+        from tests.db_test_utils import create_test_app
+
+        created = []
+
+        def _make(enabled):
+            monkeypatch.setattr(config.BaseConfig, 'TRANSLATE_AT_RENDER', enabled)
+            app, db_path = create_test_app()
+            created.append((app, db_path))
+            return app
+
+        yield _make
+        for app, db_path in created:
+            with app.app_context():
+                _db.session.remove()
+                _db.engine.dispose()
+            try:
+                os.unlink(db_path)
+            except OSError:
+                pass
+
+    def _russian_index(self, app):
+        client = app.test_client()
+        client.get('/language/ru')
+        resp = client.get('/')
+        assert resp.status_code == 200
+        body = _NONCE_RE.sub('', resp.get_data(as_text=True))
+        return _CSRF_META_RE.sub(r'\1', body)
+
+    def test_index_identical_both_ways(self, make_app):
+        post_render = self._russian_index(make_app(False))
+        at_render = self._russian_index(make_app(True))
+        assert re.search(r'[А-Яа-яЁё]', at_render)
+        assert at_render == post_render
+
+    def test_every_template_compiles(self, make_app):
+        app = make_app(True)
+        for name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(name)
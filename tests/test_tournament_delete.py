@@ -0,0 +1,56 @@
+"""
+routes/main.py delete_tournament — removing a tournament and what hangs off it.
+"""
+from sqlalchemy import event as sa_event
+
+from database import db as _db
+from models import Flight, Heat, HeatAssignment, Tournament
+from tests.conftest import make_event, make_flight, make_heat, make_pro_competitor, make_tournament
+
+
+def _seed(db_session, name):
+    t = make_tournament(db_session, name=name)
+    a = make_pro_competitor(db_session, t, f'{name} A')
+    b = make_pro_competitor(db_session, t, f'{name} B')
+    flight = make_flight(db_session, t)
+    event = make_event(db_session, t, 'Hot Saw')
+    heat = make_heat(db_session, event, competitors=[a.id, b.id], flight_id=flight.id)
+    return t, flight, heat
+
+
+class TestDeleteTournament:
+
+    def test_clears_heats_flights_and_assignments_without_id_round_trips(self, app, db_session, make_admin_client):
+        client = make_admin_client('delete_tournament_admin')
+        doomed, doomed_flight, doomed_heat = _seed(db_session, 'Doomed')
+        kept, kept_flight, kept_heat = _seed(db_session, 'Kept')
+        doomed_id, flight_id, heat_id = doomed.id, doomed_flight.id, doomed_heat.id
+        kept_id, kept_flight_id, kept_heat_id = kept.id, kept_flight.id, kept_heat.id
+
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(' '.join(statement.split()))
+
+        sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+        try:
+            resp = client.post(f'/tournament/{doomed_id}/delete', data={'confirm_delete': 'DELETE'})
+        finally:
+            sa_event.remove(_db.engine, 'before_cursor_execute', _record)
+
+        assert resp.status_code == 302
+        _db.session.expire_all()
+        assert _db.session.get(Tournament, doomed_id) is None
+        assert _db.session.get(Flight, flight_id) is None
+        assert _db.session.get(Heat, heat_id) is None
+        assert HeatAssignment.query.filter_by(heat_id=heat_id).count() == 0
+
+        assert _db.session.get(Tournament, kept_id) is not None
+        assert _db.session.get(Heat, kept_heat_id).flight_id == kept_flight_id
+        assert HeatAssignment.query.filter_by(heat_id=kept_heat_id).count() == 2
+
+        # The heat and flight id sets are resolved inside the DELETE/UPDATE
+        # statements, not selected into Python first.
+        assert not [s for s in statements
+                    if s.startswith(('SELECT heats.id AS heats_id FROM',
+                                     'SELECT flights.id AS flights_id FROM'))]
@@ -0,0 +1,116 @@
+"""
+services/user_cache.py — the snapshot cache behind Flask-Login's user loader.
+
+The loader must stop issuing a SELECT per request, but a role change or a
+deactivation has to land on the very next request.
+"""
+import pytest
+from sqlalchemy import event as sa_event
+
+from database import db as _db
+from models.user import User
+
+
+@pytest.fixture()
+def users(app):
+    cache = app.extensions['user_cache']
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture()
+def count_user_selects(app):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith('SELECT') and 'FROM users' in statement:
+            statements.append(statement)
+
+    engine = _db.engine
+    sa_event.listen(engine, 'before_cursor_execute', _record)
+    yield statements
+    sa_event.remove(engine, 'before_cursor_execute', _record)
+
+
+class TestUserCache:
+
+    def test_second_load_skips_select(self, users, judge_user, count_user_selects):
+        _db.session.expunge(judge_user)
+        first = users.load(judge_user.id)
+        assert first.username == 'test_judge'
+        _db.session.expunge(first)
+        selects_after_first = len(count_user_selects)
+        second = users.load(judge_user.id)
+        assert len(count_user_selects) == selects_after_first
+        assert second.role == 'judge'
+        assert second in _db.session
+
+    def test_update_invalidates(self, users, judge_user):
+        users.load(judge_user.id)
+        judge_user.role = User.ROLE_SPECTATOR
+        _db.session.flush()
+        _db.session.expunge(judge_user)
+        assert users.load(judge_user.id).role == User.ROLE_SPECTATOR
+
+    def test_zero_ttl_disables(self, users, judge_user, monkeypatch, count_user_selects):
+        monkeypatch.setattr(users, 'ttl_seconds', 0)
+        _db.session.expunge(judge_user)
+        users.load(judge_user.id)
+        _db.session.expunge_all()
+        before = len(count_user_selects)
+        users.load(judge_user.id)
+        assert len(count_user_selects) == before + 1
+
+    def test_role_change_applies_on_next_request(self, app, users, admin_user):
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(admin_user.id)
+        assert client.get('/judge').status_code == 200
+        admin_user.role = User.ROLE_SPECTATOR
+        _db.session.flush()
+        assert client.get('/judge').status_code == 403
+
+    def test_signed_in_requests_never_rehash_the_password(self, app, users, admin_user, monkeypatch):
+        import models.user
+
+        def _fail(*args, **kwargs):
+            raise AssertionError('password hash verified outside login')
+
+        monkeypatch.setattr(models.user, 'check_password_hash', _fail)
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(admin_user.id)
+        for _ in range(3):
+            assert client.get('/judge').status_code == 200
+
+
+class TestCommitInvalidation:
+    """The flush-time drop is repeated after commit, closing the window in
+    which another request re-caches the old committed row."""
+
+    def test_commit_drops_entry_recached_after_flush(self, users, db_session):
+        import time
+
+        user = User(username='cache_commit_user', role='judge')
+        user.set_password('testpass')
+        db_session.add(user)
+        db_session.commit()
+        users.load(user.id)
+        stale = users._entries[user.id][1]
+
+        user.role = User.ROLE_SPECTATOR
+        db_session.flush()
+        assert user.id not in users._entries
+        # A concurrent request reads the committed (old) row before our commit.
+        users._entries[user.id] = (time.monotonic() + 60, stale)
+
+        db_session.commit()
+        assert user.id not in users._entries
+
+    def test_rollback_forgets_flushed_ids(self, users, judge_user):
+        judge_user.role = User.ROLE_SPECTATOR
+        _db.session.flush()
+        assert judge_user.id in _db.session.info['user_cache_changed_ids']
+        _db.session.rollback()
+        assert 'user_cache_changed_ids' not in _db.session.info
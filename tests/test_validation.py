@@ -247,6 +247,18 @@ class TestCollegeCompetitorValidator:
         codes = [w.code for w in result.warnings]
         assert 'NO_EVENTS' in codes
 
+    def test_too_many_closed_events_error(self):
+        import config
+        closed = [e['name'] for e in config.COLLEGE_CLOSED_EVENTS]
+        limit = CollegeCompetitorValidator.MAX_CLOSED_EVENTS
+        comp = _college_comp(events=(closed * 2)[:limit + 1] + [7])
+        codes = [e.code for e in CollegeCompetitorValidator.validate(comp).errors]
+        assert 'TOO_MANY_CLOSED_EVENTS' in codes
+
+        comp = _college_comp(events=(closed * 2)[:limit] + [7])
+        codes = [e.code for e in CollegeCompetitorValidator.validate(comp).errors]
+        assert 'TOO_MANY_CLOSED_EVENTS' not in codes
+
 
 # ---------------------------------------------------------------------------
 # ProCompetitorValidator